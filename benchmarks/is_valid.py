@@ -0,0 +1,127 @@
+# coding=utf8
+"""Is Valid Benchmark
+
+Compares the memory allocated, and the time taken, by valid and is_valid on \
+valid and invalid values
+
+Run with: python -m benchmarks.is_valid
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Python imports
+import timeit
+import tracemalloc
+
+# Local imports
+import define
+
+# The definition used for every check
+TREE = define.Tree({
+	'__name__': 'order',
+	'id': { '__type__': 'uuid' },
+	'customer': {
+		'name': { '__type__': 'string', '__maximum__': 64 },
+		'email': { '__type__': 'string', '__regex__': '^[^@]+@[^@]+$' }
+	},
+	'items': {
+		'__array__': 'unique',
+		'__type__': {
+			'sku': { '__type__': 'string' },
+			'quantity': { '__type__': 'uint', '__minimum__': 1 },
+			'price': { '__type__': 'price' }
+		}
+	},
+	'tags': { '__hash__': 'string', '__type__': 'string' }
+})
+
+# A valid value
+VALID = {
+	'id': '52cd4b20-ca32-4433-9516-0c8684ec57c2',
+	'customer': { 'name': 'Chris', 'email': 'chris@example.com' },
+	'items': [
+		{ 'sku': 'sku-%d' % i, 'quantity': 1 + i, 'price': '9.99' }
+		for i in range(100)
+	],
+	'tags': { 'source': 'web', 'campaign': 'fall' }
+}
+
+# An invalid value, with a failure in every item
+INVALID = {
+	'id': 'not a uuid',
+	'customer': { 'name': 'Chris', 'email': 'chris' },
+	'items': [
+		{ 'sku': i, 'quantity': 0, 'price': 'free' } for i in range(100)
+	],
+	'tags': { 'source': 1 }
+}
+
+def allocated(f: callable) -> tuple[int, int]:
+	"""Allocated
+
+	Calls the function once and returns the number of memory blocks still \
+	held after the call, and the peak number of bytes allocated during it
+
+	Arguments:
+		f (callable): The function to call
+
+	Returns:
+		tuple[int, int]
+	"""
+
+	# Call once first so nothing lazy is counted
+	f()
+
+	# Track the allocations of one call
+	tracemalloc.start()
+	oBefore = tracemalloc.take_snapshot()
+	tracemalloc.reset_peak()
+	iBase = tracemalloc.get_traced_memory()[0]
+	f()
+	iPeak = tracemalloc.get_traced_memory()[1] - iBase
+	oAfter = tracemalloc.take_snapshot()
+	tracemalloc.stop()
+
+	# Count the blocks added by the call, ignoring tracemalloc's own
+	iBlocks = sum([
+		o.count_diff for o in oAfter.compare_to(oBefore, 'lineno')
+		if 'tracemalloc' not in o.traceback[0].filename
+	])
+
+	# Return the counts
+	return iBlocks, iPeak
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Compile the tree as well
+	oCompiled = TREE.compile()
+
+	# Go through each version and value
+	print('%-12s %-8s %-9s %8s %10s %10s' % (
+		'definition', 'value', 'method', 'blocks', 'peak bytes', 'usec/call'
+	))
+	for sName, o in [ ('interpreted', TREE), ('compiled', oCompiled) ]:
+		for sValue, dValue in [ ('valid', VALID), ('invalid', INVALID) ]:
+			for sMethod in [ 'valid', 'is_valid' ]:
+				f = getattr(o, sMethod)
+				iBlocks, iPeak = allocated(lambda: f(dValue))
+				fTime = min(timeit.repeat(
+					lambda: f(dValue), number = 200, repeat = 5
+				)) / 200 * 1000000
+				print('%-12s %-8s %-9s %8d %10d %10.1f' % (
+					sName, sValue, sMethod, iBlocks, iPeak, fTime
+				))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,110 @@
+# coding=utf8
+"""Memory Benchmark
+
+Measures the bytes kept by each kind of instance once created, and by a large \
+Tree per instance in it
+
+Run with: python -m benchmarks.memory
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Python imports
+import copy
+import gc
+import tracemalloc
+
+# Local imports
+import define
+from benchmarks.snapshot import definition
+
+# The number of instances created of each kind
+COUNT = 10000
+
+# The definition of each kind of instance
+KINDS = [
+	( 'Node', { '__type__': 'uuid' } ),
+	( 'Node (min/max)', { '__type__': 'uint', '__maximum__': 255 } ),
+	( 'Node (special)', { '__type__': 'string', '__ui__': { 'title': 'A' } } ),
+	( 'Parent (1 node)', { 'a': { '__type__': 'int' } } ),
+	( 'Array (1 node)', { '__array__': 'unique', '__type__': 'int' } ),
+	( 'Hash (2 nodes)', { '__hash__': 'string', '__type__': 'int' } ),
+	( 'Options (2 nodes)', [ { '__type__': 'int' }, { '__type__': 'md5' } ] )
+]
+
+def count(instance: define.Base) -> int:
+	"""Count
+
+	Returns the number of instances in an instance, including itself
+
+	Arguments:
+		instance (Base): The instance to count
+
+	Returns:
+		uint
+	"""
+	if isinstance(instance, define.Parent):
+		return 1 + sum([count(o) for o in instance.nodes.values()])
+	if isinstance(instance, define.Hash):
+		return 1 + count(instance.key()) + count(instance.child())
+	if isinstance(instance, define.Array):
+		return 1 + count(instance.child())
+	if isinstance(instance, define.Options):
+		return 1 + sum([count(o) for o in instance])
+	return 1
+
+def measure(create: callable, number: int) -> tuple[int, list]:
+	"""Measure
+
+	Returns the bytes kept by the instances created by calling create number \
+	times, along with the instances
+
+	Arguments:
+		create (callable): Called without arguments to create an instance
+		number (uint): The number of instances to create
+
+	Returns:
+		tuple[int, list]
+	"""
+	gc.collect()
+	tracemalloc.start()
+	lInstances = [ create() for _ in range(number) ]
+	gc.collect()
+	iBytes = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	return iBytes, lInstances
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Print the header
+	print('%-20s %12s %14s' % ('instance', 'bytes', 'bytes/instance'))
+
+	# Go through each kind of instance
+	for sName, mDetails in KINDS:
+		iBytes, l = measure(
+			lambda: define.Base.create(copy.deepcopy(mDetails), 'f'), COUNT
+		)
+		print('%-20s %12d %14.1f' % (sName, iBytes // COUNT, iBytes / (
+			COUNT * count(l[0])
+		)))
+
+	# Measure a large Tree
+	dTree = definition(1000)
+	iBytes, l = measure(lambda: define.Tree(dTree), 1)
+	print('%-20s %12d %14.1f' % (
+		'Tree (1000 fields)', iBytes, iBytes / count(l[0])
+	))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
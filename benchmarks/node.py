@@ -0,0 +1,92 @@
+# coding=utf8
+"""Node Benchmark
+
+Measures the time taken by Nodes of each type to check, and to clean, a \
+valid value
+
+Run with: python -m benchmarks.node
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Python imports
+import timeit
+
+# Local imports
+import define
+
+# The definition, and a valid value, of each type
+TYPES = [
+	( 'any', 'any', { 'a': 1 } ),
+	( 'base64', 'base64', 'SGVsbG8sIHRoaXMgaXMgYSB0ZXN0IQ==' ),
+	( 'bool', 'bool', 'true' ),
+	( 'date', 'date', '2016-03-05' ),
+	( 'datetime', 'datetime', '2016-03-05 12:34:56' ),
+	( 'decimal', 'decimal', '1.23' ),
+	( 'float', 'float', 1.5 ),
+	( 'int', 'int', 1234 ),
+	( 'ip', 'ip', '192.168.0.1' ),
+	( 'json', 'json', '{"a":1}' ),
+	( 'md5', 'md5', '7b967af699a0a18b1f2bdc9704537a3e' ),
+	( 'price', 'price', '9.99' ),
+	( 'string', 'string', 'hello' ),
+	( 'time', 'time', '12:34:56' ),
+	( 'timestamp', 'timestamp', 1700000000 ),
+	( 'tuuid', 'tuuid', '52cd4b20ca32443395160c8684ec57c2' ),
+	( 'tuuid4', 'tuuid4', '52cd4b20ca32443395160c8684ec57c2' ),
+	( 'uint', 'uint', 1234 ),
+	( 'uuid', 'uuid', '52cd4b20-ca32-4433-9516-0c8684ec57c2' ),
+	( 'uuid4', 'uuid4', '52cd4b20-ca32-4433-9516-0c8684ec57c2' ),
+	( 'uint (min/max)', {
+		'__type__': 'uint', '__minimum__': 1, '__maximum__': 9999
+	}, 1234 ),
+	( 'string (options)', {
+		'__type__': 'string', '__options__': [ 'hello', 'world' ]
+	}, 'hello' ),
+	( 'string (max)', {
+		'__type__': 'string', '__maximum__': 32
+	}, 'hello' )
+]
+
+def best(f: callable) -> float:
+	"""Best
+
+	Returns the fastest time, in nanoseconds, it took to call the function \
+	once out of 7 runs of 20000 calls
+
+	Arguments:
+		f (callable): The function to call
+
+	Returns:
+		float
+	"""
+	return min(timeit.repeat(f, number = 20000, repeat = 7)) / 20000 * \
+		1000000000
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Print the header
+	print('%-18s %10s %10s' % ('type', 'valid ns', 'clean ns'))
+
+	# Go through each type
+	for sName, mDetails, mValue in TYPES:
+		oNode = define.Node(mDetails)
+		print('%-18s %10.1f %10.1f' % (
+			sName,
+			best(lambda: oNode.is_valid(mValue)),
+			best(lambda: oNode.clean(mValue))
+		))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,77 @@
+# coding=utf8
+"""Options Benchmark
+
+Measures the time taken to create Nodes with __options__ lists of different \
+sizes, and to validate values against them
+
+Run with: python -m benchmarks.options
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Python imports
+import timeit
+
+# Local imports
+import define
+
+# The number of options in each Node
+SIZES = [ 10, 1000, 100000 ]
+
+def best(f: callable, number: int) -> float:
+	"""Best
+
+	Returns the fastest time, in microseconds, it took to call the function \
+	once out of 5 runs of number calls
+
+	Arguments:
+		f (callable): The function to call
+		number (uint): The number of calls in each run
+
+	Returns:
+		float
+	"""
+	return min(timeit.repeat(f, number = number, repeat = 5)) / number * \
+		1000000
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Print the header
+	print('%8s %12s %10s %10s %10s %10s' % (
+		'options', 'create usec', 'first', 'last', 'missing', 'compiled'
+	))
+
+	# Go through each size
+	for iSize in SIZES:
+
+		# Generate the options, and create the Node
+		lOptions = [ 'code%d' % i for i in range(iSize) ]
+		dDetails = { '__type__': 'string', '__options__': lOptions }
+		oNode = define.Node(dDetails)
+		oCompiled = oNode.compile()
+
+		# Time creating the Node, and validating the first, last, and a
+		#	missing option
+		iNumber = 1000
+		print('%8d %12.1f %10.3f %10.3f %10.3f %10.3f' % (
+			iSize,
+			best(lambda: define.Node(dDetails), max(1, 1000 // iSize)),
+			best(lambda: oNode.valid(lOptions[0]), iNumber),
+			best(lambda: oNode.valid(lOptions[-1]), iNumber),
+			best(lambda: oNode.valid('nope'), iNumber),
+			best(lambda: oCompiled.valid(lOptions[-1]), iNumber)
+		))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,118 @@
+# coding=utf8
+"""Snapshot Benchmark
+
+Compares the time it takes to get a large Tree from a JSON file, and from a \
+snapshot of it
+
+Run with: python -m benchmarks.snapshot
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Ouroboros imports
+import jsonb
+
+# Python imports
+import os
+import tempfile
+import timeit
+
+# Local imports
+import define
+
+def definition(fields: int) -> dict:
+	"""Definition
+
+	Generates a definition with the number of fields passed, using a mix of \
+	types, regexes, options, and min/max values
+
+	Arguments:
+		fields (uint): The number of fields
+
+	Returns:
+		dict
+	"""
+
+	# Init the definition
+	dRet = { '__name__': 'record' }
+
+	# Add the fields
+	for i in range(fields):
+		iType = i % 5
+		if iType == 0:
+			dRet['f%d' % i] = {
+				'__type__': 'string', '__regex__': '^[a-z]{1,%d}$' % (i + 1)
+			}
+		elif iType == 1:
+			dRet['f%d' % i] = {
+				'__type__': 'string',
+				'__options__': [ 'opt%d' % j for j in range(20) ]
+			}
+		elif iType == 2:
+			dRet['f%d' % i] = {
+				'__type__': 'price',
+				'__minimum__': '0.01',
+				'__maximum__': '%d.99' % i
+			}
+		elif iType == 3:
+			dRet['f%d' % i] = {
+				'__array__': 'unique',
+				'__type__': { 'a': 'uint', 'b': 'date', 'c': 'uuid' }
+			}
+		else:
+			dRet['f%d' % i] = {
+				'__hash__': 'string',
+				'__type__': [ { '__type__': 'int' }, { '__type__': 'md5' } ]
+			}
+
+	# Return the definition
+	return dRet
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Print the header
+	print('%8s %12s %12s %12s %12s %8s' % (
+		'fields', 'json bytes', 'snap bytes', 'json ms', 'snapshot ms',
+		'speedup'
+	))
+
+	# Go through each size
+	with tempfile.TemporaryDirectory() as sDir:
+		for iFields in [ 10, 100, 1000 ]:
+
+			# Store the JSON and the snapshot
+			sJSON = os.path.join(sDir, 'tree%d.json' % iFields)
+			sSnap = os.path.join(sDir, 'tree%d.snapshot' % iFields)
+			jsonb.store(definition(iFields), sJSON)
+			define.Tree.from_file(sJSON, cached = False).dump_snapshot(sSnap)
+
+			# Time loading each
+			iNumber = max(1, 2000 // iFields)
+			fJSON = min(timeit.repeat(
+				lambda: define.Tree.from_file(sJSON, cached = False),
+				number = iNumber, repeat = 5
+			)) / iNumber * 1000
+			fSnap = min(timeit.repeat(
+				lambda: define.Tree.load_snapshot(sSnap),
+				number = iNumber, repeat = 5
+			)) / iNumber * 1000
+
+			# Print the results
+			print('%8d %12d %12d %12.3f %12.3f %7.1fx' % (
+				iFields, os.path.getsize(sJSON), os.path.getsize(sSnap),
+				fJSON, fSnap, fJSON / fSnap
+			))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
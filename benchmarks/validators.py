@@ -0,0 +1,102 @@
+# coding=utf8
+"""Validators Benchmark
+
+Compares the time taken to check strings of each type with the regular \
+expressions in constants.regex, and with the regex-free functions, and shows \
+which of the two is used
+
+Run with: python -m benchmarks.validators
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Python imports
+import statistics
+import timeit
+
+# Local imports
+from define import constants, validators
+
+# A valid and an invalid value of each type
+VALUES = {
+	'date': ( '2016-03-05', '2016-13-05' ),
+	'datetime': ( '2016-03-05 12:34:56', '2016-03-05 24:34:56' ),
+	'ip': ( '192.168.0.1', '192.168.0.256' ),
+	'md5': (
+		'7b967af699a0a18b1f2bdc9704537a3e',
+		'7b967af699a0a18b1f2bdc9704537a3g'
+	),
+	'time': ( '12:34:56', '12:60:56' ),
+	'tuuid': (
+		'52cd4b20ca32443395160c8684ec57c2',
+		'52cd4b20ca32443395160c8684ec57cg'
+	),
+	'uuid': (
+		'52cd4b20-ca32-4433-9516-0c8684ec57c2',
+		'52cd4b20-ca32-4433-9516-0c8684ec57cg'
+	)
+}
+
+def compare(first: callable, second: callable) -> tuple[float, float]:
+	"""Compare
+
+	Returns the median time, in nanoseconds, of one call to the first \
+	function, and the median ratio of the second function's time to the \
+	first's, timing both back to back so that a busy machine affects them \
+	both the same
+
+	Arguments:
+		first (callable): The first function to call
+		second (callable): The second function to call
+
+	Returns:
+		tuple[float, float]
+	"""
+	lTimes = []
+	lRatios = []
+	for _ in range(50):
+		f1 = timeit.timeit(first, number = 5000)
+		f2 = timeit.timeit(second, number = 5000)
+		lTimes.append(f1 / 5000 * 1000000000)
+		lRatios.append(f2 / f1)
+	return statistics.median(lTimes), statistics.median(lRatios)
+
+def main():
+	"""Main
+
+	Runs the benchmark and prints the results
+
+	Returns:
+		None
+	"""
+
+	# Print the header
+	print('%-10s %-8s %10s %10s %8s  %s' % (
+		'type', 'value', 'regex ns', 'free ns', 'speedup', 'used'
+	))
+
+	# Go through each type, and each value
+	for sType, tValues in VALUES.items():
+		fRegex = constants.regex[sType].match
+		fFree = validators.regex_free[sType]
+		sUsed = validators.match[sType] is fFree and 'regex-free' or 'regex'
+		for sValue, s in zip([ 'valid', 'invalid' ], tValues):
+
+			# Make sure they agree
+			if bool(fRegex(s)) != bool(fFree(s)):
+				raise ValueError('%s "%s" does not match the regex' % (
+					sType, s
+				))
+
+			# Time each and print the results
+			fTime, fRatio = compare(lambda: fRegex(s), lambda: fFree(s))
+			print('%-10s %-8s %10.1f %10.1f %7.2fx  %s' % (
+				sType, sValue, fTime, fTime * fRatio, 1 / fRatio, sUsed
+			))
+
+# Only run if called directly
+if __name__ == '__main__':
+	main()
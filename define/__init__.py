@@ -11,15 +11,18 @@ __created__		= "2023-03-18"
 
 # Limit exports
 __all__ = [
-	'constants', 'Array', 'Base', 'Hash', 'Node', 'Options', 'Parent', 'Tree'
+	'cache', 'constants', 'intern', 'Array', 'Base', 'Hash', 'Node', 'Options',
+	'Parent', 'Pool', 'Result', 'Results', 'Tree'
 ]
 
 # Import local modules
-from define import constants
+from define import cache, constants, intern
 from define.array import Array
 from define.base import Base
 from define.hash import Hash
 from define.node import Node
 from define.options import Options
 from define.parent import Parent
+from define.pool import Pool
+from define.result import Result, Results
 from define.tree import Tree
\ No newline at end of file
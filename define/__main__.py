@@ -1 +1,317 @@
-print('I compile, but I don\'t necessarily run')
\ No newline at end of file
+# coding=utf8
+"""Define Main
+
+Command line interface, run with python -m define
+
+	python -m define validate schema.json data.jsonl
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['main', 'validate']
+
+# Ouroboros imports
+import jsonb
+
+# Python imports
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+from time import perf_counter
+from typing import Iterable, TextIO
+
+# Local imports
+from define.tree import Tree
+
+# The compiled tree and options used by the current process
+_compiled = None
+_ignore_missing = False
+
+def _chunks(lines: Iterable[str], size: int) -> Iterable[tuple[int, list]]:
+	"""Chunks
+
+	Splits the lines of a file into lists of at most size lines, along with \
+	the line number of the first one, without reading the whole file
+
+	Arguments:
+		lines (iterable): The lines of the file
+		size (uint): The maximum number of lines in each chunk
+
+	Returns:
+		iterable
+	"""
+
+	# Init the chunk
+	iStart = 1
+	lChunk = []
+
+	# Go through each line
+	for s in lines:
+		lChunk.append(s)
+
+		# If the chunk is full, return it and start a new one
+		if len(lChunk) == size:
+			yield iStart, lChunk
+			iStart += size
+			lChunk = []
+
+	# If there's anything left
+	if lChunk:
+		yield iStart, lChunk
+
+def _init(tree: Tree, ignore_missing: bool) -> None:
+	"""Init
+
+	Compiles the tree, once, in the current process
+
+	Arguments:
+		tree (Tree): The tree, pickled whole when sent to another process, \
+			as to_dict doesn't keep everything a Tree holds
+		ignore_missing (bool): Set to True to ignore missing nodes
+
+	Returns:
+		None
+	"""
+	global _compiled, _ignore_missing
+	_compiled = tree.compile()
+	_ignore_missing = ignore_missing
+
+def _validate(chunk: tuple[int, list]) -> tuple[int, int, str]:
+	"""Validate
+
+	Validates each line of a chunk and returns the number of valid and \
+	invalid records, along with the results as JSONL. Blank lines are \
+	skipped
+
+	Arguments:
+		chunk (tuple): The line number of the first line, and the lines
+
+	Returns:
+		tuple[int, int, str]
+	"""
+
+	# Init the counts and the output
+	iValid = 0
+	iInvalid = 0
+	lOutput = []
+
+	# Go through each line
+	iLine, lLines = chunk
+	for s in lLines:
+
+		# If the line isn't blank
+		if s and not s.isspace():
+
+			# Try to decode the record
+			try:
+				mRecord = jsonb.decode(s)
+
+			# If it's not JSON
+			except ValueError:
+				bValid = False
+				lFailures = [[
+					_compiled.definition.name, 'Can not be decoded from JSON'
+				]]
+
+			# Else, try to validate it
+			else:
+				try:
+					oResult = _compiled.validate(mRecord, _ignore_missing)
+					bValid = oResult.valid
+					lFailures = oResult.failures
+
+				# If the record raised, fail it on its own so the rest of the
+				#	file is still validated
+				except Exception as e:
+					bValid = False
+					lFailures = [['', str(e)]]
+
+			# Count it and add the result
+			if bValid:
+				iValid += 1
+			else:
+				iInvalid += 1
+			lOutput.append(jsonb.encode({
+				'line': iLine,
+				'valid': bValid,
+				'failures': lFailures
+			}))
+			lOutput.append('\n')
+
+		# Next line
+		iLine += 1
+
+	# Return the counts and output
+	return iValid, iInvalid, ''.join(lOutput)
+
+def validate(
+	schema: str,
+	data: TextIO,
+	output: TextIO,
+	workers: int = None,
+	chunk_size: int = 1000,
+	ignore_missing: bool = False
+) -> tuple[int, int]:
+	"""Validate
+
+	Validates every record of a JSONL file against a tree using a pool of \
+	processes, and writes one line of JSON for each, in the same order, with \
+	the line number, whether it was valid, and its failures
+
+	Arguments:
+		schema (str): The path to the JSON definition of the tree
+		data (file): The JSONL file to read records from
+		output (file): The file to write the results to
+		workers (uint): Optional, the number of processes to use, defaults \
+			to the number of cores
+		chunk_size (uint): Optional, the number of lines sent to a process \
+			at a time
+		ignore_missing (bool): Optional, set to True to ignore missing nodes
+
+	Raises:
+		KeyError, ValueError
+
+	Returns:
+		tuple[int, int]: The number of valid and invalid records
+	"""
+
+	# Load the tree once, so that a bad definition is reported before
+	#	starting any processes
+	oTree = Tree(schema)
+
+	# Init the counts
+	iValid = 0
+	iInvalid = 0
+
+	# If the number of processes isn't set, use one per core
+	if workers is None:
+		workers = os.cpu_count() or 1
+
+	# If we only need the one process, do the work here
+	if workers == 1:
+		_init(oTree, ignore_missing)
+		for t in _chunks(data, chunk_size):
+			iV, iI, sOutput = _validate(t)
+			iValid += iV
+			iInvalid += iI
+			output.write(sOutput)
+		return iValid, iInvalid
+
+	# Start the pool, each process compiling the tree once
+	with ProcessPoolExecutor(
+		max_workers = workers,
+		initializer = _init,
+		initargs = (oTree, ignore_missing)
+	) as oPool:
+
+		# Keep a few chunks per process queued, and write the results in
+		#	order as they finish, so the file is never all in memory
+		iQueue = workers * 2
+		qPending = deque()
+		for t in _chunks(data, chunk_size):
+			qPending.append(oPool.submit(_validate, t))
+			if len(qPending) >= iQueue:
+				iV, iI, sOutput = qPending.popleft().result()
+				iValid += iV
+				iInvalid += iI
+				output.write(sOutput)
+
+		# Write whatever is left
+		while qPending:
+			iV, iI, sOutput = qPending.popleft().result()
+			iValid += iV
+			iInvalid += iI
+			output.write(sOutput)
+
+	# Return the counts
+	return iValid, iInvalid
+
+def main(args: list[str] = None) -> int:
+	"""Main
+
+	Parses the command line arguments and runs the command requested
+
+	Arguments:
+		args (str[]): Optional, the arguments, defaults to sys.argv
+
+	Returns:
+		int: 0 if every record was valid, 1 if any weren't
+	"""
+
+	# Set up the arguments
+	oParser = argparse.ArgumentParser(prog = 'python -m define')
+	oCommands = oParser.add_subparsers(dest = 'command', required = True)
+	oValidate = oCommands.add_parser(
+		'validate',
+		help = 'Validate each line of a JSONL file against a definition'
+	)
+	oValidate.add_argument('schema', help = 'The JSON definition of the tree')
+	oValidate.add_argument('data', help = 'The JSONL file, or - for stdin')
+	oValidate.add_argument(
+		'-o', '--output', default = '-',
+		help = 'The file to write results to, defaults to stdout'
+	)
+	oValidate.add_argument(
+		'-w', '--workers', type = int, default = None,
+		help = 'The number of processes to use, defaults to the number of ' \
+			'cores'
+	)
+	oValidate.add_argument(
+		'-c', '--chunk-size', type = int, default = 1000,
+		help = 'The number of lines sent to a process at a time'
+	)
+	oValidate.add_argument(
+		'-i', '--ignore-missing', action = 'store_true',
+		help = 'Ignore missing nodes'
+	)
+	oArgs = oParser.parse_args(args)
+
+	# If the workers or chunk size are invalid
+	if oArgs.workers is not None and oArgs.workers < 1:
+		oParser.error('--workers must be at least 1')
+	if oArgs.chunk_size < 1:
+		oParser.error('--chunk-size must be at least 1')
+
+	# Open the files
+	oData = oArgs.data == '-' and sys.stdin or \
+		open(oArgs.data, 'r', encoding = 'utf-8')
+	oOutput = oArgs.output == '-' and sys.stdout or \
+		open(oArgs.output, 'w', encoding = 'utf-8')
+
+	# Validate the file and time it
+	try:
+		fStart = perf_counter()
+		iValid, iInvalid = validate(
+			oArgs.schema, oData, oOutput, oArgs.workers, oArgs.chunk_size,
+			oArgs.ignore_missing
+		)
+		fSeconds = perf_counter() - fStart
+
+	# Close the files
+	finally:
+		if oData is not sys.stdin:
+			oData.close()
+		if oOutput is not sys.stdout:
+			oOutput.close()
+
+	# Print the stats
+	iTotal = iValid + iInvalid
+	sys.stderr.write(
+		'%d records, %d valid, %d invalid, in %.2fs (%.0f records/s)\n' % (
+			iTotal, iValid, iInvalid, fSeconds,
+			fSeconds and iTotal / fSeconds or 0
+		)
+	)
+
+	# Return based on whether there were any invalid records
+	return iInvalid and 1 or 0
+
+# Only run if called directly
+if __name__ == '__main__':
+	sys.exit(main())
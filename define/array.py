@@ -16,11 +16,80 @@ __all__ = ['Array']
 import undefined
 
 # Python imports
-from typing import Literal as TL
+from typing import Generator as TG, Literal as TL
 
 # Local imports
 from define import constants
 from define.base import Base
+from define.compiler import Generator
+from define.level import join
+from define.node import Node
+
+# Markers used to keep the keys of lists and dicts from ever equaling the key
+#	of another type of value
+_DICT_KEY = object()
+_LIST_KEY = object()
+
+def _unique_key(value: any) -> any:
+	"""Unique Key
+
+	Returns a hashable key for a value which is equal to the key of another \
+	value only if the two values are equal, so that lists and dicts can be \
+	checked for duplicates using a dict. Values of any other type are returned \
+	as is
+
+	Arguments:
+		value (any): The value to generate a key for
+
+	Returns:
+		any
+	"""
+
+	# If it's a dict, use the keys and the key of each value
+	if type(value) is dict:
+		return (_DICT_KEY, frozenset([
+			(k, _unique_key(v)) for k,v in value.items()
+		]))
+
+	# If it's a list, use the key of each value in order
+	if type(value) is list:
+		return (_LIST_KEY, tuple([_unique_key(v) for v in value]))
+
+	# If it's a tuple, it may contain lists or dicts
+	if type(value) is tuple:
+		return tuple([_unique_key(v) for v in value])
+
+	# If it's a set, use the frozen version, which is equal to it
+	if type(value) is set:
+		return frozenset(value)
+
+	# Return anything else as is
+	return value
+
+def _unique_other(others: list[tuple], value: any, index: int) -> int:
+	"""Unique Other
+
+	Checks a value which can not be hashed against the others found so far, \
+	returning the index of the first one equal to it, or storing it and \
+	returning the index passed if there is none
+
+	Arguments:
+		others (list): The (value, index) of each unhashable value found
+		value (any): The value to check
+		index (int): The index of the value if it's not a duplicate
+
+	Returns:
+		int
+	"""
+
+	# Look for an equal value
+	for o, i in others:
+		if o is value or o == value:
+			return i
+
+	# None found, add it
+	others.append((value, index))
+	return index
 
 class Array(Base):
 	"""Array
@@ -31,6 +100,10 @@ class Array(Base):
 		Base
 	"""
 
+	__slots__ = (
+		'_maximum', '_minimum', '_node', '_type', '_unique_key'
+	)
+
 	_VALID_ARRAY = ['unique', 'duplicates']
 	"""Valid Array
 
@@ -106,6 +179,190 @@ class Array(Base):
 		# Create the child node
 		self._node = self.create(dDetails, '%s|node' % name)
 
+		# If the child's values can be anything, or lists or dicts, store the
+		#	function to turn them into keys for checking duplicates
+		if isinstance(self._node, Node) and \
+			self._node._type not in ['any', 'json']:
+			self._unique_key = None
+		else:
+			self._unique_key = _unique_key
+
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
+
+		Returns the exact Python types of the values the instance could be \
+		valid for
+
+		Returns:
+			frozenset | None
+		"""
+
+		# If a child class changed how values are validated, it can't tell
+		if type(self)._valid is not Array._valid:
+			return None
+		return frozenset([list])
+
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
+
+		Generates a function which cleans values exactly like clean does, \
+		calling the function generated for the child node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			str
+		"""
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_error('list', 'not an array')
+
+		# Go through each value and clean it
+		lLines.extend([
+			'lErrors = []',
+			'lRet = []',
+			'for i, v in enumerate(value):',
+			'\tlLevel = level + [\'[%d]\' % i]',
+			'\ttry:',
+			'\t\tlRet.append(%s(v, lLevel))' % gen.clean(self._node),
+			'\texcept ValueError as e:',
+			'\t\tif isinstance(e.args[0], list):',
+			'\t\t\tlErrors.extend(e.args[0])',
+			'\t\telse:',
+			'\t\t\tlErrors.append([join(lLevel), str(e)])',
+			'if lErrors:',
+			'\traise ValueError(lErrors)',
+			'return lRet'
+		])
+
+		# Add the function
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', lLines)
+
+		# Return the name
+		return sName
+
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
+
+		Generates a function which validates values exactly like valid does, \
+		calling the function generated for the child node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Get the function for the child node
+		sValid, bDirty = gen.valid(self._node)
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_missing()
+		lLines.append('if not isinstance(value, list):')
+		lLines.extend(self._compile_fail('not an array', 1))
+		lLines.append('bRet = True')
+
+		# Keep track of duplicates
+		if self._type == 'unique':
+			lLines.extend([
+				'dItems = {}',
+				'lOthers = []'
+			])
+
+		# Go through each item in the list
+		lLines.extend([
+			'for i, v in enumerate(value):',
+			'\tlevel.append(i)'
+		])
+		if bDirty:
+			lLines.append('\tiFailures = failures and len(failures) or 0')
+		lLines.extend([
+			'\tbValid = %s(v, ignore_missing, level, failures, fail_fast)' % \
+				sValid,
+			'\tlevel.pop()',
+			'\tif not bValid:',
+			'\t\tif fail_fast:',
+			'\t\t\treturn False',
+			'\t\tbRet = False',
+			'\t\tcontinue'
+		])
+
+		# If the node can pass while leaving failures, drop them
+		if bDirty:
+			lLines.extend([
+				'\tif failures:',
+				'\t\tdel failures[iFailures:]'
+			])
+
+		# If we need to check for duplicates
+		if self._type == 'unique':
+			lLines.extend([
+				'\tiUnique = len(dItems) + len(lOthers)',
+				'\ttry:',
+				'\t\tiIndex = dItems.setdefault(%s, iUnique)' % (
+					self._unique_key is None and 'v' or \
+						'%s(v)' % gen.constant(self._unique_key)
+				),
+				'\texcept TypeError:',
+				'\t\tiIndex = %s(lOthers, v, iUnique)' % \
+					gen.constant(_unique_other),
+				'\tif iIndex != iUnique:',
+				'\t\tif failures is not None:',
+				'\t\t\tfailures.append([join(level + [i]), ' \
+					'\'duplicate of %s[%d]\' % (join(level), iIndex)])',
+				'\t\tif fail_fast:',
+				'\t\t\treturn False',
+				'\t\tbRet = False'
+			])
+
+		# If there's a minimum
+		if self._minimum is not None:
+			lLines.extend([
+				'if len(value) < %d:' % self._minimum,
+				'\tif failures is not None:',
+				'\t\tfailures.append([join(level), \'did not meet minimum\'])',
+				'\tif fail_fast:',
+				'\t\treturn False',
+				'\tbRet = False'
+			])
+
+		# If there's a maximum
+		if self._maximum is not None:
+			lLines.extend([
+				'if len(value) > %d:' % self._maximum,
+				'\tif failures is not None:',
+				'\t\tfailures.append([join(level), \'exceeds maximum\'])',
+				'\tbRet = False'
+			])
+
+		# Return whatever the result was
+		lLines.append('return bRet')
+
+		# Add the function
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', lLines
+		)
+
+		# Return the name, an Array never passes with failures
+		return sName, False
+
+	def _share(self, share: callable) -> None:
+		"""Share
+
+		Replaces the node of the elements with its shared instance
+
+		Arguments:
+			share (callable): Returns the shared instance of the one passed
+
+		Returns:
+			None
+		"""
+		self._node = share(self._node)
+
 	def child(self) -> Base:
 		"""Child
 
@@ -144,11 +401,11 @@ class Array(Base):
 				return None
 
 			# Else, it's a missing value
-			raise ValueError([['.'.join(level), 'missing']])
+			raise ValueError([[join(level), 'missing']])
 
 		# If the value is not a list
 		if not isinstance(value, list):
-			raise ValueError([['.'.join(level), 'not an array']])
+			raise ValueError([[join(level), 'not an array']])
 
 		# Go through each value
 		lErrors: list = []
@@ -159,19 +416,35 @@ class Array(Base):
 			lLevel = level[:]
 			lLevel.append('[%d]' % i)
 
-			# Try to clean it
+			# Try to clean it, keeping the failures, or the message of a value
+			#	which couldn't be converted
 			try:
 				lRet.append(self._node.clean(value[i], lLevel))
 			except ValueError as e:
-				lErrors.extend(e.args[0])
+				if isinstance(e.args[0], list):
+					lErrors.extend(e.args[0])
+				else:
+					lErrors.append([join(lLevel), str(e)])
 
 		# If there's any errors
 		if lErrors:
-			raise lErrors
+			raise ValueError(lErrors)
 
 		# Return the cleaned list
 		return lRet
 
+	def freeze(self) -> 'Array':
+		"""Freeze
+
+		Stops the instance, and the node of its elements, from being changed \
+		so that they can be safely shared
+
+		Returns:
+			Array
+		"""
+		self._node.freeze()
+		return super(Array, self).freeze()
+
 	def minmax(self,
 		minimum: int = undefined,
 		maximum: int = undefined
@@ -185,7 +458,7 @@ class Array(Base):
 			maximum (int): The maximum value
 
 		Raises:
-			ValueError
+			RuntimeError, ValueError
 
 		Returns:
 			None
@@ -198,6 +471,9 @@ class Array(Base):
 				'maximum': self._maximum
 			}
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# If the minimum is set
 		if minimum is not None:
 
@@ -318,6 +594,9 @@ class Array(Base):
 
 		Getter/Setter for the type of array
 
+		Raises:
+			RuntimeError, ValueError
+
 		Returns:
 			str | None
 		"""
@@ -326,6 +605,9 @@ class Array(Base):
 		if type is undefined:
 			return self._type
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# Else, it's a setter
 		#	If the value is invalid
 		if type not in self._VALID_ARRAY:
@@ -336,31 +618,34 @@ class Array(Base):
 		# Store the new type
 		self._type = type
 
-	def valid(self,
+	_valid = Base._run
+	"""Checks values by walking them with _walk"""
+
+	def _walk(self,
 		value: list[any] | None,
-		ignore_missing = False,
-		level: list[str] = undefined
-	) -> bool:
-		"""Valid
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> TG[tuple, bool, bool]:
+		"""Walk
 
-		Checks if a value is valid based on the instance's values. If any \
-		errors occur, they can be found in self.validation_failures as a list
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed, yielding its node, each element, and \
+		fail_fast, to be checked, and receiving the result
 
 		Arguments:
-			value (list): The value to validate
-			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			value (list | None): The value to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
 
 		Returns:
-			bool
+			Generator
 		"""
 
-		# If the level was not set
-		if level is undefined:
-			level = []
-
-		# Reset validation failures
-		self._validation_failures = []
-
 		# If the value is None
 		if value is None:
 
@@ -369,11 +654,13 @@ class Array(Base):
 				return True
 
 			# Invalid value
-			self._validation_failures.append(['.'.join(level), 'missing'])
+			if failures is not None:
+				failures.append([join(level), 'missing'])
 
 		# If the value isn't a list
 		if not isinstance(value, list):
-			self._validation_failures.append(['.'.join(level), 'not an array'])
+			if failures is not None:
+				failures.append([join(level), 'not an array'])
 			return False
 
 		# Init the return, assume valid
@@ -381,54 +668,72 @@ class Array(Base):
 
 		# Keep track of duplicates
 		if self._type == 'unique':
-			lItems	= []
+			dItems = {}
+			lOthers = []
 
 		# Go through each item in the list
 		for i in range(len(value)):
 
-			# Add the field to the level
-			lLevel = level[:]
-			lLevel.append('[%d]' % i)
+			# Add the index to the level while the element is checked
+			level.append(i)
+			iFailures = failures and len(failures) or 0
+			bValid = yield self._node, value[i], fail_fast
+			level.pop()
 
 			# If the element isn't valid, return false
-			if not self._node.valid(value[i], ignore_missing, lLevel):
-				self._validation_failures.extend(
-					self._node.validation_failures[:]
-				)
+			if not bValid:
+				if fail_fast:
+					return False
 				bRet = False
 				continue
 
+			# Drop anything the valid element may have left behind
+			if failures:
+				del failures[iFailures:]
+
 			# If we need to check for duplicates
 			if self._type == 'unique':
 
-				# Try to get an existing item
-				try:
-
-					# If it is found, we have a duplicate
-					iIndex = lItems.index(value[i])
+				# The index the item will have if it's not a duplicate
+				iUnique = len(dItems) + len(lOthers)
 
-					# Add the error to the list
-					self._validation_failures.append([
-						'.'.join(lLevel),
-						'duplicate of %s[%d]' % ('.'.join(level), iIndex)
-					])
+				# Get the index of the first equal item, or store this one
+				try:
+					if self._unique_key is None:
+						iIndex = dItems.setdefault(value[i], iUnique)
+					else:
+						iIndex = dItems.setdefault(
+							self._unique_key(value[i]), iUnique
+						)
+
+				# If the item can't be hashed, check it against the others
+				except TypeError:
+					iIndex = _unique_other(lOthers, value[i], iUnique)
+
+				# If an equal item was found first, we have a duplicate
+				if iIndex != iUnique:
+					if failures is not None:
+						failures.append([
+							join(level + [i]),
+							'duplicate of %s[%d]' % (join(level), iIndex)
+						])
+					if fail_fast:
+						return False
 					bRet = False
 					continue
 
-				# If a Value Error is thrown, there is no duplicate, add the
-				# 	value to the list and continue
-				except ValueError:
-					lItems.append(value[i])
-
 		# If there's a minumum
 		if self._minimum is not None:
 
 			# If we don't have enough
 			if len(value) < self._minimum:
-				self._validation_failures.append([
-					'.'.join(level),
-					'did not meet minimum'
-				])
+				if failures is not None:
+					failures.append([
+						join(level),
+						'did not meet minimum'
+					])
+				if fail_fast:
+					return False
 				bRet = False
 
 		# If there's a maximum
@@ -436,10 +741,11 @@ class Array(Base):
 
 			# If we have too many
 			if len(value) > self._maximum:
-				self._validation_failures.append([
-					'.'.join(level),
-					'exceeds maximum'
-				])
+				if failures is not None:
+					failures.append([
+						join(level),
+						'exceeds maximum'
+					])
 				bRet = False
 
 		# Return whatever the result was
@@ -14,17 +14,71 @@ __all__ = ['Base']
 
 # Ouroboros imports
 import jsonb
-from tools import clone, combine
 import undefined
 
 # Python imports
 import abc
+import asyncio
 import copy
 import sys
-from typing import Literal as TL
+import threading
+from types import MappingProxyType
+from typing import Iterable, Literal as TL
 
 # Local imports
-from define import constants
+from define import cache, constants
+from define.compiler import Compiled, Generator
+from define.result import Result, Results
+from define.steps import Steps
+
+def _overlay(first: dict, second: dict) -> dict:
+	"""Overlay
+
+	Returns a new dict with the values of second merged into first the same \
+	way tools.combine does, but only the dicts changed by second are copied, \
+	any other value is shared with first
+
+	Arguments:
+		first (dict): The dict to overlay
+		second (dict): The dict with the values to overwrite
+
+	Returns:
+		dict
+	"""
+
+	# Copy the top level
+	dRet = dict(first)
+
+	# Go through each value to overwrite
+	for k,v in second.items():
+
+		# If both are dicts, overlay the child, else overwrite the value
+		if isinstance(v, dict) and isinstance(dRet.get(k), dict):
+			dRet[k] = _overlay(dRet[k], v)
+		else:
+			dRet[k] = v
+
+	# Return the new dict
+	return dRet
+
+def _readonly(value: any) -> any:
+	"""Read-Only
+
+	Returns a read-only view of a special value, dicts become mappingproxy, \
+	lists become tuples, and anything else, which can only be a JSON value, \
+	is already immutable
+
+	Arguments:
+		value (any): The value to make read-only
+
+	Returns:
+		any
+	"""
+	if isinstance(value, dict):
+		return MappingProxyType({k: _readonly(v) for k,v in value.items()})
+	if isinstance(value, list):
+		return tuple([_readonly(v) for v in value])
+	return value
 
 class Base(abc.ABC):
 	"""Base
@@ -35,11 +89,29 @@ class Base(abc.ABC):
 		abc.ABC
 	"""
 
+	__slots__ = (
+		'__name', '__readonly', '__special', '__weakref__', '_failures',
+		'_frozen', '_optional'
+	)
+	"""The only attributes stored on each instance, the name if it's a field \
+	of another Define structure, the special values, if there are any, and \
+	the read-only views of those already read, the failures of the last call \
+	to valid by thread, and the flags"""
+
 	__classes = {}
 	"""Classes used to create new define types"""
 
-	__name = None
-	"""The name if it's a field of another Define structure"""
+	__lock = threading.Lock()
+	"""Lock used to create the per thread storage of instances"""
+
+	__slot_names = {}
+	"""The names of the slots of each class, as Python stores them"""
+
+	_walk = None
+	"""Child classes which hold other instances implement it as the generator \
+	which checks a value, yielding each (instance, value, fail_fast) to \
+	check with one of them, and receiving the result, so that _valid and \
+	_avalid share the one traversal"""
 
 	def __init__(self, details: dict, name: str = None):
 		"""Constructor (__init__)
@@ -58,14 +130,14 @@ class Base(abc.ABC):
 				sys._getframe().f_code.co_name
 			))
 
-		# Store the class name for the child
-		self.__class = self.__class__.__name__
-
 		# Store the structure name
 		self.__name = name
 
-		# Init the list of the last failures generated in valid
-		self._validation_failures = None
+		# Init the storage of the last failures generated in valid, by thread
+		self._failures = None
+
+		# Init the frozen flag, the instance can be changed until it's frozen
+		self._frozen = False
 
 		# Init the optional flag, assume all nodes are necessary
 		self._optional = False
@@ -85,7 +157,7 @@ class Base(abc.ABC):
 			del details['__optional__']
 
 		# Init the special dict
-		self.__special = {}
+		dSpecial = {}
 
 		# If there are any other special fields in the details
 		for k in tuple(details.keys()):
@@ -98,10 +170,28 @@ class Base(abc.ABC):
 			oMatch = constants.special['key'].match(k)
 			if oMatch:
 
-				# Store it with the other specials then remove it
-				self.__special[oMatch.group(1)] = details[k]
+				# Store a copy of it with the other specials, as the details
+				#	may be shared with other instances, then remove it
+				dSpecial[oMatch.group(1)] = copy.deepcopy(details[k])
 				del details[k]
 
+		# Store the specials, if there are any, most nodes have none
+		self.__special = dSpecial or None
+
+		# Init the read-only views of the specials, created as they're read
+		self.__readonly = None
+
+	def __getstate__(self) -> tuple[None, dict]:
+		"""Get State (__getstate__)
+
+		Returns the state of the instance to pickle, as the slots state so \
+		that pickle and copy can restore it without calling back into Python
+
+		Returns:
+			tuple[None, dict]
+		"""
+		return None, self._state()
+
 	def __repr__(self):
 		"""Representation (__repr__)
 
@@ -115,6 +205,413 @@ class Base(abc.ABC):
 			str(self.to_dict())
 		)
 
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
+
+		Returns the exact Python types of the values the instance could be \
+		valid for, out of those which come from JSON, or None if it could be \
+		valid for any of them. Used by Options to skip the options a value \
+		can never be valid for. Child classes which check the type of the \
+		value override it
+
+		Returns:
+			frozenset | None
+		"""
+		return None
+
+	async def _avalid(self,
+		value: any,
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool,
+		steps: Steps
+	) -> bool:
+		"""Async Valid
+
+		Checks if a value is valid exactly like _valid does, but gives the \
+		event loop a turn every so many checks, counted by steps. The \
+		instances held by child classes, yielded by their walk, are checked \
+		the same way
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
+			steps (Steps): Counts the checks made, shared by every instance
+
+		Returns:
+			bool
+		"""
+
+		# Count the check, and give the event loop a turn if it's time
+		if steps.step():
+			await asyncio.sleep(0)
+
+		# If the instance holds no others, check the value
+		if self._walk is None:
+			return self._valid(
+				value, ignore_missing, level, failures, fail_fast
+			)
+
+		# Walk the value, checking each of the others the same way
+		oWalk = self._walk(value, ignore_missing, level, failures, fail_fast)
+		try:
+			o, v, b = next(oWalk)
+			while True:
+				o, v, b = oWalk.send(await o._avalid(
+					v, ignore_missing, level, failures, b, steps
+				))
+		except StopIteration as e:
+			return e.value
+
+	def _check_frozen(self) -> None:
+		"""Check Frozen
+
+		Called by setters before changing anything, raises an error if the \
+		instance is frozen
+
+		Raises:
+			RuntimeError
+
+		Returns:
+			None
+		"""
+		if self._frozen:
+			raise RuntimeError(
+				'%s is frozen and can not be changed' % \
+					self.__class__.__name__
+			)
+
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
+
+		Generates the function used to clean values of the instance and \
+		returns its name. Child classes which don't generate their own code \
+		fall back on calling clean on the instance
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			str
+		"""
+
+		# Generate a function which simply calls clean
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', [
+			'return %s.clean(value, level)' % gen.constant(self)
+		])
+
+		# Return the name
+		return sName
+
+	def _compile_error(self, types: str, message: str) -> list[str]:
+		"""Compile Error
+
+		Returns the lines generated clean functions start with to handle a \
+		value of None, or a value of the wrong type
+
+		Arguments:
+			types (str): The name of the type the value must be
+			message (str): The error if the value is not of the type
+
+		Returns:
+			str[]
+		"""
+		return [
+			'if value is None:',
+			self._optional and '\treturn None' or \
+				'\traise ValueError([[join(level), \'missing\']])',
+			'if not isinstance(value, %s):' % types,
+			'\traise ValueError([[join(level), %r]])' % message
+		]
+
+	@staticmethod
+	def _compile_fail(message: str, indent: int = 0) -> list[str]:
+		"""Compile Fail
+
+		Returns the lines used by generated valid functions to add a failure \
+		for the current level and return
+
+		Arguments:
+			message (str): The failure message
+			indent (int): The number of tabs to indent the lines by
+
+		Returns:
+			str[]
+		"""
+		return [
+			'%sif failures is not None:' % ('\t' * indent),
+			'%s\tfailures.append([join(level), %r])' % (
+				'\t' * indent, message
+			),
+			'%sreturn False' % ('\t' * indent)
+		]
+
+	def _compile_missing(self) -> list[str]:
+		"""Compile Missing
+
+		Returns the lines every generated valid function starts with to \
+		handle a value of None
+
+		Returns:
+			str[]
+		"""
+
+		# If the instance is optional, a missing value is always fine
+		if self._optional:
+			return [
+				'if value is None:',
+				'\treturn True'
+			]
+
+		# Else, add the failure, but keep going like valid does
+		return [
+			'if value is None:',
+			'\tif ignore_missing:',
+			'\t\treturn True',
+			'\tif failures is not None:',
+			'\t\tfailures.append([join(level), \'missing\'])'
+		]
+
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
+
+		Generates the function used to validate values of the instance and \
+		returns its name along with whether it can return True with failures. \
+		Child classes which don't generate their own code fall back on calling \
+		_valid on the instance
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Generate a function which simply calls the instance
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', [
+				'return %s._valid(value, ignore_missing, level, failures, ' \
+					'fail_fast)' % gen.constant(self)
+			]
+		)
+
+		# Return the name, and that failures may be left on success
+		return sName, True
+
+	def _run(self,
+		value: any,
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> bool:
+		"""Run
+
+		Checks a value by walking it, checking each of the instances the \
+		walk yields with _valid, and returns the result. Child classes which \
+		implement _walk use it as their _valid
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
+
+		Returns:
+			bool
+		"""
+		oWalk = self._walk(value, ignore_missing, level, failures, fail_fast)
+		fSend = oWalk.send
+		try:
+			o, v, b = next(oWalk)
+			while True:
+				o, v, b = fSend(
+					o._valid(v, ignore_missing, level, failures, b)
+				)
+		except StopIteration as e:
+			return e.value
+
+	def _share(self, share: callable) -> None:
+		"""Share
+
+		Called by define.intern to replace every instance held by this one \
+		with the shared instance returned by share. Child classes which hold \
+		other instances override it
+
+		Arguments:
+			share (callable): Returns the shared instance of the one passed
+
+		Returns:
+			None
+		"""
+		pass
+
+	def _state(self) -> dict:
+		"""State
+
+		Returns the value of every slot, and of any attribute added by a \
+		child class without slots, but without the failures of the last call \
+		to valid, which are only kept for the current thread
+
+		Returns:
+			dict
+		"""
+
+		# If we don't have the names of the slots of the class yet
+		oClass = type(self)
+		try:
+			lNames = Base.__slot_names[oClass]
+		except KeyError:
+
+			# Go through the slots of every class it extends
+			lNames = []
+			for o in oClass.__mro__:
+				for s in o.__dict__.get('__slots__', ()):
+
+					# Skip the weak references, and anything only kept for
+					#	this process
+					if s in ('__readonly', '__weakref__', '_failures'):
+						continue
+
+					# If the name is private, use the name Python stores it as
+					if s[:2] == '__' and s[-2:] != '__':
+						s = '_%s%s' % (o.__name__.lstrip('_'), s)
+					lNames.append(s)
+
+			# Store them for next time
+			Base.__slot_names[oClass] = lNames
+
+		# Init the state with the failures dropped
+		dRet = { '_Base__readonly': None, '_failures': None }
+
+		# Store the value of every slot that's set
+		for s in lNames:
+			try:
+				dRet[s] = getattr(self, s)
+			except AttributeError:
+				pass
+
+		# Add any attributes not in slots and return the state
+		if hasattr(self, '__dict__'):
+			dRet.update(self.__dict__)
+		return dRet
+
+	def _store_failures(self, failures: list[list[str]]) -> None:
+		"""Store Failures
+
+		Stores the failures of the last call to valid for the current thread
+
+		Arguments:
+			failures (list): The list of [field, error] failures
+
+		Returns:
+			None
+		"""
+
+		# If we don't have a place to store the failures for each thread yet
+		if self._failures is None:
+			with Base.__lock:
+				if self._failures is None:
+					self._failures = threading.local()
+
+		# Store the failures for the current thread
+		self._failures.last = failures
+
+	def _valid_column(self,
+		column: any,
+		ignore_missing: bool,
+		level: list[str],
+		failures: dict[int, list[list[str]]]
+	) -> set[int]:
+		"""Valid Column
+
+		Checks every value in a column, adding the failures of each invalid \
+		row to the dict passed, and returns the set of invalid rows. Child \
+		classes which can't check a column any faster fall back on checking \
+		each row with _valid
+
+		Arguments:
+			column (list | array): The values of every row
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the values from the top of the structure
+			failures (dict): The failures by row to add to
+
+		Returns:
+			set[int]
+		"""
+
+		# If we got an array type, get the values as python types
+		if hasattr(column, 'tolist'):
+			column = column.tolist()
+
+		# Go through each row and check it
+		seInvalid = set()
+		lFailures = []
+		for i, v in enumerate(column):
+			if not self._valid(v, ignore_missing, level, lFailures, False):
+				failures.setdefault(i, []).extend(lFailures)
+				seInvalid.add(i)
+			del lFailures[:]
+
+		# Return the invalid rows
+		return seInvalid
+
+	async def avalidate_cooperative(self,
+		value: any,
+		ignore_missing = False,
+		level: list[str] = undefined,
+		fail_fast = False,
+		every: int = 1000
+	) -> Result:
+		"""Async Validate Cooperative
+
+		Checks if a value is valid exactly as validate does, in the event \
+		loop, but gives other tasks a turn after every so many checks so that \
+		large values don't block them
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			level (list): Optional, the keys to the value from the top of the \
+				structure
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+			every (uint): Optional, the number of checks between each turn
+
+		Raises:
+			ValueError
+
+		Returns:
+			Result
+		"""
+
+		# Validate the value using a new list of failures
+		lFailures = []
+		bRet = await self._avalid(
+			value,
+			ignore_missing,
+			level is undefined and [] or level[:],
+			lFailures,
+			fail_fast,
+			Steps(every)
+		)
+
+		# If we only want the first failure, drop any others added alongside
+		if fail_fast:
+			del lFailures[1:]
+
+		# Return the result
+		return Result(bRet, lFailures)
+
 	def class_name(self):
 		"""Class Name
 
@@ -123,7 +620,33 @@ class Base(abc.ABC):
 		Returns:
 			str
 		"""
-		return self.__class
+		return self.__class__.__name__
+
+	@abc.abstractmethod
+	def _valid(self,
+		value: any,
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> bool:
+		"""Valid
+
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed. Must not store anything on the instance
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
+
+		Returns:
+			bool
+		"""
+		pass
 
 	@abc.abstractmethod
 	def clean(self, value: any, level: list[str]):
@@ -142,8 +665,35 @@ class Base(abc.ABC):
 		"""
 		pass
 
+	def clean_many(self, values: Iterable) -> Results:
+		"""Clean Many
+
+		Cleans every value in a batch, keeping the errors of the values that \
+		fail by their position instead of stopping at the first one
+
+		Arguments:
+			values (iterable): The values to clean
+
+		Returns:
+			Results
+		"""
+		return Results.clean(self.clean, values, [])
+
+	def compile(self) -> Compiled:
+		"""Compile
+
+		Generates specialised Python functions for the instance, with all the \
+		type checks resolved ahead of time, and returns an object which can \
+		validate values the same way the instance does, only faster. The \
+		result is not updated if the instance is modified afterwards
+
+		Returns:
+			Compiled
+		"""
+		return Compiled(self)
+
 	@classmethod
-	def create(cls, details: dict, name: str = None):
+	def create(cls, details: dict, name: str = None, lazy: bool = False):
 		"""Create
 
 		Figure out the child node type necessary and create an instance of it
@@ -151,6 +701,8 @@ class Base(abc.ABC):
 		Arguments:
 			details (dict): An object describing a data point
 			name (str): The name if it's a field of another Define
+			lazy (bool): Optional, set to True to create Parents which only \
+				create their nodes the first time they are used
 
 		Returns:
 			any
@@ -177,12 +729,18 @@ class Base(abc.ABC):
 			# Else, if we have a type
 			if '__type__' in details:
 
+				# If the __type__ is an array with a discriminator, the options
+				#	need the rest of the details
+				if isinstance(details['__type__'], list) and \
+					'__discriminator__' in details:
+					return cls.__classes['__options__'](details, False, name)
+
 				# If the __type__ is an object or an array, it's a complex type
-				if isinstance(details['__type__'], dict) or \
+				elif isinstance(details['__type__'], dict) or \
 					isinstance(details['__type__'], list):
 
 					# And we need to use the __type__ as the details
-					return cls.create(details['__type__'], name)
+					return cls.create(details['__type__'], name, lazy)
 
 				# Else it's just a Node
 				else:
@@ -190,7 +748,9 @@ class Base(abc.ABC):
 
 			# Else it's most likely a parent
 			else:
-				return cls.__classes['__parent__'](details, False, name)
+				return cls.__classes['__parent__'](
+					details, False, name, lazy
+				)
 
 		# Else if we got a string, use the value as the type, and create a node
 		elif isinstance(details, str):
@@ -204,32 +764,86 @@ class Base(abc.ABC):
 				str(details)
 			))
 
+	def freeze(self) -> 'Base':
+		"""Freeze
+
+		Stops the instance from being changed by any of its setters so that \
+		it can be safely shared. Child classes which hold other instances \
+		freeze them as well. Freezing can not be undone
+
+		Returns:
+			Base
+		"""
+		self._frozen = True
+		return self
+
 	@classmethod
-	def from_file(cls, filename: str, extend: dict | TL[False] = False):
+	def from_file(cls,
+		filename: str,
+		extend: dict | TL[False] = False,
+		cached: bool = True
+	):
 		"""From File
 
-		Loads a JSON file and creates a Node instance from it
+		Loads a JSON file and creates a Node instance from it. By default the \
+		instance comes from the process wide cache, and is frozen as it's \
+		shared by every caller, until the file changes
 
 		Arguments:
 			filename (str): The filename to load,
 			extend (dict | False): Optional, a dictionary to extend the \
 				definition
+			cached (bool): Optional, set to False to always load the file and \
+				create a new instance which can be changed
 
 		Returns:
 			Base
 		"""
 
+		# If we can use the cache
+		if cached:
+			return cache.instance(cls, filename, extend)
+
 		# Load the file as a dict
 		dDetails = jsonb.load(filename)
 
 		# Create and return the new instance
 		return cls(dDetails, extend)
 
+	def frozen(self) -> bool:
+		"""Frozen
+
+		Returns whether the instance is frozen and can no longer be changed
+
+		Returns:
+			bool
+		"""
+		return self._frozen
+
+	def is_valid(self, value: any, ignore_missing = False) -> bool:
+		"""Is Valid
+
+		Checks if a value is valid based on the instance's values and returns \
+		the same result as valid, but without recording any failures or \
+		building any of their paths. Use it when only the result matters
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+
+		Returns:
+			bool
+		"""
+		return self._valid(value, ignore_missing, [], None, True)
+
 	@staticmethod
 	def make_details(details: dict | str, extend: dict):
 		"""Make Details
 
-		Common function for merging the `details` with `extend`
+		Common function for merging the `details` with `extend`. Only the top \
+		level of the details, and the dicts changed by the extend, are copied, \
+		everything else is shared with the original, so constructors must \
+		never change anything below the top level of the dict returned
 
 		Arguments:
 			details (dict | str): Definition, or path to the file containing it
@@ -242,8 +856,9 @@ class Base(abc.ABC):
 		# If the details are a string
 		if isinstance(details, str):
 
-			# Consider it a filepath and load the file
-			details = jsonb.load(details)
+			# Consider it a filepath and load the file, or get it from the
+			#	cache
+			details = cache.details(details)
 
 		# If details is not a dict instance
 		if not isinstance(details, dict):
@@ -252,12 +867,12 @@ class Base(abc.ABC):
 		# Init the return
 		dReturn: dict = None
 
-		# If we have no extend at all
-		if extend is undefined:
+		# If we have no extend at all, or it's false
+		if extend is undefined or extend is False:
 
-			# Make a copy of the details so we don't screw up the original
+			# Make a copy of the top level so we don't screw up the original
 			#	object
-			dReturn = clone(details)
+			dReturn = dict(details)
 
 		# Else, we have an extend value
 		else:
@@ -266,14 +881,8 @@ class Base(abc.ABC):
 			if isinstance(extend, dict):
 
 				# Store the details by making a new object from the details and
-				#	the extend
-				dReturn = combine(details, extend)
-
-			# Else, if it's false
-			elif extend == False:
-
-				# Just use the details as is, don't copy it
-				dReturn = details
+				#	the extend, sharing anything the extend doesn't change
+				dReturn = _overlay(details, extend)
 
 			# Else, we got some sort of invalid value for extend
 			else:
@@ -300,6 +909,9 @@ class Base(abc.ABC):
 		Arguments:
 			value (bool): If set, the method is a setter
 
+		Raises:
+			RuntimeError
+
 		Returns:
 			bool | None
 		"""
@@ -308,8 +920,9 @@ class Base(abc.ABC):
 		if value is None:
 			return self._optional
 
-		# Else, set the flag
+		# Else, set the flag, if we can
 		else:
+			self._check_frozen()
 			self._optional = value and True or False
 
 	@classmethod
@@ -339,7 +952,11 @@ class Base(abc.ABC):
 		# Store the new constructor
 		cls.__classes[s] = cls
 
-	def special(self, name: str, default: any = None) -> any:
+	def special(self,
+		name: str,
+		default: any = None,
+		readonly: bool = False
+	) -> any:
 		"""Special
 
 		Get special values associated with nodes
@@ -348,6 +965,10 @@ class Base(abc.ABC):
 			name (str): The name of the value to either get
 			default (any): The default value. Returned if the special field \
 				doesn't exist
+			readonly (bool): Optional, set to True to get a read-only view \
+				of the value, dicts as mappingproxy and lists as tuples, \
+				created once and returned as is to every caller, instead of \
+				a copy made on every call
 
 		Raises:
 			TypeError: If the name is not a valid string
@@ -357,6 +978,13 @@ class Base(abc.ABC):
 			Returns the special value, or the default
 		"""
 
+		# If we want the read-only view, and it already exists, return it
+		if readonly:
+			try:
+				return self.__readonly[name]
+			except (KeyError, TypeError):
+				pass
+
 		# Check the name is a string
 		if not isinstance(name, str):
 			raise TypeError('name must be a string')
@@ -367,12 +995,27 @@ class Base(abc.ABC):
 				'special name must match "%s"' % constants.special['syntax']
 			)
 
-		# Return the value or the default
+		# If there are no specials
+		if self.__special is None:
+			return default
+
+		# If the value doesn't exist, return the default
 		try:
-			return copy.deepcopy(self.__special[name])
+			mValue = self.__special[name]
 		except KeyError:
 			return default
 
+		# If we want a copy, return one
+		if not readonly:
+			return copy.deepcopy(mValue)
+
+		# Create the read-only view, store it, and return it
+		mValue = _readonly(mValue)
+		if self.__readonly is None:
+			self.__readonly = {}
+		self.__readonly[name] = mValue
+		return mValue
+
 	def special_set(self, name: str, value: any) -> bool:
 		"""Special
 
@@ -385,6 +1028,7 @@ class Base(abc.ABC):
 				converted directly to JSON
 
 		Raises:
+			RuntimeError: If the instance is frozen
 			TypeError: If the name is not a valid string
 			ValueError: If the name is invalid, or if setting and the value \
 				can not be converted to JSON
@@ -393,6 +1037,9 @@ class Base(abc.ABC):
 			None
 		"""
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# Check the name is a string
 		if not isinstance(name, str):
 			raise TypeError('name must be a string')
@@ -412,8 +1059,12 @@ class Base(abc.ABC):
 				sys._getframe().f_code.co_name
 			))
 
-		# Save it
-		self.__special[name] = value
+		# Save it, and drop any read-only view of the previous value
+		if self.__special is None:
+			self.__special = {}
+		self.__special[name] = copy.deepcopy(value)
+		if self.__readonly is not None:
+			self.__readonly.pop(name, None)
 
 	def to_dict(self):
 		"""To Dict
@@ -433,8 +1084,9 @@ class Base(abc.ABC):
 			dRet['__optional__'] = True
 
 		# Add all the special fields found
-		for k in self.__special.keys():
-			dRet['__%s__' % k] = self.__special[k]
+		if self.__special:
+			for k in self.__special.keys():
+				dRet['__%s__' % k] = self.__special[k]
 
 		# Return
 		return dRet
@@ -449,32 +1101,134 @@ class Base(abc.ABC):
 		"""
 		return jsonb.encode(self.to_dict())
 
-	@abc.abstractmethod
 	def valid(self,
 		value: any,
 		ignore_missing = False,
-		level: list[str] = undefined
+		level: list[str] = undefined,
+		fail_fast = False
 	) -> bool:
 		"""Valid
 
-		Checks if a value is valid based on the instance's values
+		Checks if a value is valid based on the instance's values. If any \
+		errors occur, they can be found in [instance].validation_failures as a \
+		list
 
-		Args:
-			value (mixed): The value to validate
+		Arguments:
+			value (any): The value to validate
 			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			level (list): Optional, the keys to the value from the top of the \
+				structure
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
 
 		Returns:
 			bool
 		"""
-		pass
+
+		# If the level is not passed, else copy it as keys are added to it
+		#	while validating
+		if level is undefined:
+			level = []
+		else:
+			level = level[:]
+
+		# Validate the value using a new list of failures
+		lFailures = []
+		bRet = self._valid(value, ignore_missing, level, lFailures, fail_fast)
+
+		# If we only want the first failure, drop any others added alongside
+		if fail_fast:
+			del lFailures[1:]
+
+		# Store the failures for the current thread and return the result
+		self._store_failures(lFailures)
+		return bRet
+
+	def valid_many(self,
+		values: Iterable,
+		ignore_missing = False,
+		level: list[str] = undefined,
+		fail_fast = False
+	) -> Results:
+		"""Valid Many
+
+		Checks if every value in a batch is valid and returns whether each \
+		one was, along with the failures of the invalid ones by position. \
+		Nothing is stored on the instance
+
+		Arguments:
+			values (iterable): The values to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			level (list): Optional, the keys to the values from the top of the \
+				structure
+			fail_fast (bool): Optional, set to True to stop each value at, and \
+				only return, its first failure
+
+		Returns:
+			Results
+		"""
+		return Results.validate(
+			self._valid,
+			values,
+			ignore_missing,
+			level is undefined and [] or level[:],
+			fail_fast
+		)
+
+	def validate(self,
+		value: any,
+		ignore_missing = False,
+		level: list[str] = undefined,
+		fail_fast = False
+	) -> Result:
+		"""Validate
+
+		Checks if a value is valid based on the instance's values and returns \
+		the result along with any failures. Nothing is stored on the instance, \
+		so the same instance can validate several values at once, from any \
+		number of threads
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			level (list): Optional, the keys to the value from the top of the \
+				structure
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+
+		Returns:
+			Result
+		"""
+
+		# If the level is not passed, else copy it as keys are added to it
+		#	while validating
+		if level is undefined:
+			level = []
+		else:
+			level = level[:]
+
+		# Validate the value using a new list of failures
+		lFailures = []
+		bRet = self._valid(value, ignore_missing, level, lFailures, fail_fast)
+
+		# If we only want the first failure, drop any others added alongside
+		if fail_fast:
+			del lFailures[1:]
+
+		# Return the result
+		return Result(bRet, lFailures)
 
 	@property
 	def validation_failures(self) -> list[list[str]]:
 		"""Validation Failures
 
-		Returns the last failures as a property so they can't be overwritten
+		Returns the failures of the last call to valid made by the current \
+		thread. Kept for compatibility, validate returns the failures directly
 
 		Returns:
 			[field, error][]
 		"""
-		return self._validation_failures
\ No newline at end of file
+		try:
+			return self._failures.last
+		except AttributeError:
+			return None
\ No newline at end of file
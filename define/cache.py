@@ -0,0 +1,229 @@
+# coding=utf8
+"""Cache
+
+Process wide cache of the definitions loaded from files, so that the same \
+file is only read, and its instances only built, once for as long as it \
+doesn't change
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['details', 'instance', 'invalidate', 'maxsize', 'stats']
+
+# Ouroboros imports
+import jsonb
+import undefined
+
+# Python imports
+from collections import OrderedDict
+import json
+import os
+import threading
+from typing import Literal as TL
+
+# The entries, from least to most recently used, and the lock to change them
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+# The most entries kept at once
+_maxsize = 256
+
+# The number of times an entry was, or wasn't, found
+_hits = 0
+_misses = 0
+
+def _get(key: tuple, load: callable) -> any:
+	"""Get
+
+	Returns the entry stored under the key, or loads and stores it if there \
+	isn't one yet. Loading is done outside of the lock so that one slow file \
+	doesn't hold up the others
+
+	Arguments:
+		key (tuple): The key of the entry
+		load (callable): Called without arguments to load the entry
+
+	Returns:
+		any
+	"""
+	global _hits, _misses
+
+	# If we have the entry, mark it as the most recently used and return it
+	with _lock:
+		if key in _entries:
+			_hits += 1
+			_entries.move_to_end(key)
+			return _entries[key]
+		_misses += 1
+
+	# Load the entry
+	mEntry = load()
+
+	# Store it, unless another thread beat us to it, and drop the least
+	#	recently used entries if we have too many
+	with _lock:
+		mEntry = _entries.setdefault(key, mEntry)
+		_entries.move_to_end(key)
+		while len(_entries) > _maxsize:
+			_entries.popitem(last = False)
+
+	# Return the entry
+	return mEntry
+
+def _key(filename: str) -> tuple[str, int, int]:
+	"""Key
+
+	Returns the absolute path of the file, along with its modified time and \
+	size, so that any change to the file is a new key
+
+	Arguments:
+		filename (str): The path to the file
+
+	Raises:
+		OSError
+
+	Returns:
+		tuple[str, int, int]
+	"""
+	sPath = os.path.abspath(os.path.expanduser(filename))
+	oStat = os.stat(sPath)
+	return sPath, oStat.st_mtime_ns, oStat.st_size
+
+def details(filename: str) -> dict:
+	"""Details
+
+	Returns the data loaded from a JSON definition file. The same dict is \
+	returned to every caller, so it must be copied before anything changes it
+
+	Arguments:
+		filename (str): The path to the file
+
+	Raises:
+		OSError, ValueError
+
+	Returns:
+		dict
+	"""
+	t = _key(filename)
+	return _get((None,) + t, lambda: jsonb.load(t[0]))
+
+def instance(
+	cls: type,
+	filename: str,
+	extend: dict | TL[False] = False
+) -> 'Base':
+	"""Instance
+
+	Returns the instance of the class created from a JSON definition file and \
+	the extend. The instance is frozen as it is shared with every caller
+
+	Arguments:
+		cls (type): The class to create, Tree, Parent, etc
+		filename (str): The path to the file
+		extend (dict | False): Optional, a dictionary to extend the \
+			definition
+
+	Raises:
+		KeyError, OSError, ValueError
+
+	Returns:
+		Base
+	"""
+
+	# Get the key of the file, and a fingerprint of the extend
+	t = _key(filename)
+	sExtend = json.dumps(extend, sort_keys = True, default = repr)
+
+	# Return the instance, creating it if necessary
+	return _get(
+		(cls, sExtend) + t,
+		lambda: cls(jsonb.load(t[0]), extend).freeze()
+	)
+
+def invalidate(filename: str = undefined) -> int:
+	"""Invalidate
+
+	Removes every entry of a file from the cache, or every entry if no file \
+	is passed, and returns the number removed
+
+	Arguments:
+		filename (str): Optional, the path to the file
+
+	Returns:
+		uint
+	"""
+
+	# If there's no file, clear everything
+	with _lock:
+		if filename is undefined:
+			iCount = len(_entries)
+			_entries.clear()
+			return iCount
+
+		# Else, find every entry with the same path and remove them
+		sPath = os.path.abspath(os.path.expanduser(filename))
+		lKeys = [t for t in _entries if t[-3] == sPath]
+		for t in lKeys:
+			del _entries[t]
+		return len(lKeys)
+
+def maxsize(size: int = undefined) -> int | None:
+	"""Max Size
+
+	Getter/Setter for the most entries kept in the cache at once. Setting a \
+	smaller size drops the least recently used entries right away
+
+	Arguments:
+		size (uint): Optional, if set, the method is a setter
+
+	Raises:
+		ValueError
+
+	Returns:
+		uint | None
+	"""
+	global _maxsize
+
+	# If size is not set, this is a getter
+	if size is undefined:
+		return _maxsize
+
+	# If it's invalid
+	if not isinstance(size, int) or size < 0:
+		raise ValueError('size must be an unsigned integer')
+
+	# Store the size, and drop anything over it
+	with _lock:
+		_maxsize = size
+		while len(_entries) > _maxsize:
+			_entries.popitem(last = False)
+
+def stats(reset: bool = False) -> dict:
+	"""Stats
+
+	Returns the number of hits and misses, along with the current and \
+	maximum number of entries
+
+	Arguments:
+		reset (bool): Optional, set to True to reset the hits and misses \
+			after getting them
+
+	Returns:
+		dict
+	"""
+	global _hits, _misses
+	with _lock:
+		dRet = {
+			'hits': _hits,
+			'misses': _misses,
+			'size': len(_entries),
+			'maxsize': _maxsize
+		}
+		if reset:
+			_hits = 0
+			_misses = 0
+	return dRet
@@ -0,0 +1,432 @@
+# coding=utf8
+"""Compiler
+
+Turns a Define instance into specialised Python functions so that validating \
+and cleaning no longer have to walk the instances or re-check the type of \
+every Node
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['Compiled', 'Generator']
+
+# Ouroboros imports
+import jsonb
+import undefined
+
+# Python imports
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation as DecimalInvalid
+import threading
+from typing import Iterable
+
+# Local imports
+from define.level import join
+from define.result import Result, Results
+
+class Generator(object):
+	"""Generator
+
+	Collects the source and the constants of the functions generated by each \
+	Define instance so they can be compiled together into a single module
+	"""
+
+	def __init__(self):
+		"""Constructor
+
+		Initialises the instance
+
+		Returns:
+			Generator
+		"""
+
+		# Init the statements run after the functions are defined
+		self._assignments = []
+
+		# Init the count used to make unique names
+		self._count = 0
+
+		# Init the functions already generated, by kind and instance
+		self._functions = {}
+
+		# Init the lines of source
+		self._lines = []
+
+		# Init the globals available to the generated functions
+		self._namespace = {
+			'Decimal': Decimal,
+			'DecimalInvalid': DecimalInvalid,
+			'date': date,
+			'datetime': datetime,
+			'join': join,
+			'jsonb': jsonb,
+			'time': time
+		}
+
+	def assign(self, source: str) -> str:
+		"""Assign
+
+		Adds a statement which stores the result of the source under a new \
+		name once all the functions have been defined, and returns the name. \
+		Useful for values which reference the generated functions
+
+		Arguments:
+			source (str): The Python expression to store
+
+		Returns:
+			str
+		"""
+
+		# Generate a new name and add the assignment
+		sName = self.unique('_c')
+		self._assignments.append('%s = %s' % (sName, source))
+
+		# Return the name
+		return sName
+
+	def clean(self, node: 'Base') -> str:
+		"""Clean
+
+		Returns the name of the function which cleans values for the given \
+		instance, generating it if it doesn't exist yet
+
+		Arguments:
+			node (Base): The instance to generate the function for
+
+		Returns:
+			str
+		"""
+
+		# If we haven't generated the instance yet
+		try:
+			return self._functions[('clean', id(node))]
+		except KeyError:
+			self._functions[('clean', id(node))] = node._compile_clean(self)
+			return self._functions[('clean', id(node))]
+
+	def constant(self, value: any) -> str:
+		"""Constant
+
+		Stores a value so that generated functions can access it directly by \
+		name and returns the name
+
+		Arguments:
+			value (any): The value to store
+
+		Returns:
+			str
+		"""
+
+		# Generate a new name and store the value under it
+		sName = self.unique('_c')
+		self._namespace[sName] = value
+
+		# Return the name
+		return sName
+
+	def function(self, name: str, args: str, body: list[str]) -> None:
+		"""Function
+
+		Adds the source of a new function to the module
+
+		Arguments:
+			name (str): The name of the function
+			args (str): The arguments of the function
+			body (list): The lines of the function, without indentation
+
+		Returns:
+			None
+		"""
+
+		# Add the definition and the indented body
+		self._lines.append('def %s(%s):' % (name, args))
+		for s in body:
+			self._lines.append('\t%s' % s)
+		self._lines.append('')
+
+	def module(self, filename: str) -> dict:
+		"""Module
+
+		Compiles all the source generated and returns the namespace containing \
+		the resulting functions
+
+		Arguments:
+			filename (str): The name to associate with the code in tracebacks
+
+		Returns:
+			dict
+		"""
+		exec(compile(self.source, filename, 'exec'), self._namespace)
+		return self._namespace
+
+	@property
+	def source(self) -> str:
+		"""Source
+
+		Returns the source of all the functions generated
+
+		Returns:
+			str
+		"""
+		return '\n'.join(self._lines + self._assignments)
+
+	def unique(self, prefix: str) -> str:
+		"""Unique
+
+		Returns a name that has not been used in the module yet
+
+		Arguments:
+			prefix (str): The start of the name
+
+		Returns:
+			str
+		"""
+		self._count += 1
+		return '%s%d' % (prefix, self._count)
+
+	def valid(self, node: 'Base') -> tuple[str, bool]:
+		"""Valid
+
+		Returns the name of the function which validates the given instance, \
+		as well as whether it can return True while still adding failures, \
+		generating it if it doesn't exist yet
+
+		Arguments:
+			node (Base): The instance to generate the function for
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# If we haven't generated the instance yet
+		try:
+			return self._functions[('valid', id(node))]
+		except KeyError:
+			self._functions[('valid', id(node))] = node._compile_valid(self)
+			return self._functions[('valid', id(node))]
+
+class Compiled(object):
+	"""Compiled
+
+	Holds the generated functions for a Define instance and offers the same \
+	interface to validate and clean values as the instance itself
+	"""
+
+	def __init__(self, definition: 'Base', level: list[str] = undefined):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			definition (Base): The Define instance to compile
+			level (list): Optional, the level the instance is validated at
+
+		Returns:
+			Compiled
+		"""
+
+		# Store the definition and the level
+		self._definition = definition
+		self._level = level is undefined and [] or level
+
+		# Generate the functions
+		oGen = Generator()
+		sValid, _ = oGen.valid(definition)
+		sClean = oGen.clean(definition)
+
+		# Compile the source and store the main functions
+		self._source = oGen.source
+		dModule = oGen.module('<define.compiled %s>' % definition.class_name())
+		self._valid = dModule[sValid]
+		self._clean = dModule[sClean]
+
+		# Init the storage of the last failures generated in valid, by thread
+		self._failures = threading.local()
+
+	def __repr__(self):
+		"""Representation (__repr__)
+
+		Returns a string representation of the instance
+
+		Returns:
+			str
+		"""
+		return '<Compiled: %s>' % repr(self._definition)
+
+	def clean(self, value: any) -> any:
+		"""Clean
+
+		Cleans and returns the value exactly as the definition's clean would
+
+		Arguments:
+			value (any): The value to clean
+
+		Raises:
+			ValueError
+
+		Returns:
+			any
+		"""
+		return self._clean(value, [])
+
+	def clean_many(self, values: Iterable) -> Results:
+		"""Clean Many
+
+		Cleans every value in a batch, keeping the errors of the values that \
+		fail by their position instead of stopping at the first one
+
+		Arguments:
+			values (iterable): The values to clean
+
+		Returns:
+			Results
+		"""
+		return Results.clean(self._clean, values, [])
+
+	@property
+	def definition(self) -> 'Base':
+		"""Definition
+
+		Returns the Define instance the functions were generated from
+
+		Returns:
+			Base
+		"""
+		return self._definition
+
+	def is_valid(self, value: any, ignore_missing = False) -> bool:
+		"""Is Valid
+
+		Checks if a value is valid based on the definition and returns the \
+		same result as valid, but without recording any failures or building \
+		any of their paths
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+
+		Returns:
+			bool
+		"""
+		return self._valid(value, ignore_missing, [], None, True)
+
+	@property
+	def source(self) -> str:
+		"""Source
+
+		Returns the Python source generated for the definition
+
+		Returns:
+			str
+		"""
+		return self._source
+
+	def valid(self,
+		value: any,
+		ignore_missing = False,
+		fail_fast = False
+	) -> bool:
+		"""Valid
+
+		Checks if a value is valid based on the definition. If any errors \
+		occur, they can be found in [instance].validation_failures as a list
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+
+		Returns:
+			bool
+		"""
+
+		# Call the generated function using a new list of failures
+		lFailures = []
+		bRet = self._valid(
+			value, ignore_missing, self._level[:], lFailures, fail_fast
+		)
+
+		# If we only want the first failure, drop any others added alongside
+		if fail_fast:
+			del lFailures[1:]
+
+		# Store the failures for the current thread and return the result
+		self._failures.last = lFailures
+		return bRet
+
+	def valid_many(self,
+		values: Iterable,
+		ignore_missing = False,
+		fail_fast = False
+	) -> Results:
+		"""Valid Many
+
+		Checks if every value in a batch is valid and returns whether each \
+		one was, along with the failures of the invalid ones by position
+
+		Arguments:
+			values (iterable): The values to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop each value at, and \
+				only return, its first failure
+
+		Returns:
+			Results
+		"""
+		return Results.validate(
+			self._valid, values, ignore_missing, self._level[:], fail_fast
+		)
+
+	def validate(self,
+		value: any,
+		ignore_missing = False,
+		fail_fast = False
+	) -> Result:
+		"""Validate
+
+		Checks if a value is valid based on the definition and returns the \
+		result along with any failures. Safe to call from any number of \
+		threads at once
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+
+		Returns:
+			Result
+		"""
+
+		# Call the generated function using a new list of failures
+		lFailures = []
+		bRet = self._valid(
+			value, ignore_missing, self._level[:], lFailures, fail_fast
+		)
+
+		# If we only want the first failure, drop any others added alongside
+		if fail_fast:
+			del lFailures[1:]
+
+		# Return the result
+		return Result(bRet, lFailures)
+
+	@property
+	def validation_failures(self) -> list[list[str]]:
+		"""Validation Failures
+
+		Returns the failures of the last call to valid made by the current \
+		thread. Kept for compatibility, validate returns the failures directly
+
+		Returns:
+			[field, error][]
+		"""
+		try:
+			return self._failures.last
+		except AttributeError:
+			return None
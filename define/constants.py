@@ -30,8 +30,9 @@ special = jobject({
 	'key': _re.compile('^__(%s)__$' % _special_syntax),
 	'name': _re.compile('^%s$' % _special_syntax),
 	'reserved': [
-		'__array__', '__hash__', '__maximum__', '__minimum__', '__name__',
-		'__options__', '__regex__', '__require__', '__type__'
+		'__array__', '__discriminator__', '__hash__', '__maximum__',
+		'__minimum__', '__name__', '__options__', '__regex__', '__require__',
+		'__type__'
 	]
 })
 standard = _re.compile('^_?[a-zA-Z0-9][a-zA-Z0-9_-]*$')
@@ -16,10 +16,12 @@ __all__ = ['Hash']
 import undefined
 
 # Python imports
-from typing import Literal as TL
+from typing import Generator as TG, Literal as TL
 
 # Local imports
 from define.base import Base
+from define.compiler import Generator
+from define.level import join
 from define.node import Node
 
 class Hash(Base):
@@ -32,6 +34,8 @@ class Hash(Base):
 		Base
 	"""
 
+	__slots__ = ('_key', '_node')
+
 	def __init__(self,
 		details: dict,
 		extend: dict | TL[False] = False,
@@ -81,6 +85,147 @@ class Hash(Base):
 		# Store the child
 		self._node = self.create(dDetails, '%s|node' % name)
 
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
+
+		Returns the exact Python types of the values the instance could be \
+		valid for
+
+		Returns:
+			frozenset | None
+		"""
+
+		# If a child class changed how values are validated, it can't tell
+		if type(self)._valid is not Hash._valid:
+			return None
+		return frozenset([dict])
+
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
+
+		Generates a function which cleans values exactly like clean does, \
+		calling the functions generated for the key and child node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			str
+		"""
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_error('dict', 'not a valid object')
+
+		# Go through each key and clean both it and the value
+		lLines.extend([
+			'lErrors = []',
+			'dRet = {}',
+			'for k, v in value.items():',
+			'\tlLevel = level + [str(k)]',
+			'\ttry:',
+			'\t\tdRet[str(%s(k, %s))] = %s(v, lLevel)' % (
+				gen.clean(self._key), gen.constant([]), gen.clean(self._node)
+			),
+			'\texcept ValueError as e:',
+			'\t\tif isinstance(e.args[0], list):',
+			'\t\t\tlErrors.extend(e.args[0])',
+			'\t\telse:',
+			'\t\t\tlErrors.append([join(lLevel), str(e)])',
+			'if lErrors:',
+			'\traise ValueError(lErrors)',
+			'return dRet'
+		])
+
+		# Add the function
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', lLines)
+
+		# Return the name
+		return sName
+
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
+
+		Generates a function which validates values exactly like valid does, \
+		calling the functions generated for the key and child node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Get the functions for the key and the child node
+		sKey, _ = gen.valid(self._key)
+		sValid, bDirty = gen.valid(self._node)
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_missing()
+		lLines.append('if not isinstance(value, dict):')
+		lLines.extend(self._compile_fail('not a valid object', 1))
+
+		# Go through each key and value, the failures of the key are never
+		#	kept
+		lLines.extend([
+			'bRet = True',
+			'for k, v in value.items():',
+			'\tiFailures = failures and len(failures) or 0',
+			'\tbKey = %s(k, False, level, failures, True)' % sKey,
+			'\tif failures:',
+			'\t\tdel failures[iFailures:]',
+			'\tif not bKey:',
+			'\t\tif failures is not None:',
+			'\t\t\tfailures.append([join(level + [str(k)]), ' \
+				'\'invalid key: %s\' % str(k)])',
+			'\t\tif fail_fast:',
+			'\t\t\treturn False',
+			'\t\tbRet = False',
+			'\t\tcontinue',
+			'\tlevel.append(str(k))',
+			'\tbValid = %s(v, ignore_missing, level, failures, fail_fast)' % \
+				sValid,
+			'\tlevel.pop()',
+			'\tif not bValid:',
+			'\t\tif fail_fast:',
+			'\t\t\treturn False',
+			'\t\tbRet = False'
+		])
+
+		# If the node can pass while leaving failures, drop them
+		if bDirty:
+			lLines.extend([
+				'\telse:',
+				'\t\tif failures:',
+				'\t\t\tdel failures[iFailures:]'
+			])
+
+		# Return whatever the result was
+		lLines.append('return bRet')
+
+		# Add the function
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', lLines
+		)
+
+		# Return the name, a Hash never passes with failures
+		return sName, False
+
+	def _share(self, share: callable) -> None:
+		"""Share
+
+		Replaces the nodes of the keys and values with their shared instances
+
+		Arguments:
+			share (callable): Returns the shared instance of the one passed
+
+		Returns:
+			None
+		"""
+		self._key = share(self._key)
+		self._node = share(self._node)
+
 	def child(self) -> Base:
 		"""Child
 
@@ -119,11 +264,11 @@ class Hash(Base):
 				return None
 
 			# Missing value
-			raise ValueError([['.'.join(level), 'missing']])
+			raise ValueError([[join(level), 'missing']])
 
 		# If the value is not a dict
 		if not isinstance(value, dict):
-			raise ValueError([['.'.join(level), 'not a valid object']])
+			raise ValueError([[join(level), 'not a valid object']])
 
 		# Go through each key
 		lErrors: list = []
@@ -132,21 +277,37 @@ class Hash(Base):
 
 			# Add the key to the level
 			lLevel = level[:]
-			lLevel.append(k)
+			lLevel.append(str(k))
 
 			# Try to clean the values
 			try:
 				dRet[str(self._key.clean(k))] = self._node.clean(v, lLevel)
 			except ValueError as e:
-				lErrors.extend(e.args[0])
+				if isinstance(e.args[0], list):
+					lErrors.extend(e.args[0])
+				else:
+					lErrors.append([join(lLevel), str(e)])
 
 		# If there's errors
 		if lErrors:
-			raise lErrors
+			raise ValueError(lErrors)
 
 		# Return the cleaned value
 		return dRet
 
+	def freeze(self) -> 'Hash':
+		"""Freeze
+
+		Stops the instance, and the nodes of its keys and values, from being \
+		changed so that they can be safely shared
+
+		Returns:
+			Hash
+		"""
+		self._key.freeze()
+		self._node.freeze()
+		return super(Hash, self).freeze()
+
 	def key(self) -> Node:
 		"""Key
 
@@ -182,32 +343,34 @@ class Hash(Base):
 		# Return
 		return dRet
 
-	def valid(self,
+	_valid = Base._run
+	"""Checks values by walking them with _walk"""
+
+	def _walk(self,
 		value: dict | None,
-		ignore_missing = False,
-		level: list[str] = undefined
-	) -> bool:
-		"""Valid
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> TG[tuple, bool, bool]:
+		"""Walk
 
-		Checks if a value is valid based on the instance's values. If any \
-		errors occur, they can be found in [instance].validation_failures as \
-		a list
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed, yielding its node, the value of each key, \
+		and fail_fast, to be checked, and receiving the result
 
 		Arguments:
 			value (dict | None): The value to validate
-			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
 
 		Returns:
-			bool
+			Generator
 		"""
 
-		# If the level is not set
-		if level is undefined:
-			level = []
-
-		# Reset validation failures
-		self._validation_failures = []
-
 		# If the value is None
 		if value is None:
 
@@ -216,14 +379,16 @@ class Hash(Base):
 				return True
 
 			# Invalid value
-			self._validation_failures.append(['.'.join(level), 'missing'])
+			if failures is not None:
+				failures.append([join(level), 'missing'])
 
 		# If the value isn't a dictionary
 		if not isinstance(value, dict):
-			self._validation_failures.append([
-				'.'.join(level),
-				'not a valid object'
-			])
+			if failures is not None:
+				failures.append([
+					join(level),
+					'not a valid object'
+				])
 			return False
 
 		# Init the return, assume valid
@@ -232,25 +397,38 @@ class Hash(Base):
 		# Go through each key and value
 		for k,v in value.items():
 
-			# Add the field to the level
-			lLevel = level[:]
-			lLevel.append(k)
-
-			# If the key isn't valid
-			if not self._key.valid(k):
-				self._validation_failures.append([
-					'.'.join(lLevel),
-					'invalid key: %s' % str(k)
-				])
+			# If the key isn't valid, its own failures are never kept
+			iFailures = failures and len(failures) or 0
+			bKey = self._key._valid(k, False, level, failures, True)
+			if failures:
+				del failures[iFailures:]
+			if not bKey:
+				if failures is not None:
+					failures.append([
+						join(level + [str(k)]),
+						'invalid key: %s' % str(k)
+					])
+				if fail_fast:
+					return False
 				bRet = False
 				continue
 
-			# Check the value
-			if not self._node.valid(v, ignore_missing, lLevel):
-				self._validation_failures.extend(self._node.validation_failures)
+			# Add the key to the level while the value is checked
+			level.append(str(k))
+			bValid = yield self._node, v, fail_fast
+			level.pop()
+
+			# If the value isn't valid, return false
+			if not bValid:
+				if fail_fast:
+					return False
 				bRet = False
 				continue
 
+			# Drop anything the valid value may have left behind
+			if failures:
+				del failures[iFailures:]
+
 		# Return whatever the result was
 		return bRet
 
@@ -0,0 +1,214 @@
+# coding=utf8
+"""Intern
+
+Process wide registry of frozen instances, so that structurally identical \
+definitions, even from different Trees, share a single instance
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['clear', 'instance', 'stats']
+
+# Python imports
+import hashlib
+import sys
+import threading
+import weakref
+
+# Local imports
+from define.base import Base
+
+# The shared instances by fingerprint, only kept as long as something else
+#	uses them, and the lock to change them
+_instances = weakref.WeakValueDictionary()
+_lock = threading.RLock()
+
+# The number of instances replaced by a shared one, and the bytes they used
+_shared = 0
+_saved = 0
+
+def _fingerprint(value: any) -> any:
+	"""Fingerprint
+
+	Returns a hashable value which is the same for any two values with the \
+	same structure. Instances are represented by their id, as they are always \
+	the shared instance by the time their parent is fingerprinted
+
+	Arguments:
+		value (any): The value to fingerprint
+
+	Returns:
+		any
+	"""
+
+	# If it's an instance
+	if isinstance(value, Base):
+		return id(value)
+
+	# If it's a dict, fingerprint each value, keeping the order
+	if isinstance(value, dict):
+		return (dict, tuple([(k, _fingerprint(v)) for k,v in value.items()]))
+
+	# If it's a list or tuple, fingerprint each value
+	if isinstance(value, (list, tuple)):
+		return (type(value), tuple([_fingerprint(v) for v in value]))
+
+	# Else, use the type and representation of the value
+	return (type(value), repr(value))
+
+def _objects(instance: Base) -> dict[int, any]:
+	"""Objects
+
+	Returns every object used by the instance itself, by id, without going \
+	into any of the instances it holds
+
+	Arguments:
+		instance (Base): The instance to get the objects of
+
+	Returns:
+		dict[int, any]
+	"""
+
+	# Init the objects with the instance, and its dict if a child class added
+	#	one
+	dRet = { id(instance): instance }
+	if hasattr(instance, '__dict__'):
+		dRet[id(instance.__dict__)] = instance.__dict__
+
+	# Go through every value in the state
+	lStack = list(instance._state().values())
+	while lStack:
+		m = lStack.pop()
+
+		# Skip instances, and anything already found
+		if isinstance(m, Base) or id(m) in dRet:
+			continue
+
+		# Store it, and if it holds other values, look in them
+		dRet[id(m)] = m
+		if isinstance(m, dict):
+			lStack.extend(m.keys())
+			lStack.extend(m.values())
+		elif isinstance(m, (frozenset, list, set, tuple)):
+			lStack.extend(m)
+
+	# Return the objects
+	return dRet
+
+def _share(instance: Base) -> Base:
+	"""Share
+
+	Shares the instances held by the instance, then returns the shared \
+	instance with the same structure, or the instance itself if it's the \
+	first of its kind
+
+	Arguments:
+		instance (Base): The instance to share
+
+	Returns:
+		Base
+	"""
+	global _shared, _saved
+
+	# Share everything the instance holds first
+	instance._share(_share)
+
+	# Generate the fingerprint of the instance, and store a digest of it so
+	#	the registry stays small
+	tKey = (instance.__class__, hashlib.blake2b(
+		repr(_fingerprint(instance._state())).encode(),
+		digest_size = 16
+	).digest())
+
+	# If it's the first of its kind, store and return it
+	oShared = _instances.get(tKey)
+	if oShared is None:
+		_instances[tKey] = instance
+		return instance
+
+	# If it's a different instance, count it and any memory it used that
+	#	isn't also used by the shared one
+	if oShared is not instance:
+		dShared = _objects(oShared)
+		_shared += 1
+		_saved += sum([
+			sys.getsizeof(m) for i,m in _objects(instance).items()
+			if i not in dShared
+		])
+
+	# Return the shared instance
+	return oShared
+
+def clear() -> int:
+	"""Clear
+
+	Removes every shared instance from the registry and returns the number \
+	removed. Instances already shared stay shared
+
+	Returns:
+		uint
+	"""
+	with _lock:
+		iCount = len(_instances)
+		_instances.clear()
+		return iCount
+
+def instance(instance: Base) -> Base:
+	"""Instance
+
+	Returns the shared instance with the same structure as the one passed, \
+	after replacing every instance it holds with its shared one. The \
+	instance must be frozen, as it and its children may be used by anything \
+	else interned. Use the instance returned in place of the one passed
+
+	Arguments:
+		instance (Base): The frozen instance to share
+
+	Raises:
+		ValueError
+
+	Returns:
+		Base
+	"""
+
+	# If it's not a Define instance
+	if not isinstance(instance, Base):
+		raise ValueError('instance must extend Base')
+
+	# If it's not frozen, it can't be shared
+	if not instance.frozen():
+		raise ValueError('instance must be frozen to be shared')
+
+	# Share it, and everything in it
+	with _lock:
+		return _share(instance)
+
+def stats(reset: bool = False) -> dict:
+	"""Stats
+
+	Returns the number of shared instances in the registry, the number of \
+	instances replaced by one of them, and the bytes those instances used \
+	which are freed once nothing else uses them
+
+	Arguments:
+		reset (bool): Optional, set to True to reset the replaced count and \
+			bytes after getting them
+
+	Returns:
+		dict
+	"""
+	global _shared, _saved
+	with _lock:
+		dRet = {
+			'instances': len(_instances),
+			'shared': _shared,
+			'saved': _saved
+		}
+		if reset:
+			_shared = 0
+			_saved = 0
+	return dRet
@@ -0,0 +1,31 @@
+# coding=utf8
+"""Level
+
+Helpers for the keys used to track where a value is in a structure
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['join']
+
+def join(level: list[str | int]) -> str:
+	"""Join
+
+	Turns the keys to a value into the dotted string used in failures. \
+	While validating, the level is a single list that keys are added to and \
+	removed from as the structure is walked, with array indexes stored as \
+	ints, so that the string is only generated when a failure is found
+
+	Arguments:
+		level (list): The keys, and array indexes, to the value
+
+	Returns:
+		str
+	"""
+	return '.'.join([
+		type(k) is int and '[%d]' % k or k for k in level
+	])
@@ -13,26 +13,42 @@ __created__		= "2023-03-19"
 __all__ = ['Node']
 
 # Ouroboros imports
-import jsonb
 from tools import combine
 import undefined
 
 # Python imports
-from datetime import date, datetime, time
-from decimal import Decimal, InvalidOperation as DecimalInvalid
+from decimal import Decimal
 import hashlib
 import re
 from typing import Literal as TL, Pattern
 
 # Local imports
-from define import constants
+from define import constants, strategies, validators
 from define.base import Base
+from define.compiler import Generator
+from define.level import join
 
 # There is no way to access the real type of compiled regular expressions or md5
 #	hashes so unfortunately we have to do this ugly hack
 _REGEX_TYPE	= type(constants.regex['date'])
 _MD5_TYPE = type(hashlib.md5(b'hack'))
 
+# The exact Python types, out of those which come from JSON, each type of
+#	Node can be valid for, if it's not every one of them
+_ACCEPTS = {
+	'bool': frozenset([bool, int, str]),
+	'decimal': frozenset([float, int, str]),
+	'float': frozenset([float, int, str]),
+	'int': frozenset([int, str]),
+	'price': frozenset([float, int, str]),
+	'timestamp': frozenset([int, str]),
+	'uint': frozenset([int, str])
+}
+_ACCEPTS.update({ s: frozenset([str]) for s in [
+	'base64', 'date', 'datetime', 'ip', 'md5', 'string', 'time', 'tuuid',
+	'tuuid4', 'uuid', 'uuid4'
+] })
+
 class Node(Base):
 	"""Node
 
@@ -42,6 +58,11 @@ class Node(Base):
 		Base
 	"""
 
+	__slots__ = (
+		'_check', '_clean', '_limit', '_maximum', '_minimum', '_options',
+		'_options_set', '_regex', '_type'
+	)
+
 	_VALID_TYPES = ['any', 'base64', 'bool', 'date', 'datetime', 'decimal',
 					'float', 'int', 'ip', 'json', 'md5', 'price', 'string',
 					'time', 'timestamp', 'tuuid', 'tuuid4', 'uint', 'uuid',
@@ -127,6 +148,7 @@ class Node(Base):
 		# Init the value types
 		self._regex = None
 		self._options = None
+		self._options_set = None
 		self._minimum = None
 		self._maximum = None
 
@@ -151,65 +173,62 @@ class Node(Base):
 					(bMax and details['__maximum__'] or None)
 				)
 
-	@staticmethod
-	def compare_ips(first: str, second: str) -> int:
-		"""Compare IPs
+		# Store the functions of the type
+		self._bind()
 
-		Compares two IPs and returns a status based on which is greater
-		If first is less than second: -1
-		If first is equal to second: 0
-		If first is greater than second: 1
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
 
-		Arguments:
-			first (str): A string representing an IP address
-			second (str): A string representing an IP address
+		Returns the exact Python types of the values the instance could be \
+		valid for, based on its type
 
 		Returns:
-			int
+			frozenset | None
 		"""
 
-		# If the two IPs are the same, return 0
-		if first == second:
-			return 0
-
-		# Create lists from the split of each IP, store them as ints
-		lFirst = [int(i) for i in first.split('.')]
-		lSecond = [int(i) for i in second.split('.')]
+		# If a child class changed how values are validated, it can't tell
+		if type(self)._valid is not Node._valid:
+			return None
+		return _ACCEPTS.get(self._type)
 
-		# Go through each part from left to right until we find the
-		# 	difference
-		for i in [0, 1, 2, 3]:
+	def _bind(self) -> None:
+		"""Bind
 
-			# If the part of x is greater than the part of y
-			if lFirst[i] > lSecond[i]:
-				return 1
+		Stores the functions which check and clean values of the Node's \
+		type, and the one which checks its options or min/max, so that \
+		valid and clean don't have to find them on every call
 
-			# Else if the part of x is less than the part of y
-			elif lFirst[i] < lSecond[i]:
-				return -1
+		Returns:
+			None
+		"""
+		self._check = strategies.VALID[self._type]
+		self._clean = strategies.CLEAN[self._type]
+		self._limit = strategies.limit(self)
 
-	def clean(self, value: any, level: list[str] = undefined):
-		"""Clean
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
 
-		Cleans and returns the new value
+		Generates a function which cleans values exactly like clean does, but \
+		with the conversion for the type chosen ahead of time
 
 		Arguments:
-			value {mixed} -- The value to clean
+			gen (Generator): The generator to add the function to
 
 		Returns:
-			mixed
+			str
 		"""
 
-		# If the level is not set
-		if level is undefined:
-			level = []
+		# Init the lines
+		lLines = []
 
 		# If the value is None and it's optional, return as is
-		if value is None and self._optional:
-			return None
+		if self._optional:
+			lLines.extend([
+				'if value is None:',
+				'\treturn None'
+			])
 
-		# If it's an ANY, there is no reasonable expectation that we know what
-		#	the value should be, so we return it as is
+		# If it's an ANY, we return it as is
 		if self._type == 'any':
 			pass
 
@@ -217,140 +236,432 @@ class Node(Base):
 		elif self._type in [
 			'base64', 'ip', 'string', 'tuuid', 'tuuid4', 'uuid', 'uuid4'
 		]:
-
-			# And not already a string
-			if not isinstance(value, str):
-				value = str(value)
+			lLines.extend([
+				'if not isinstance(value, str):',
+				'\treturn str(value)'
+			])
 
 		# Else if it's a BOOL just check if the value flags as positive
 		elif self._type == 'bool':
-
-			# If it's specifically a string, it needs to match a specific
-			#	pattern to be true
-			if isinstance(value, str):
-				value = (value in (
-					'true', 'True', 'TRUE', 't', 'T', 'yes', 'Yes', 'YES', 'y',
-					'Y', 'x', '1'
-				) and True or False)
-
-			# Else
-			else:
-				value = (value and True or False)
+			lLines.extend([
+				'if isinstance(value, str):',
+				'\treturn value in {\'true\', \'True\', \'TRUE\', \'t\', ' \
+					'\'T\', \'yes\', \'Yes\', \'YES\', \'y\', \'Y\', ' \
+					'\'x\', \'1\'}',
+				'return value and True or False'
+			])
 
 		# Else if it's a date type
 		elif self._type == 'date':
-
-			# If it's a python type, use strftime on it
-			if isinstance(value, (date, datetime)):
-				value = value.strftime('%Y-%m-%d')
-
-			# Else if it's already a string
-			elif isinstance(value, str):
-				pass
-
-			# Else convert it to a string
-			else:
-				value = str(value)
+			lLines.extend([
+				'if isinstance(value, (date, datetime)):',
+				'\treturn value.strftime(\'%Y-%m-%d\')',
+				'if not isinstance(value, str):',
+				'\treturn str(value)'
+			])
 
 		# Else if it's a datetime type
 		elif self._type == 'datetime':
-
-			# If it's a python type, use strftime on it
-			if isinstance(value, datetime):
-				value = value.strftime('%Y-%m-%d %H:%M:%S')
-			elif isinstance(value, date):
-				value = '%s 00:00:00' % value.strftime('%Y-%m-%d')
-
-			# Else if it's already a string
-			elif isinstance(value, str):
-				pass
-
-			# Else convert it to a string
-			else:
-				value = str(value)
+			lLines.extend([
+				'if isinstance(value, datetime):',
+				'\treturn value.strftime(\'%Y-%m-%d %H:%M:%S\')',
+				'if isinstance(value, date):',
+				'\treturn \'%s 00:00:00\' % value.strftime(\'%Y-%m-%d\')',
+				'if not isinstance(value, str):',
+				'\treturn str(value)'
+			])
 
 		# Else if it's a decimal
 		elif self._type == 'decimal':
-
-			# If it's not a decimal
-			if not isinstance(value, Decimal):
-				value = Decimal(value)
-
-			# Convert it to a string
-			value = '{0:f}'.format(value)
+			lLines.extend([
+				'if not isinstance(value, Decimal):',
+				'\tvalue = Decimal(value)',
+				'return \'{0:f}\'.format(value)'
+			])
 
 		# Else if it's a float
 		elif self._type == 'float':
-			value = float(value)
+			lLines.append('return float(value)')
 
 		# Else if it's an int type
 		elif self._type in ['int', 'timestamp', 'uint']:
-
-			# If the value is a string, convert it
-			if isinstance(value, str):
-				value = int(value, 0)
-
-			# Else if it's not an int already
-			elif not isinstance(value, int):
-				value = int(value)
+			lLines.extend([
+				'if isinstance(value, str):',
+				'\treturn int(value, 0)',
+				'if not isinstance(value, int):',
+				'\treturn int(value)'
+			])
 
 		# Else if it's a JSON type
 		elif self._type == 'json':
-
-			# If it's already a string
-			if isinstance(value, str):
-				pass
-
-			# Else, encode it
-			else:
-				value = jsonb.encode(value)
+			lLines.extend([
+				'if not isinstance(value, str):',
+				'\treturn jsonb.encode(value)'
+			])
 
 		# Else if it's an md5 type
 		elif self._type == 'md5':
+			lLines.extend([
+				'if isinstance(value, %s):' % gen.constant(_MD5_TYPE),
+				'\treturn value.hexdigest()',
+				'if not isinstance(value, str):',
+				'\treturn str(value)'
+			])
 
-			# If it's a python type, get the hexadecimal digest
-			if isinstance(value, _MD5_TYPE):
-				value = value.hexdigest()
+		# Else if it's a price type
+		elif self._type == 'price':
+			lLines.extend([
+				'if not isinstance(value, Decimal):',
+				'\tvalue = Decimal(value)',
+				'return \'{0:f}\'.format(value.quantize(%s))' % \
+					gen.constant(Decimal('1.00'))
+			])
 
-			# Else if it's a string
-			elif isinstance(value, str):
-				pass
+		# Else if it's a time type
+		elif self._type == 'time':
+			lLines.extend([
+				'if isinstance(value, (time, datetime)):',
+				'\treturn value.strftime(\'%H:%M:%S\')',
+				'if not isinstance(value, str):',
+				'\treturn str(value)'
+			])
 
-			# Else, try to convert it to a string
-			else:
-				value = str(value)
+		# Else we probably forgot to add a new type
+		else:
+			raise Exception(
+				'%s has not been added to ._compile_clean()' % self._type
+			)
 
-		# Else if it's a price type
-		elif self._type == 'price':
+		# Return the value as is
+		lLines.append('return value')
 
-			# If it's not already a Decimal
-			if not isinstance(value, Decimal):
-				value = Decimal(value)
+		# Add the function
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', lLines)
 
-			# Make sure its got 2 decimal places
-			value = "{0:f}".format(value.quantize(Decimal('1.00')))
+		# Return the name
+		return sName
 
-		# Else if it's a time type
-		elif self._type == 'time':
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
 
-			# If it's a python type, use strftime on it
-			if isinstance(value, (time, datetime)):
-				value = value.strftime('%H:%M:%S')
+		Generates a function which validates values exactly like valid does, \
+		but with the type, min/max, options, and regex resolved ahead of time
 
-			# Else if it's already a string
-			elif isinstance(value, str):
-				pass
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Start with the handling of missing values
+		lLines = self._compile_missing()
 
-			# Else convert it to a string
+		# Assume the options and min/max are checked at the end
+		bDone = False
+
+		# If we are validating an ANY field, there's nothing to check
+		if self._type == 'any':
+			pass
+
+		# If we are validating a string type checked by regex
+		elif self._type in ['base64', 'date', 'datetime', 'ip', 'md5', 'time',
+							'tuuid', 'tuuid4', 'uuid', 'uuid4']:
+
+			# If it's a date, convert python types
+			if self._type == 'date':
+				lLines.extend([
+					'if isinstance(value, (date, datetime)):',
+					'\tvalue = value.strftime(\'%Y-%m-%d\')',
+					'elif not isinstance(value, str):'
+				])
+
+			# Else if it's a datetime, convert python types
+			elif self._type == 'datetime':
+				lLines.extend([
+					'if isinstance(value, datetime):',
+					'\tvalue = value.strftime(\'%Y-%m-%d %H:%M:%S\')',
+					'elif isinstance(value, date):',
+					'\tvalue = \'%s 00:00:00\' % value.strftime(\'%Y-%m-%d\')',
+					'elif not isinstance(value, str):'
+				])
+
+			# Else if it's a time, convert python types
+			elif self._type == 'time':
+				lLines.extend([
+					'if isinstance(value, (time, datetime)):',
+					'\tvalue = value.strftime(\'%H:%M:%S\')',
+					'elif not isinstance(value, str):'
+				])
+
+			# Else if it's an md5, convert python hashes
+			elif self._type == 'md5':
+				lLines.extend([
+					'if isinstance(value, %s):' % gen.constant(_MD5_TYPE),
+					'\tvalue = value.hexdigest()',
+					'elif not isinstance(value, str):'
+				])
+
+			# Else, it has to be a string
 			else:
-				value = str(value)
+				lLines.append('if not isinstance(value, str):')
+			lLines.extend(self._compile_fail('not a string', 1))
+
+			# Check the value against the type's validator
+			lLines.append('if not %s(value):' % gen.constant(
+				validators.match[self._type]
+			))
+			lLines.extend(self._compile_fail('invalid', 1))
+
+			# If we are checking an IP with a min or a max
+			if self._type == 'ip' and \
+				(self._minimum is not None or self._maximum is not None):
+
+				# Store the compare function
+				sCompare = gen.constant(self.compare_ips)
+
+				# If there's a maximum
+				if self._maximum is not None:
+					lLines.append('if %s(value, %s) == 1:' % (
+						sCompare, gen.constant(self._maximum)
+					))
+					lLines.extend(self._compile_fail('exceeds maximum', 1))
+
+				# If there's a minimum
+				if self._minimum is not None:
+					lLines.append('if %s(value, %s) == -1:' % (
+						sCompare, gen.constant(self._minimum)
+					))
+					lLines.extend(self._compile_fail('did not meet minimum', 1))
+
+				# Nothing else to check
+				bDone = True
+
+		# Else if we are validating some sort of integer
+		elif self._type in ['int', 'timestamp', 'uint']:
+			lLines.append('if type(value) == bool:')
+			lLines.extend(self._compile_fail('is a bool', 1))
+			lLines.extend([
+				'if not isinstance(value, int):',
+				'\tif isinstance(value, str) and %s(value):' % gen.constant(
+					constants.regex['int'].match
+				),
+				'\t\tvalue = int(value, 0)',
+				'\telse:'
+			])
+			lLines.extend(self._compile_fail('not an integer', 2))
+
+			# If it's not signed
+			if self._type in ['timestamp', 'uint']:
+				lLines.append('if value < 0:')
+				lLines.extend(self._compile_fail('signed', 1))
+
+		# Else if we are validating a bool, nothing else is checked after
+		elif self._type == 'bool':
+			lLines.extend([
+				'if isinstance(value, bool):',
+				'\treturn True',
+				'if isinstance(value, int) and value in (0, 1):',
+				'\treturn True',
+				'elif isinstance(value, str):',
+				'\tif value.lower() in {\'on\', \'true\', \'t\', \'yes\', ' \
+					'\'y\', \'x\', \'1\', \'\', \'false\', \'f\', ' \
+					'\'no\', \'n\', \'off\', \'0\'}:',
+				'\t\treturn True'
+			])
+			lLines.extend(self._compile_fail(
+				'not a valid string representation of a bool', 1
+			))
+			lLines.extend(self._compile_fail('not valid bool replacement'))
+
+		# Else if we are validating a decimal value
+		elif self._type == 'decimal':
+			lLines.append('if type(value) == bool:')
+			lLines.extend(self._compile_fail('is a bool', 1))
+			lLines.extend([
+				'if not isinstance(value, Decimal):',
+				'\ttry:',
+				'\t\tvalue = Decimal(value)',
+				'\texcept (DecimalInvalid, TypeError, ValueError):'
+			])
+			lLines.extend(self._compile_fail(
+				'can not be converted to decimal', 2
+			))
+
+		# Else if we are validating a floating point value
+		elif self._type == 'float':
+			lLines.append('if type(value) == bool:')
+			lLines.extend(self._compile_fail('is a bool', 1))
+			lLines.extend([
+				'if not isinstance(value, float):',
+				'\ttry:',
+				'\t\tvalue = float(value)',
+				'\texcept (ValueError, TypeError):'
+			])
+			lLines.extend(self._compile_fail(
+				'can not be converted to float', 2
+			))
+
+		# Else if we are validating a JSON string, nothing else is checked after
+		elif self._type == 'json':
+			lLines.extend([
+				'if isinstance(value, str):',
+				'\ttry:',
+				'\t\tjsonb.decode(value)',
+				'\texcept ValueError:'
+			])
+			lLines.extend(self._compile_fail('Can not be decoded from JSON', 2))
+			lLines.extend([
+				'\treturn True',
+				'try:',
+				'\tjsonb.encode(value)',
+				'except (ValueError, TypeError):'
+			])
+			lLines.extend(self._compile_fail('Can not be encoded to JSON', 1))
+
+		# Else if we are validating a price value
+		elif self._type == 'price':
+			lLines.append('if type(value) == bool:')
+			lLines.extend(self._compile_fail('is a bool', 1))
+			lLines.extend([
+				'if not isinstance(value, Decimal):',
+				'\tif isinstance(value, (str, float)) and %s(str(value)):' % \
+					gen.constant(constants.regex['price'].match),
+				'\t\tvalue = Decimal(value).quantize(%s)' % \
+					gen.constant(Decimal('1.00')),
+				'\telif isinstance(value, int):',
+				'\t\tvalue = Decimal(str(value) + \'.00\')',
+				'\telse:'
+			])
+			lLines.extend(self._compile_fail('invalid', 2))
+			lLines.append('elif abs(value.as_tuple().exponent) > 2:')
+			lLines.extend(self._compile_fail('too many decimal points', 1))
+
+		# Else if we are validating a string value
+		elif self._type == 'string':
+			lLines.append('if not isinstance(value, str):')
+			lLines.extend(self._compile_fail('is not a string', 1))
+
+			# If we have a regex
+			if self._regex:
+				lLines.append('if not %s(value):' % gen.constant(
+					self._regex.match
+				))
+				lLines.extend(self._compile_fail('failed regex', 1))
+
+			# If we have a min or max, they are lengths, and nothing else is
+			#	checked after
+			if self._minimum or self._maximum:
+				if self._minimum:
+					lLines.append('if len(value) < %s:' % gen.constant(
+						self._minimum
+					))
+					lLines.extend(self._compile_fail('not long enough', 1))
+				if self._maximum:
+					lLines.append('if len(value) > %s:' % gen.constant(
+						self._maximum
+					))
+					lLines.extend(self._compile_fail('too long', 1))
+				bDone = True
 
 		# Else we probably forgot to add a new type
 		else:
-			raise Exception('%s has not been added to .clean()' % self._type)
+			raise Exception(
+				'%s has not been added to ._compile_valid()' % self._type
+			)
+
+		# If the type already checked everything
+		if bDone:
+			pass
+
+		# Else if there's a list of options
+		elif self._options is not None:
+			lLines.append('if value not in %s:' % gen.constant(
+				self._options_set
+			))
+			lLines.extend(self._compile_fail('not in options', 1))
+
+		# Else check for basic min/max
+		else:
+			if self._minimum:
+				lLines.append('if value < %s:' % gen.constant(self._minimum))
+				lLines.extend(self._compile_fail('did not meet minimum', 1))
+			if self._maximum:
+				lLines.append('if value > %s:' % gen.constant(self._maximum))
+				lLines.extend(self._compile_fail('exceeds maximum', 1))
 
-		# Return the cleaned value
-		return value
+		# Value has no issues
+		lLines.append('return True')
+
+		# Add the function
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', lLines
+		)
+
+		# Return the name, and whether a missing value can still pass
+		return sName, (self._type in ['any', 'json'] and not self._optional)
+
+	@staticmethod
+	def compare_ips(first: str, second: str) -> int:
+		"""Compare IPs
+
+		Compares two IPs and returns a status based on which is greater
+		If first is less than second: -1
+		If first is equal to second: 0
+		If first is greater than second: 1
+
+		Arguments:
+			first (str): A string representing an IP address
+			second (str): A string representing an IP address
+
+		Returns:
+			int
+		"""
+
+		# If the two IPs are the same, return 0
+		if first == second:
+			return 0
+
+		# Create lists from the split of each IP, store them as ints
+		lFirst = [int(i) for i in first.split('.')]
+		lSecond = [int(i) for i in second.split('.')]
+
+		# Go through each part from left to right until we find the
+		# 	difference
+		for i in [0, 1, 2, 3]:
+
+			# If the part of x is greater than the part of y
+			if lFirst[i] > lSecond[i]:
+				return 1
+
+			# Else if the part of x is less than the part of y
+			elif lFirst[i] < lSecond[i]:
+				return -1
+
+	def clean(self, value: any, level: list[str] = undefined):
+		"""Clean
+
+		Cleans and returns the new value
+
+		Arguments:
+			value {mixed} -- The value to clean
+
+		Returns:
+			mixed
+		"""
+
+		# If the level is not set
+		if level is undefined:
+			level = []
+
+		# If the value is None and it's optional, return as is
+		if value is None and self._optional:
+			return None
+
+		# Clean it using the function of the type
+		return self._clean(value)
 
 	def minmax(self, minimum: any = undefined, maximum: any = undefined):
 		"""Min/Max
@@ -363,7 +674,7 @@ class Node(Base):
 			maximum (any): The maximum value
 
 		Raises:
-			TypeError, ValueError
+			RuntimeError, TypeError, ValueError
 
 		Returns:
 			None | dict
@@ -376,6 +687,9 @@ class Node(Base):
 				'maximum': self._maximum
 			}
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# If the minimum is set
 		if minimum != None:
 
@@ -391,7 +705,7 @@ class Node(Base):
 
 				# Make sure the value is valid for the type
 				if not isinstance(minimum, str) \
-					or not constants.regex[self._type].match(minimum):
+					or not validators.match[self._type](minimum):
 					raise ValueError(
 						'"__minimum__" is not valid for the current type: ' \
 						'"%s"' % self._type
@@ -475,7 +789,7 @@ class Node(Base):
 
 				# Make sure the value is valid for the type
 				if not isinstance(maximum, str) \
-					or not constants.regex[self._type].match(maximum):
+					or not validators.match[self._type](maximum):
 					raise ValueError(
 						'"__maximum__" is not valid for the current type: ' \
 						'"%s"' % self._type
@@ -567,6 +881,9 @@ class Node(Base):
 			# Store the maximum
 			self._maximum = maximum
 
+		# Update the limits checked
+		self._bind()
+
 	def options(self, options: list[any] = undefined):
 		"""Options
 
@@ -576,7 +893,7 @@ class Node(Base):
 			options (list): A list of valid values
 
 		Raises:
-			TypeError, ValueError
+			RuntimeError, TypeError, ValueError
 
 		Returns:
 			None | list
@@ -586,6 +903,9 @@ class Node(Base):
 		if options is undefined:
 			return self._options
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# If the options are not a list
 		if not isinstance(options, list):
 			raise ValueError('"__options__" must be a list')
@@ -599,12 +919,18 @@ class Node(Base):
 				'can not set __options__ for "%s" type' % self._type
 			)
 
-		# Init the list of options to be saved
+		# Init the list of options to be saved, and the set of them to find
+		#	duplicates without going through the list
 		lOpts: list = []
+		seOpts: set = set()
 
 		# Go through each item and make sure it's unique and valid
 		for i in range(len(options)):
 
+			# Get the value, never changing the list passed, which is shared
+			#	with the definition
+			mOpt = options[i]
+
 			# Convert the value based on the type
 			# If the type is a string one that we can validate
 			if self._type in ['base64', 'date', 'datetime', 'ip', 'md5', 'time',
@@ -612,8 +938,8 @@ class Node(Base):
 
 				# If the value is not a string or doesn't match its regex, raise
 				# 	an error
-				if not isinstance(options[i], str) \
-					or not constants.regex[self._type].match(options[i]):
+				if not isinstance(mOpt, str) \
+					or not validators.match[self._type](mOpt):
 					raise ValueError(
 						'"__options__[%d]" is not a valid "%s"' % (
 							i, self._type
@@ -624,12 +950,12 @@ class Node(Base):
 			elif self._type == 'decimal':
 
 				# If it's a Decimal
-				if isinstance(options[i], Decimal):
+				if isinstance(mOpt, Decimal):
 					pass
 
 				# Else if we can't conver it
 				else:
-					try: options[i] = Decimal(options[i])
+					try: mOpt = Decimal(mOpt)
 					except ValueError:
 						raise ValueError(
 							'"__options__[%d]" not a valid "decimal"' % i
@@ -639,7 +965,7 @@ class Node(Base):
 			elif self._type == 'float':
 
 				try:
-					options[i] = float(options[i])
+					mOpt = float(mOpt)
 				except ValueError:
 					raise ValueError(
 						'"__options__[%d]" not a valid "float"' % i
@@ -649,17 +975,17 @@ class Node(Base):
 			elif self._type in ['int', 'timestamp', 'uint']:
 
 				# If we don't already have an int
-				if not isinstance(options[i], int):
+				if not isinstance(mOpt, int):
 
 					# And we don't have a string
-					if not isinstance(options[i], str):
+					if not isinstance(mOpt, str):
 						raise ValueError(
 							'__options__[%d] is not a valid "%s"' % (
 								i, self._type
 							))
 
 					try:
-						options[i] = int(options[i], 0)
+						mOpt = int(mOpt, 0)
 					except ValueError:
 						raise ValueError(
 							'__options__[%d] is not a valid "%s"' % (
@@ -667,7 +993,7 @@ class Node(Base):
 							))
 
 				# If the type is unsigned and negative, raise an error
-				if self._type in ['timestamp', 'uint'] and options[i] < 0:
+				if self._type in ['timestamp', 'uint'] and mOpt < 0:
 					raise ValueError(
 						'__options__[%d] is not a valid "%s"' % (
 							i, self._type
@@ -677,28 +1003,28 @@ class Node(Base):
 			elif self._type == 'price':
 
 				# If it's a Decimal
-				if isinstance(options[i], Decimal):
+				if isinstance(mOpt, Decimal):
 					pass
 
 				# Else if it's not a valid price representation
-				elif not isinstance(options[i], str) or \
-					not constants.regex['price'].match(options[i]):
+				elif not isinstance(mOpt, str) or \
+					not constants.regex['price'].match(mOpt):
 					raise ValueError(
 						'__options__[%d] is not a valid "price"' % i
 					)
 
 				# Store it as a Decimal
-				options[i] = Decimal(options[i])
+				mOpt = Decimal(mOpt)
 
 			# Else if the type is a string
 			elif self._type == 'string':
 
 				# If the value is not a string
-				if not isinstance(options[i], str):
+				if not isinstance(mOpt, str):
 
 					# If the value can't be turned into a string
 					try:
-						options[i] = str(options[i])
+						mOpt = str(mOpt)
 					except ValueError:
 						raise ValueError(
 							'__options__[%d] is not a valid "string"' % i
@@ -711,15 +1037,21 @@ class Node(Base):
 				)
 
 			# If it's already in the list, raise an error
-			if options[i] in lOpts:
+			if mOpt in seOpts:
 				raise ValueError('__options__[%d] is a duplicate' % i)
 
 			# Store the option
 			else:
-				lOpts.append(options[i])
+				lOpts.append(mOpt)
+				seOpts.add(mOpt)
 
-		# Store the list of options
+		# Store the list of options, in order, and the set of them to check
+		#	values against
 		self._options = lOpts
+		self._options_set = frozenset(seOpts)
+
+		# Update the limits checked
+		self._bind()
 
 	def regex(self, regex: str | Pattern = undefined):
 		"""Regex
@@ -731,7 +1063,7 @@ class Node(Base):
 				regular expression
 
 		Raises:
-			ValueError
+			RuntimeError, ValueError
 
 		Returns:
 			None | str
@@ -741,6 +1073,9 @@ class Node(Base):
 		if regex is undefined:
 			return self._regex
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# If the type is not a string
 		if self._type != 'string':
 			raise ValueError('can not set __regex__ for "%s"' % self._type)
@@ -808,32 +1143,30 @@ class Node(Base):
 		"""
 		return self._type
 
-	def valid(self,
+	def _valid(self,
 		value: any,
-		ignore_missing = False,
-		level: list[str] = undefined
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
 	) -> bool:
 		"""Valid
 
-		Checks if a value is valid based on the instance's values. If any \
-		errors occur, they can be found in [instance].validation_failures as a \
-		list
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed
 
 		Arguments:
 			value (any): The value to validate
-			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
 
 		Returns:
 			bool
 		"""
 
-		# Reset validation failures
-		self._validation_failures = []
-
-		# If the level is not passed
-		if level is undefined:
-			level = []
-
 		# If the value is None
 		if value is None:
 
@@ -842,340 +1175,125 @@ class Node(Base):
 				return True
 
 			# Invalid value
-			self._validation_failures.append(['.'.join(level), 'missing'])
-
-		# If we are validating an ANY field, immediately return true
-		if self._type == 'any':
-			pass
-
-		# If we are validating a DATE, DATETIME, IP or TIME data point
-		elif self._type in ['base64', 'date', 'datetime', 'ip', 'md5', 'time',
-							'tuuid', 'tuuid4', 'uuid', 'uuid4']:
-
-			# If it's a date or datetime type and the value is a python type
-			if self._type == 'date' and isinstance(value, (date, datetime)):
-				value = value.strftime('%Y-%m-%d')
-
-			elif self._type == 'datetime' and \
-				isinstance(value, (date, datetime)
-			):
-				if isinstance(value, datetime):
-					value = value.strftime('%Y-%m-%d %H:%M:%S')
-				elif isinstance(value, date):
-					value = '%s 00:00:00' % value.strftime('%Y-%m-%d')
-
-			# If it's a time type and the value is a python type
-			elif self._type == 'time' and isinstance(value, (time, datetime)):
-				value = value.strftime('%H:%M:%S')
-
-			# Else if the type is md5 and the value is a python type
-			elif self._type == 'md5' and isinstance(value, _MD5_TYPE):
-				value = value.hexdigest()
-
-			# If the value is not a string
-			elif not isinstance(value, str):
-				self._validation_failures.append([
-					'.'.join(level),
-					'not a string'
-				])
-				return False
-
-			# If there's no match
-			if not constants.regex[self._type].match(value):
-				self._validation_failures.append(['.'.join(level), 'invalid'])
-				return False
-
-			# If we are checking an IP
-			if self._type == 'ip':
-
-				# If there's a min or a max
-				if self._minimum is not None or self._maximum is not None:
-
-					# If the IP is greater than the maximum
-					if self._maximum is not None and \
-						self.compare_ips(value, self._maximum) == 1:
-						self._validation_failures.append([
-							'.'.join(level),
-							'exceeds maximum'
-						])
-						return False
-
-					# If the IP is less than the minimum
-					if self._minimum is not None and \
-						self.compare_ips(value, self._minimum) == -1:
-						self._validation_failures.append([
-							'.'.join(level),
-							'did not meet minimum'
-						])
-						return False
-
-					# Return OK
-					return True
-
-		# Else if we are validating some sort of integer
-		elif self._type in ['int', 'timestamp', 'uint']:
+			if failures is not None:
+				failures.append([join(level), 'missing'])
+
+		# Check it using the function of the type
+		return self._check(self, value, level, failures)
+
+	def _valid_column(self,
+		column: any,
+		ignore_missing: bool,
+		level: list[str],
+		failures: dict[int, list[list[str]]]
+	) -> set[int]:
+		"""Valid Column
+
+		Checks every value in a column, adding the failures of each invalid \
+		row to the dict passed, and returns the set of invalid rows. Numeric \
+		arrays (NumPy or anything offering the same operators) are checked \
+		against the limits all at once, and lists of exactly typed values are \
+		checked against the limits or options without the full check. Only \
+		the rows that don't pass are then checked by _valid, so that the \
+		failures are exactly the same
 
-			# If the type is a bool, fail immediately
-			if type(value) == bool:
-				self._validation_failures.append(['.'.join(level), 'is a bool'])
-				return False
-
-			# If it's not an int
-			if not isinstance(value, int):
-
-				# And it's a valid representation of an int, convert it
-				if isinstance(value, str) \
-					and constants.regex['int'].match(value):
-					value = int(value, 0)
+		Arguments:
+			column (list | array): The values of every row
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the values from the top of the structure
+			failures (dict): The failures by row to add to
 
-				# Else, return false
-				else:
-					self._validation_failures.append([
-						'.'.join(level),
-						'not an integer'
-					])
-					return False
+		Returns:
+			set[int]
+		"""
 
-			# If it's not signed
+		# If the column is an array of numbers
+		oType = getattr(column, 'dtype', None)
+		if oType is not None and self._options is None and (
+			(self._type in ['int', 'timestamp', 'uint'] and \
+				oType.kind in 'iu') or \
+			(self._type == 'float' and oType.kind in 'iuf')
+		):
+
+			# Find every row under or over the limits at once
+			oFailed = None
+			lChecks = []
 			if self._type in ['timestamp', 'uint']:
+				lChecks.append(column < 0)
+			if self._minimum:
+				lChecks.append(column < self._minimum)
+			if self._maximum:
+				lChecks.append(column > self._maximum)
+			for o in lChecks:
+				oFailed = o if oFailed is None else (oFailed | o)
 
-				# If the value is below 0
-				if value < 0:
-					self._validation_failures.append([
-						'.'.join(level),
-						'signed'
-					])
-					return False
-
-		# Else if we are validating a bool
-		elif self._type == 'bool':
-
-			# If it's already a bool
-			if isinstance(value, bool):
-				return True
-
-			# If it's an int or long at 0 or 1
-			if isinstance(value, int) and value in [0, 1]:
-				return True
-
-			# Else if it's a string
-			elif isinstance(value, str):
-
-				# If it's valid true or false string
-				if value.lower() in ['on', 'true', 't', 'yes', 'y', 'x', '1',
-			 						'', 'false', 'f', 'no', 'n', 'off', '0']:
-					return True
-				else:
-					self._validation_failures.append([
-						'.'.join(level),
-						'not a valid string representation of a bool'
-					])
-					return False
-
-			# Else it's no valid type
-			else:
-				self._validation_failures.append([
-					'.'.join(level),
-					'not valid bool replacement'
-				])
-				return False
-
-		# Else if we are validating a decimal value
-		elif self._type == 'decimal':
-
-			# If the type is a bool, fail immediately
-			if type(value) == bool:
-				self._validation_failures.append(['.'.join(level), 'is a bool'])
-				return False
-
-			# If it's already a Decimal
-			if isinstance(value, Decimal):
-				pass
-
-			# Else if we fail to convert the value
-			else:
-				try: value = Decimal(value)
-				except (DecimalInvalid, TypeError, ValueError):
-					self._validation_failures.append([
-						'.'.join(level),
-						'can not be converted to decimal'
-					])
-					return False
-
-		# Else if we are validating a floating point value
-		elif self._type == 'float':
-
-			# If the type is a bool, fail immediately
-			if type(value) == bool:
-				self._validation_failures.append(['.'.join(level), 'is a bool'])
-				return False
-
-			# If it's already a float
-			if isinstance(value, float):
-				pass
-
-			# Else if we fail to convert the value
-			else:
-				try: value = float(value)
-				except (ValueError, TypeError):
-					self._validation_failures.append([
-						'.'.join(level),
-						'can not be converted to float'
-					])
-					return False
-
-		# Else if we are validating a JSON string
-		elif self._type == 'json':
-
-			# If it's already a string
-			if isinstance(value, str):
-
-				# Try to decode it
-				try:
-					value = jsonb.decode(value)
-					return True
-				except ValueError:
-					self._validation_failures.append([
-						'.'.join(level),
-						'Can not be decoded from JSON'
-					])
-					return False
-
-			# Else
-			else:
-
-				# Try to encode it
-				try:
-					value = jsonb.encode(value)
-					return True
-				except (ValueError, TypeError):
-					self._validation_failures.append([
-						'.'.join(level),
-						'Can not be encoded to JSON'
-					])
-					return False
-
-		# Else if we are validating a price value
-		elif self._type == 'price':
-
-			# If the type is a bool, fail immediately
-			if type(value) == bool:
-				self._validation_failures.append(['.'.join(level), 'is a bool'])
-				return False
-
-			# If it's not a floating point value
-			if not isinstance(value, Decimal):
-
-				# But it is a valid string representing a price, or a float
-				if isinstance(value, (str, float)) \
-					and constants.regex['price'].match(str(value)):
-
-					# Convert it to a decimal
-					value = Decimal(value).quantize(Decimal('1.00'))
-
-				# Else if it's an int
-				elif isinstance(value, int):
-
-					# Convert it to decimal
-					value = Decimal(str(value) + '.00')
-
-				# Else whatever it is is no good
-				else:
-					self._validation_failures.append([
-						'.'.join(level),
-						'invalid'
-					])
-					return False
-
-			# Else
-			else:
-
-				# If the exponent is longer than 2
-				if abs(value.as_tuple().exponent) > 2:
-					self._validation_failures.append([
-						'.'.join(level),
-						'too many decimal points'
-					])
-					return False
-
-		# Else if we are validating a string value
-		elif self._type == 'string':
-
-			# If the value is not some form of string
-			if not isinstance(value, str):
-				self._validation_failures.append([
-					'.'.join(level),
-					'is not a string'
-				])
-				return False
-
-			# If we have a regex
-			if self._regex:
-
-				# If it doesn't match the regex
-				if not self._regex.match(value):
-					self._validation_failures.append([
-						'.'.join(level),
-						'failed regex'
-					])
-					return False
-
-			# If we have a min or max
-			if self._minimum or self._maximum:
-
-				# If there's a minimum length and we don't reach it
-				if self._minimum and len(value) < self._minimum:
-					self._validation_failures.append([
-						'.'.join(level),
-						'not long enough'
-					])
-					return False
-
-				# If there's a maximum length and we surpass it
-				if self._maximum and len(value) > self._maximum:
-					self._validation_failures.append([
-						'.'.join(level),
-						'too long'
-					])
-					return False
-
-				# Return OK
-				return True
-
-		# If there's a list of options
-		if self._options is not None:
+			# If there's nothing to check, every row is valid
+			if oFailed is None:
+				return set()
 
-			# Returns based on the option's existance
-			if value not in self._options:
-				self._validation_failures.append([
-					'.'.join(level),
-					'not in options'
-				])
-				return False
-			else:
-				return True
+			# Check only the rows which failed, as python values
+			lRows = oFailed.nonzero()[0].tolist()
+			lValues = [column[i].item() for i in lRows]
 
-		# Else check for basic min/max
+		# Else, it's a list of values
 		else:
 
-			# If the value is less than the minimum
-			if self._minimum and value < self._minimum:
-				self._validation_failures.append([
-					'.'.join(level),
-					'did not meet minimum'
-				])
-				return False
-
-			# If the value is greater than the maximum
-			if self._maximum and value > self._maximum:
-				self._validation_failures.append([
-					'.'.join(level),
-					'exceeds maximum'
-				])
-				return False
+			# If we got an array type, get the values as python types
+			if hasattr(column, 'tolist'):
+				column = column.tolist()
+
+			# If it's a number, figure out the limits
+			if self._type in ['int', 'timestamp', 'uint', 'float']:
+				oClass = self._type == 'float' and float or int
+				mMin = self._minimum or None
+				mMax = self._maximum or None
+				if self._type in ['timestamp', 'uint']:
+					mMin = 0 if mMin is None else max(mMin, 0)
+
+			# Else, if it's a string with nothing but options
+			elif self._options is not None and \
+				self._type in ['base64', 'date', 'datetime', 'ip', 'md5',
+								'string', 'time', 'tuuid', 'tuuid4', 'uuid',
+								'uuid4'] and \
+				self._regex is None and \
+				self._minimum is None and self._maximum is None:
+				oClass = str
+
+			# Else, there's no quicker way to check the values
+			else:
+				return super(Node, self)._valid_column(
+					column, ignore_missing, level, failures
+				)
 
-		# Value has no issues
-		return True
+			# If there's options, use the set of them for quick lookups
+			if self._options is not None:
+				seOptions = self._options_set
+
+			# Go through each value and keep the rows that don't pass
+			lRows = []
+			lValues = []
+			for i, v in enumerate(column):
+				if v.__class__ is oClass:
+					if self._options is not None:
+						if v in seOptions:
+							continue
+					elif (mMin is None or v >= mMin) and \
+						(mMax is None or v <= mMax):
+						continue
+				lRows.append(i)
+				lValues.append(v)
+
+		# Check each row that didn't pass
+		seInvalid = set()
+		lFailures = []
+		for i, v in zip(lRows, lValues):
+			if not self._valid(v, ignore_missing, level, lFailures, False):
+				failures.setdefault(i, []).extend(lFailures)
+				seInvalid.add(i)
+			del lFailures[:]
+
+		# Return the invalid rows
+		return seInvalid
 
 # Register with Base
 Node.register('node')
\ No newline at end of file
@@ -18,10 +18,18 @@ from tools import clone, merge
 import undefined
 
 # Python imports
-from typing import Literal as TL
+from typing import Generator as TG, Literal as TL
 
 # Local imports
+from define import constants
 from define.base import Base
+from define.compiler import Generator
+from define.level import join
+from define.node import Node
+from define.parent import Parent
+
+# The Python types of the values which come from JSON, other than None
+_TYPES = (bool, dict, float, int, list, str)
 
 class Options(Base):
 	"""Options Node
@@ -33,6 +41,8 @@ class Options(Base):
 		_NodeInterface
 	"""
 
+	__slots__ = ('_discriminator', '_index', '_kinds', '_nodes')
+
 	def __getitem__(self, index: int):
 		"""Get Item (__getitem__)
 
@@ -50,7 +60,7 @@ class Options(Base):
 		return self._nodes[index]
 
 	def __init__(self,
-		details: list,
+		details: list | dict,
 		extend: list[dict] | TL[False] = False,
 		name: str = None
 	):
@@ -59,7 +69,9 @@ class Options(Base):
 		Initialises the instance
 
 		Arguments:
-			details (list): Definition
+			details (list | dict): Definition, the list of options, or a \
+				dict with the list as __type__, along with a \
+				__discriminator__, and any specials
 			extend (list | False): Optional, a list to extend the definition
 			name (str): The name of the field if it is one
 
@@ -70,6 +82,13 @@ class Options(Base):
 			Options
 		"""
 
+		# If we got a dict, split the options from the rest of the details
+		if isinstance(details, dict):
+			dDetails = { k: v for k,v in details.items() if k != '__type__' }
+			details = details.get('__type__')
+		else:
+			dDetails = {}
+
 		# If details is not a list instance
 		if not isinstance(details, list):
 			raise ValueError('details in must be a list')
@@ -120,8 +139,14 @@ class Options(Base):
 			else:
 				raise ValueError('extend must be a list or False')
 
+		# Keep any optional flag set, it overrides the one from the children
+		mOptional = dDetails.get('__optional__')
+
 		# Call the Base constructor
-		super(Options, self).__init__({}, name)
+		super(Options, self).__init__(dDetails, name)
+
+		# Store the discriminator, if there is one
+		self._discriminator = dDetails.get('__discriminator__')
 
 		# Init the internal list
 		self._nodes = []
@@ -154,6 +179,288 @@ class Options(Base):
 			if not self._nodes[-1]._optional:
 				self._optional = False
 
+		# If the optional flag was set, use it instead
+		if mOptional is not None:
+			self._optional = mOptional
+
+		# Index the options by the types of values they can be valid for
+		self._index_nodes()
+
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
+
+		Returns the exact Python types of the values the instance could be \
+		valid for, every type any of its options could be valid for
+
+		Returns:
+			frozenset | None
+		"""
+
+		# If a child class changed how values are validated, it can't tell
+		if type(self)._valid is not Options._valid:
+			return None
+
+		# Add the types of each option
+		seRet = set()
+		for o in self._nodes:
+			se = o._accepts()
+			if se is None:
+				return None
+			seRet.update(se)
+
+		# Return the types
+		return frozenset(seRet)
+
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
+
+		Generates a function which cleans values exactly like clean does, \
+		using the generated functions to find the option the value is valid \
+		for, and then cleaning it with that option
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			str
+		"""
+
+		# Start with the handling of missing values
+		lLines = [
+			'if value is None:',
+			self._optional and '\treturn None' or \
+				'\traise ValueError([[join(level), \'missing\']])',
+			'oType = type(value)'
+		]
+
+		# If there's a discriminator, clean dicts with the option of its value
+		if self._kinds is not None:
+			lLines.extend([
+				'if isinstance(value, dict):',
+				'\tmKind = value.get(%r)' % self._discriminator,
+				'\tif mKind is None:',
+				'\t\traise ValueError([[join(level + [%r]), \'missing\']])' % \
+					self._discriminator,
+				'\ttry:',
+				'\t\tfClean = %s[mKind]' % gen.assign('{ %s }' % ', '.join([
+					'%r: %s' % (k, gen.clean(o)) for k,o in self._kinds.items()
+				])),
+				'\texcept (KeyError, TypeError):',
+				'\t\traise ValueError([[join(level + [%r]), ' \
+					'\'not in options\']])' % self._discriminator,
+				'\treturn fClean(value, level)'
+			])
+
+		# Go through each of the nodes, and use the clean of the first valid
+		for o in self._nodes:
+			lLines.extend([
+				'if %s%s(value, False, level, None, True):' % (
+					self._compile_skip(o, gen), gen.valid(o)[0]
+				),
+				'\treturn %s(value, level)' % gen.clean(o)
+			])
+
+		# Something went wrong
+		lLines.append(
+			'raise ValueError([[join(level), \'matches no option\']])'
+		)
+
+		# Add the function
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', lLines)
+
+		# Return the name
+		return sName
+
+	@staticmethod
+	def _compile_skip(node: Base, gen: Generator) -> str:
+		"""Compile Skip
+
+		Returns the start of the condition used by generated functions to \
+		skip an option for values of types it can never be valid for, or an \
+		empty string if it can't be skipped
+
+		Arguments:
+			node (Base): The option
+			gen (Generator): The generator to add the types to
+
+		Returns:
+			str
+		"""
+
+		# Get the types the option can never be valid for
+		seAccepts = node._accepts()
+		if seAccepts is None:
+			return ''
+		seSkip = frozenset(_TYPES) - seAccepts
+		if not seSkip:
+			return ''
+
+		# Return the check
+		return 'oType not in %s and ' % gen.constant(seSkip)
+
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
+
+		Generates a function which validates values exactly like valid does, \
+		calling the functions generated for each option directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Start with the handling of missing values
+		lLines = self._compile_missing()
+
+		# The failures of the options themselves are never kept, so there's no
+		#	need for them to look past the first one
+		# Assume a valid value never leaves failures, unless it can be missing
+		bDirty = not self._optional
+
+		# If there's a discriminator, validate dicts with the option of its
+		#	value, and only that option
+		if self._kinds is not None:
+			lLines.extend([
+				'if isinstance(value, dict):',
+				'\tmKind = value.get(%r)' % self._discriminator,
+				'\tif mKind is not None:',
+				'\t\ttry:',
+				'\t\t\tfValid = %s[mKind]' % gen.assign('{ %s }' % ', '.join([
+					'%r: %s' % (k, gen.valid(o)[0])
+					for k,o in self._kinds.items()
+				])),
+				'\t\texcept (KeyError, TypeError):',
+				'\t\t\tif failures is not None:',
+				'\t\t\t\tfailures.append([join(level + [%r]), ' \
+					'\'not in options\'])' % self._discriminator,
+				'\t\t\treturn False',
+				'\t\treturn fValid(value, ignore_missing, level, failures, ' \
+					'fail_fast)',
+				'\tif not ignore_missing:',
+				'\t\tif failures is not None:',
+				'\t\t\tfailures.append([join(level + [%r]), \'missing\'])' % \
+					self._discriminator,
+				'\t\treturn False'
+			])
+
+			# The option's function is returned as is, so it decides
+			bDirty = bDirty or any([
+				gen.valid(o)[1] for o in self._kinds.values()
+			])
+
+		lLines.extend([
+			'iFailures = failures and len(failures) or 0',
+			'oType = type(value)'
+		])
+
+		# Go through each of the nodes, and return as soon as one is valid
+		for o in self._nodes:
+			lLines.extend([
+				'if %s%s(value, ignore_missing, level, failures, True):' % (
+					self._compile_skip(o, gen), gen.valid(o)[0]
+				),
+				'\tif failures:',
+				'\t\tdel failures[iFailures:]',
+				'\treturn True',
+				'if failures:',
+				'\tdel failures[iFailures:]'
+			])
+
+		# Not valid for anything
+		lLines.extend(self._compile_fail('no valid option'))
+
+		# Add the function
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', lLines
+		)
+
+		# Return the name, and whether a valid value can leave failures
+		return sName, bDirty
+
+	def _index_nodes(self) -> None:
+		"""Index Nodes
+
+		Stores, by the exact type of a value, the options, in order, that a \
+		value of that type could be valid for, so that the rest never have \
+		to be checked. Values of any other type, and None, are checked \
+		against every option. If there's a discriminator, also stores the \
+		option of each of its values
+
+		Raises:
+			ValueError
+
+		Returns:
+			None
+		"""
+
+		# If there's a discriminator
+		if self._discriminator is None:
+			self._kinds = None
+		else:
+
+			# If it's not a valid key
+			if not isinstance(self._discriminator, str) or \
+				not constants.standard.match(self._discriminator):
+				raise ValueError('__discriminator__ must be a valid key')
+
+			# Go through each option
+			self._kinds = {}
+			for i in range(len(self._nodes)):
+
+				# If it's not a Parent, or the discriminator isn't a
+				#	required string with options
+				o = self._nodes[i]
+				oKind = isinstance(o, Parent) and \
+					o.child(self._discriminator) or None
+				if not isinstance(oKind, Node) or \
+					oKind.type() != 'string' or \
+					not oKind.options() or \
+					oKind.optional():
+					raise ValueError(
+						'__discriminator__ "%s" must be a required string ' \
+						'with __options__ in every option, not in %d' % (
+							self._discriminator, i
+						)
+					)
+
+				# Store the option by each of the discriminator's values
+				for s in oKind.options():
+					if s in self._kinds:
+						raise ValueError(
+							'__discriminator__ "%s" value "%s" is in more ' \
+							'than one option' % (self._discriminator, s)
+						)
+					self._kinds[s] = o
+
+		# Get the types accepted by each option
+		lAccepts = [o._accepts() for o in self._nodes]
+
+		# Store the options of each type
+		self._index = {
+			t: tuple([
+				o for o, se in zip(self._nodes, lAccepts)
+				if se is None or t in se
+			]) for t in _TYPES
+		}
+
+	def _share(self, share: callable) -> None:
+		"""Share
+
+		Replaces every option with its shared instance
+
+		Arguments:
+			share (callable): Returns the shared instance of the one passed
+
+		Returns:
+			None
+		"""
+		self._nodes = [share(o) for o in self._nodes]
+		self._index_nodes()
+
 	def __iter__(self):
 		"""Iterator (__iter__)
 
@@ -199,19 +506,53 @@ class Options(Base):
 				return None
 
 			# Missing value
-			raise ValueError([['.'.join(level), 'missing']])
+			raise ValueError([[join(level), 'missing']])
+
+		# If there's a discriminator, and we got a dict
+		if self._kinds is not None and isinstance(value, dict):
+
+			# If the discriminator is missing
+			mKind = value.get(self._discriminator)
+			if mKind is None:
+				raise ValueError([[
+					join(level + [self._discriminator]), 'missing'
+				]])
+
+			# Find the option using the discriminator's value
+			try:
+				o = self._kinds[mKind]
+			except (KeyError, TypeError):
+				raise ValueError([[
+					join(level + [self._discriminator]), 'not in options'
+				]])
+
+			# Use its clean
+			return o.clean(value, level)
 
-		# Go through each of the nodes
-		for i in range(len(self._nodes)):
+		# Go through each of the nodes the value could be valid for
+		for o in self._index.get(type(value), self._nodes):
 
 			# If it's valid
-			if self._nodes[i].valid(value):
+			if o._valid(value, False, [], None, True):
 
 				# Use its clean
-				return self._nodes[i].clean(value, level)
+				return o.clean(value, level)
 
 		# Something went wrong
-		raise ValueError([['.'.join(level), 'matches no option']])
+		raise ValueError([[join(level), 'matches no option']])
+
+	def freeze(self) -> 'Options':
+		"""Freeze
+
+		Stops the instance, and every option in it, from being changed so \
+		that they can be safely shared
+
+		Returns:
+			Options
+		"""
+		for o in self._nodes:
+			o.freeze()
+		return super(Options, self).freeze()
 
 	def option(self, index: int, default: any = None):
 		"""Option
@@ -234,39 +575,56 @@ class Options(Base):
 		"""To Dict
 
 		Returns the Nodes as a list of dictionaries in the same format as is \
-		used in constructing them
+		used in constructing them. If there's a discriminator, the list is \
+		returned as the __type__ of a dict with it and any specials
 
 		Returns:
-			list
+			list | dict
 		"""
-		return [d.to_dict() for d in self._nodes]
 
-	def valid(self,
+		# Get the options
+		lRet = [d.to_dict() for d in self._nodes]
+
+		# If there's no discriminator, return the list as is
+		if self._discriminator is None:
+			return lRet
+
+		# Else, return the list with the discriminator, and the base values
+		dRet = {
+			'__type__': lRet,
+			'__discriminator__': self._discriminator
+		}
+		dRet.update(super(Options, self).to_dict())
+		return dRet
+
+	_valid = Base._run
+	"""Checks values by walking them with _walk"""
+
+	def _walk(self,
 		value: any,
-		ignore_missing = False,
-		level: list = undefined
-	) -> bool:
-		"""Valid
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> TG[tuple, bool, bool]:
+		"""Walk
 
-		Checks if a value is valid based on the instance's values. If any \
-		errors occur, they can be found in [instance].validation_failures as a \
-		list
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed, yielding each option tried, the value, \
+		and whether to stop at the first failure, and receiving the result
 
 		Arguments:
 			value (any): The value to validate
-			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
 
 		Returns:
-			bool
+			Generator
 		"""
 
-		# If level isn't passed
-		if level is undefined:
-			level = []
-
-		# Reset validation failures
-		self._validation_failures = []
-
 		# If the value is None
 		if value is None:
 
@@ -275,19 +633,54 @@ class Options(Base):
 				return True
 
 			# Invalid value
-			self._validation_failures.append(['.'.join(level), 'missing'])
-
-		# Go through each of the nodes
-		for i in range(len(self._nodes)):
+			if failures is not None:
+				failures.append([join(level), 'missing'])
+
+		# If there's a discriminator, and we got a dict
+		if self._kinds is not None and isinstance(value, dict):
+
+			# If we have the discriminator, find the option using its value,
+			#	and use only that option
+			mKind = value.get(self._discriminator)
+			if mKind is not None:
+				try:
+					o = self._kinds[mKind]
+				except (KeyError, TypeError):
+					if failures is not None:
+						failures.append([
+							join(level + [self._discriminator]),
+							'not in options'
+						])
+					return False
+				return (yield o, value, fail_fast)
+
+			# If we aren't ignoring missing values
+			if not ignore_missing:
+				if failures is not None:
+					failures.append([
+						join(level + [self._discriminator]), 'missing'
+					])
+				return False
+
+		# The failures of the options themselves are never kept, so there's no
+		#	need for them to look past the first one
+		iFailures = failures and len(failures) or 0
+
+		# Go through each of the nodes the value could be valid for
+		for o in self._index.get(type(value), self._nodes):
 
 			# If it's valid
-			if self._nodes[i].valid(value, ignore_missing):
+			bValid = yield o, value, True
+			if failures:
+				del failures[iFailures:]
+			if bValid:
 
 				# Return OK
 				return True
 
 		# Not valid for anything
-		self._validation_failures.append(['.'.join(level), 'no valid option'])
+		if failures is not None:
+			failures.append([join(level), 'no valid option'])
 		return False
 
 # Register with Base
@@ -16,11 +16,166 @@ __all__ = ['Parent']
 import undefined
 
 # Python imports
-from typing import Literal as TL
+import threading
+from typing import Generator as TG, Literal as TL
 
 # Local imports
 from define import constants
-from define.base import Base
+from define.base import Base, _overlay
+from define.compiler import Generator
+from define.level import join
+from define.result import Results
+
+# Lock used to create the nodes of lazy Parents
+_lock = threading.RLock()
+
+# The keys which change what kind of instance a definition creates
+_STRUCTURE = frozenset(['__array__', '__hash__', '__options__', '__type__'])
+
+class _Nodes(dict):
+	"""Nodes
+
+	The nodes of a lazy Parent. Stores the definition of each node until the \
+	first time it's used, then creates the instance and stores it instead. \
+	Once every node has been created the Parent goes back to a regular dict
+
+	Extends:
+		dict
+	"""
+
+	__slots__ = ('_parent', '_pending')
+
+	def __init__(self, parent: 'Parent'):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			parent (Parent): The Parent the nodes belong to
+
+		Returns:
+			_Nodes
+		"""
+		super(_Nodes, self).__init__()
+		self._parent = parent
+		self._pending = {}
+
+	def __getitem__(self, key: str) -> Base:
+		"""Get Item (__getitem__)
+
+		Returns the node of the key, creating it if it hasn't been yet
+
+		Arguments:
+			key (str): The key of the node
+
+		Raises:
+			KeyError, ValueError
+
+		Returns:
+			Base
+		"""
+		o = dict.__getitem__(self, key)
+		if o is None:
+			o = self._create(key)
+		return o
+
+	def _create(self, key: str) -> Base:
+		"""Create
+
+		Creates the node of a key from its definition and stores it
+
+		Arguments:
+			key (str): The key of the node
+
+		Raises:
+			KeyError, ValueError
+
+		Returns:
+			Base
+		"""
+
+		# Only allow one thread to create nodes at a time
+		with _lock:
+
+			# If another thread created it while we were waiting
+			if key not in self._pending:
+				return dict.__getitem__(self, key)
+
+			# Create the node, and freeze it if the Parent already is
+			o = self._parent.create(self._pending[key], key, True)
+			if self._parent._frozen:
+				o.freeze()
+
+			# Store it in place of its definition
+			dict.__setitem__(self, key, o)
+			del self._pending[key]
+
+			# If every node has been created, switch the Parent to a regular
+			#	dict so using the nodes costs nothing extra
+			if not self._pending:
+				self._parent._nodes = dict(self)
+
+		# Return the node
+		return o
+
+	def add(self, key: str, details: any) -> None:
+		"""Add
+
+		Adds the definition of a node to be created the first time it's used
+
+		Arguments:
+			key (str): The key of the node
+			details (any): The definition of the node
+
+		Returns:
+			None
+		"""
+		dict.__setitem__(self, key, None)
+		self._pending[key] = details
+
+	def get(self, key: str, default: any = None) -> any:
+		"""Get
+
+		Returns the node of the key, creating it if it hasn't been yet, or \
+		the default if the key doesn't exist
+
+		Arguments:
+			key (str): The key of the node
+			default (any): Optional, returned if the key doesn't exist
+
+		Returns:
+			any
+		"""
+		try:
+			return self[key]
+		except KeyError:
+			if key in self:
+				raise
+			return default
+
+	def items(self):
+		"""Items
+
+		Creates every node left and returns the keys and nodes
+
+		Returns:
+			dict_items
+		"""
+		for k in tuple(self._pending):
+			self[k]
+		return dict.items(self)
+
+	def values(self):
+		"""Values
+
+		Creates every node left and returns the nodes
+
+		Returns:
+			dict_values
+		"""
+		for k in tuple(self._pending):
+			self[k]
+		return dict.values(self)
 
 class Parent(Base):
 	"""Parent
@@ -32,6 +187,8 @@ class Parent(Base):
 		Base
 	"""
 
+	__slots__ = ('_nodes', '_requires')
+
 	def __contains__(self, key):
 		"""Contain (__contains__)
 
@@ -64,7 +221,8 @@ class Parent(Base):
 	def __init__(self,
 		details: dict,
 		extend: dict | TL[False] = False,
-		name: str = None):
+		name: str = None,
+		lazy: bool = False):
 		"""Constructor
 
 		Initialises the instance
@@ -74,6 +232,8 @@ class Parent(Base):
 			extend (dict | False): Optional, a dictionary to extend the \
 				definition
 			name (str): The name if it's a field of another Define
+			lazy (bool): Optional, set to True to only create each node, and \
+				check its definition, the first time it's used
 
 		Raises:
 			KeyError, ValueError
@@ -89,7 +249,7 @@ class Parent(Base):
 		super(Parent, self).__init__(dDetails, name)
 
 		# Init the nodes and requires dicts
-		self._nodes = {}
+		self._nodes = _Nodes(self) if lazy else {}
 		self._requires = {}
 
 		# Go through the keys in the details
@@ -102,12 +262,20 @@ class Parent(Base):
 				if isinstance(dDetails[k], Base):
 
 					# Store it as is
-					self._nodes[k] = dDetails[k]
+					dict.__setitem__(self._nodes, k, dDetails[k])
+
+				# Else, if we're lazy, store the definition for later
+				elif lazy:
+					self._nodes.add(k, dDetails[k])
 
 				# Else, create it
 				else:
 					self._nodes[k] = self.create(dDetails[k], k)
 
+		# If we're lazy but every node was passed already created
+		if lazy and not self._nodes._pending:
+			self._nodes = dict(self._nodes)
+
 		# If there's a require hash available
 		if '__require__' in dDetails:
 			self.requires(dDetails['__require__'])
@@ -122,6 +290,228 @@ class Parent(Base):
 		"""
 		return iter(self._nodes.keys())
 
+	def _accepts(self) -> frozenset | None:
+		"""Accepts
+
+		Returns the exact Python types of the values the instance could be \
+		valid for
+
+		Returns:
+			frozenset | None
+		"""
+
+		# If a child class changed how values are validated, it can't tell
+		if type(self)._valid is not Parent._valid:
+			return None
+		return frozenset([dict])
+
+	def _compile_clean(self, gen: Generator) -> str:
+		"""Compile Clean
+
+		Generates a function which cleans values exactly like clean does, \
+		calling the functions generated for each node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			str
+		"""
+
+		# Store the clean function of each node by key
+		sCleans = gen.assign('{%s}' % ', '.join([
+			'%r: %s' % (k, gen.clean(o)) for k,o in self._nodes.items()
+		]))
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_error('dict', 'not a valid Object')
+
+		# Go through each value and clean it using the associated node
+		lLines.extend([
+			'dRet = {}',
+			'lErrors = []',
+			'for k in value.keys():',
+			'\tlLevel = level + [str(k)]',
+			'\ttry:',
+			'\t\tdRet[k] = %s[k](value[k], lLevel)' % sCleans,
+			'\texcept KeyError:',
+			'\t\tlErrors.append([join(lLevel), \'not a valid node\'])',
+			'\texcept ValueError as e:',
+			'\t\tif isinstance(e.args[0], list):',
+			'\t\t\tlErrors.extend(e.args[0])',
+			'\t\telse:',
+			'\t\t\tlErrors.append([join(lLevel), str(e)])',
+			'if lErrors:',
+			'\traise ValueError(lErrors)',
+			'return dRet'
+		])
+
+		# Add the function
+		sName = gen.unique('_cl')
+		gen.function(sName, 'value, level', lLines)
+
+		# Return the name
+		return sName
+
+	def _compile_valid(self, gen: Generator) -> tuple[str, bool]:
+		"""Compile Valid
+
+		Generates a function which validates values exactly like valid does, \
+		calling the functions generated for each node directly
+
+		Arguments:
+			gen (Generator): The generator to add the function to
+
+		Returns:
+			tuple[str, bool]
+		"""
+
+		# Start with the handling of missing values and invalid types
+		lLines = self._compile_missing()
+		lLines.extend([
+			'if not isinstance(value, dict):',
+			'\tif failures is not None:',
+			'\t\tfailures.append([join(level), str(value)])',
+			'\treturn False',
+			'bRet = True',
+			'iFound = 0'
+		])
+
+		# Go through each node in the instance
+		for k,o in self._nodes.items():
+
+			# Get the function for the node
+			sValid, bDirty = gen.valid(o)
+
+			# If the node exists, validate it
+			lLines.extend([
+				'if %r in value:' % k,
+				'\tiFound += 1',
+				'\tlevel.append(%r)' % k
+			])
+			if bDirty:
+				lLines.append(
+					'\tiFailures = failures and len(failures) or 0'
+				)
+			lLines.extend([
+				'\tbValid = %s(value[%r], ignore_missing, level, failures, ' \
+					'fail_fast)' % (sValid, k),
+				'\tlevel.pop()',
+				'\tif not bValid:',
+				'\t\tif fail_fast:',
+				'\t\t\treturn False',
+				'\t\tbRet = False'
+			])
+
+			# Generate what happens when the node is valid
+			lValid = []
+
+			# If the node can pass while leaving failures, drop them
+			if bDirty:
+				lValid.extend([
+					'\t\tif failures:',
+					'\t\t\tdel failures[iFailures:]'
+				])
+
+			# If the node requires others
+			if self._requires and k in self._requires:
+				for f in self._requires[k]:
+					lValid.extend([
+						'\t\tif %r not in value or ' \
+							'value[%r] in (\'0000-00-00\', \'\', None):' % (
+							f, f
+						),
+						'\t\t\tif failures is not None:',
+						'\t\t\t\tfailures.append([join(level + [%r]), %r])' % (
+							k,
+							'requires \'%s\' to also be set' % str(f)
+						),
+						'\t\t\tif fail_fast:',
+						'\t\t\t\treturn False',
+						'\t\t\tbRet = False'
+					])
+
+			# If there's anything to do when valid
+			if lValid:
+				lLines.append('\telse:')
+				lLines.extend(lValid)
+
+			# If the node is missing and is not optional
+			if not o._optional:
+				lLines.extend([
+					'elif not ignore_missing:',
+					'\tif failures is not None:',
+					'\t\tfailures.append([join(level + [%r]), ' \
+						'\'missing\'])' % k,
+					'\tif fail_fast:',
+					'\t\treturn False',
+					'\tbRet = False'
+				])
+
+		# If we have any extra keys, add each as an unknown
+		lLines.extend([
+			'if iFound != len(value):',
+			'\tbRet = False',
+			'\tfor s in value:',
+			'\t\tif s not in %s:' % gen.constant(frozenset(self._nodes)),
+			'\t\t\tif failures is not None:',
+			'\t\t\t\tfailures.append([join(level + [str(s)]), ' \
+				'\'unknown\'])',
+			'\t\t\tif fail_fast:',
+			'\t\t\t\tbreak',
+			'return bRet'
+		])
+
+		# Add the function
+		sName = gen.unique('_v')
+		gen.function(
+			sName, 'value, ignore_missing, level, failures, fail_fast', lLines
+		)
+
+		# Return the name, a Parent never passes with failures
+		return sName, False
+
+	def _derived(self, details: dict) -> 'Parent':
+		"""Derived
+
+		Creates the instance returned by derive from the details generated
+
+		Arguments:
+			details (dict): The details, with the nodes already created
+
+		Returns:
+			Parent
+		"""
+		return self.__class__(details, False, Base.name(self))
+
+	def _share(self, share: callable) -> None:
+		"""Share
+
+		Replaces every node with its shared instance, creating them first if \
+		the Parent is lazy
+
+		Arguments:
+			share (callable): Returns the shared instance of the one passed
+
+		Returns:
+			None
+		"""
+		self._nodes = {k: share(o) for k,o in self._nodes.items()}
+
+	def _state(self) -> dict:
+		"""State
+
+		Returns the state of the instance to pickle, with every node created \
+		if the Parent is lazy
+
+		Returns:
+			dict
+		"""
+		dRet = super(Parent, self)._state()
+		if isinstance(dRet['_nodes'], _Nodes):
+			dRet['_nodes'] = dict(self._nodes.items())
+		return dRet
+
 	def child(self, key: str, default: any = None):
 		"""Get
 
@@ -131,14 +521,20 @@ class Parent(Base):
 			key (str): The key to get
 			default (any): Optional, value to return if the key does not exist
 
+		Raises:
+			KeyError, ValueError
+
 		Returns:
 			any
 		"""
-		try:
-			return self._nodes[key]
-		except KeyError:
+
+		# If the key doesn't exist
+		if key not in self._nodes:
 			return default
 
+		# Return the node, creating it if the Parent is lazy
+		return self._nodes[key]
+
 	def clean(self, value: dict, level: list = undefined):
 		"""Clean
 
@@ -164,11 +560,11 @@ class Parent(Base):
 				return None
 
 			# Missing value
-			raise ValueError([['.'.join(level), 'missing']])
+			raise ValueError([[join(level), 'missing']])
 
 		# If the value is not a dict
 		if not isinstance(value, dict):
-			raise ValueError([['.'.join(level), 'not a valid Object']])
+			raise ValueError([[join(level), 'not a valid Object']])
 
 		# Init the return value
 		dRet = {}
@@ -179,14 +575,20 @@ class Parent(Base):
 
 			# Add the field to the level
 			lLevel = level[:]
-			lLevel.append(k)
+			lLevel.append(str(k))
+
+			# If there's no node for the field
+			if k not in self._nodes:
+				lErrors.append([join(lLevel), 'not a valid node'])
+				continue
 
 			try:
 				dRet[k] = self._nodes[k].clean(value[k], lLevel)
-			except KeyError:
-				lErrors.append(['.'.join(lLevel), 'not a valid node'])
 			except ValueError as e:
-				lErrors.extend(e.args[0])
+				if isinstance(e.args[0], list):
+					lErrors.extend(e.args[0])
+				else:
+					lErrors.append([join(lLevel), str(e)])
 
 		# If there's any errors
 		if lErrors:
@@ -195,6 +597,82 @@ class Parent(Base):
 		# Return the cleaned values
 		return dRet
 
+	def derive(self, extend: dict) -> 'Parent':
+		"""Derive
+
+		Returns a new instance extended by the dict passed, exactly as if the \
+		definition and extend were passed to the constructor, except that any \
+		node the extend doesn't change is shared with this instance instead \
+		of being created again. Only frozen instances can be derived from, so \
+		that the nodes shared can't be changed
+
+		Arguments:
+			extend (dict): A dictionary to extend the definition
+
+		Raises:
+			KeyError, ValueError
+
+		Returns:
+			Parent
+		"""
+
+		# If the instance isn't frozen
+		if not self._frozen:
+			raise ValueError('instance must be frozen to be derived from')
+
+		# If the extend is invalid
+		if not isinstance(extend, dict):
+			raise ValueError('extend must be a dict')
+
+		# Start with the flags, specials, and requires of the instance, and
+		#	every node as is
+		dDetails = Base.to_dict(self)
+		if self._requires:
+			dDetails['__require__'] = self._requires
+		dDetails.update(self._nodes.items())
+
+		# Go through each value of the extend
+		for k,v in extend.items():
+			m = dDetails.get(k)
+
+			# If it's changing one of the nodes
+			if isinstance(m, Base) and not isinstance(v, Base):
+
+				# If it's a Parent, and the extend doesn't change what it is,
+				#	derive from it so its own nodes are shared as well
+				if isinstance(m, Parent) and isinstance(v, dict) and \
+					_STRUCTURE.isdisjoint(v):
+					dDetails[k] = m.derive(v)
+					continue
+
+				# Else, use the node's definition
+				m = m.to_dict()
+
+			# Merge dicts, overwrite anything else
+			if isinstance(v, dict) and isinstance(m, dict):
+				dDetails[k] = _overlay(m, v)
+			else:
+				dDetails[k] = v
+
+		# Create and return the new instance
+		return self._derived(dDetails)
+
+	def freeze(self) -> 'Parent':
+		"""Freeze
+
+		Stops the instance, and every node in it, from being changed so that \
+		they can be safely shared. Nodes of a lazy Parent which haven't been \
+		created yet are frozen when they are
+
+		Returns:
+			Parent
+		"""
+		with _lock:
+			for o in dict.values(self._nodes):
+				if o is not None:
+					o.freeze()
+			return super(Parent, self).freeze()
+
 	def has_key(self, key: str):
 		"""Has Key
 
@@ -218,6 +696,25 @@ class Parent(Base):
 		"""
 		return tuple(self._nodes.keys())
 
+	def materialize(self) -> 'Parent':
+		"""Materialize
+
+		Creates every node of a lazy Parent, and of every lazy Parent in it, \
+		so that any errors in the definition are raised right away instead \
+		of the first time a node is used. Does nothing to a Parent which \
+		isn't lazy
+
+		Raises:
+			KeyError, ValueError
+
+		Returns:
+			Parent
+		"""
+		for o in self._nodes.values():
+			if isinstance(o, Parent):
+				o.materialize()
+		return self
+
 	@property
 	def nodes(self):
 		"""Nodes Property
@@ -238,7 +735,7 @@ class Parent(Base):
 			require (dict): A dictionary expressing requirements of fields
 
 		Raises:
-			ValueError
+			RuntimeError, ValueError
 
 		Returns:
 			None
@@ -248,6 +745,9 @@ class Parent(Base):
 		if require is undefined:
 			return self._requires
 
+		# If the instance is frozen, it can't be changed
+		self._check_frozen()
+
 		# If it's not a valid dict
 		if not isinstance(require, dict):
 			raise ValueError('__require__ must be a valid dict')
@@ -311,27 +811,134 @@ class Parent(Base):
 		# Return
 		return dRet
 
-	def valid(self,
-		value: dict,
+	def valid_columns(self,
+		columns: dict,
 		ignore_missing = False,
-		level: list = []
-	) -> bool:
-		"""Valid
+		level: list[str] = undefined
+	) -> Results:
+		"""Valid Columns
 
-		Checks if a value is valid based on the instance's values. If any \
-		errors occur, they can be found in [instance].validation_failures as a \
-		list
+		Checks a batch of values stored as columns, one list (or array) of \
+		values per field, instead of as a list of dicts. Each node checks its \
+		entire column at once and the results are the same as calling \
+		valid_many on the rows the columns represent
 
 		Arguments:
-			value (any): The value to validate
+			columns (dict): The list of values of each field, by field name
 			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			level (list): Optional, the level the rows are validated at
+
+		Raises:
+			ValueError
 
 		Returns:
-			bool
+			Results
 		"""
 
-		# Reset validation failures
-		self._validation_failures = []
+		# If the level isn't passed
+		if level is undefined:
+			level = []
+
+		# If the columns are not a dict
+		if not isinstance(columns, dict):
+			raise ValueError('columns must be a dict')
+
+		# Make sure every column has the same number of rows
+		seLengths = set([len(l) for l in columns.values()])
+		if len(seLengths) > 1:
+			raise ValueError('columns must all be the same length')
+		iRows = seLengths and seLengths.pop() or 0
+
+		# Init the failures by row
+		dFailures = {}
+
+		# Go through each node in the instance
+		for k in self._nodes:
+
+			# Add the field to the level
+			lLevel = level[:]
+			lLevel.append(k)
+
+			# If we are missing the column
+			if k not in columns:
+
+				# If the value is not optional and we aren't ignoring missing,
+				#	every row is missing it
+				if not self._nodes[k]._optional and not ignore_missing:
+					sField = join(lLevel)
+					for i in range(iRows):
+						dFailures.setdefault(i, []).append([sField, 'missing'])
+
+				# Continue to next node
+				continue
+
+			# Check the entire column
+			seInvalid = self._nodes[k]._valid_column(
+				columns[k], ignore_missing, lLevel, dFailures
+			)
+
+			# If the element requires others
+			if self._requires and k in self._requires:
+
+				# Go through each required field
+				for f in self._requires[k]:
+					sError = 'requires \'%s\' to also be set' % str(f)
+					mColumn = columns.get(f)
+
+					# Go through each row the element was valid in
+					for i in range(iRows):
+						if i in seInvalid:
+							continue
+
+						# If the field doesn't exist in the row
+						if mColumn is None or \
+							mColumn[i] in ('0000-00-00','',None):
+							dFailures.setdefault(i, []).append(
+								[join(lLevel), sError]
+							)
+
+		# Go through each column without a node and add each row as unknown
+		for s in columns:
+			if s not in self._nodes:
+				lLevel = level[:]
+				lLevel.append(s)
+				sField = join(lLevel)
+				for i in range(iRows):
+					dFailures.setdefault(i, []).append([sField, 'unknown'])
+
+		# Return the results, with the failures in row order
+		return Results(
+			[i not in dFailures for i in range(iRows)],
+			{i: dFailures[i] for i in sorted(dFailures)}
+		)
+
+	_valid = Base._run
+	"""Checks values by walking them with _walk"""
+
+	def _walk(self,
+		value: dict,
+		ignore_missing: bool,
+		level: list[str],
+		failures: list[list[str]] | None,
+		fail_fast: bool
+	) -> TG[tuple, bool, bool]:
+		"""Walk
+
+		Checks if a value is valid based on the instance's values, adding any \
+		failures to the list passed, yielding each of its nodes, the value of \
+		the node, and fail_fast, to be checked, and receiving the result
+
+		Arguments:
+			value (dict): The value to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The keys to the value from the top of the structure
+			failures (list): The list to add [field, error] failures to, or \
+				None to only get the result
+			fail_fast (bool): Set to True to stop at the first failure
+
+		Returns:
+			Generator
+		"""
 
 		# If the value is None
 		if value is None:
@@ -341,11 +948,13 @@ class Parent(Base):
 				return True
 
 			# Invalid value
-			self._validation_failures.append(['.'.join(level), 'missing'])
+			if failures is not None:
+				failures.append([join(level), 'missing'])
 
 		# If the value isn't a dictionary
 		if not isinstance(value, dict):
-			self._validation_failures.append(['.'.join(level), str(value)])
+			if failures is not None:
+				failures.append([join(level), str(value)])
 			return False
 
 		# Init the return, assume valid
@@ -357,34 +966,44 @@ class Parent(Base):
 		# Go through each node in the instance
 		for k in self._nodes:
 
-			# Add the field to the level
-			lLevel = level[:]
-			lLevel.append(k)
-
 			# If we are missing a node
 			if k not in value:
 
 				# If the value is not optional and we aren't ignoring missing
 				if not self._nodes[k]._optional and not ignore_missing:
-					self._validation_failures.append(
-						['.'.join(lLevel), 'missing']
-					)
+					if failures is not None:
+						failures.append(
+							[join(level + [k]), 'missing']
+						)
 					bRet = False
 
+					# If we only need the first failure
+					if fail_fast:
+						return False
+
 				# Continue to next node
 				continue
 
 			# Remove it from the list of keys sent
 			lKeys.remove(k)
 
+			# Add the field to the level while the element is checked
+			level.append(k)
+			iFailures = failures and len(failures) or 0
+			bValid = yield self._nodes[k], value[k], fail_fast
+			level.pop()
+
 			# If the element isn't valid, return false
-			if not self._nodes[k].valid(value[k], ignore_missing, lLevel):
-				self._validation_failures.extend(
-					self._nodes[k].validation_failures
-				)
+			if not bValid:
+				if fail_fast:
+					return False
 				bRet = False
 				continue
 
+			# Drop anything the valid element may have left behind
+			if failures:
+				del failures[iFailures:]
+
 			# If the element requires others
 			if k in self._requires:
 
@@ -393,10 +1012,13 @@ class Parent(Base):
 
 					# If the field doesn't exist in the value
 					if f not in value or value[f] in ('0000-00-00','',None):
-						self._validation_failures.append([
-							'.'.join(lLevel),
-							'requires \'%s\' to also be set' % str(f)
-						])
+						if failures is not None:
+							failures.append([
+								join(level + [k]),
+								'requires \'%s\' to also be set' % str(f)
+							])
+						if fail_fast:
+							return False
 						bRet = False
 
 		# If we have any extra keys
@@ -405,11 +1027,12 @@ class Parent(Base):
 			# Set this as a failure
 			bRet = False
 
-			# Add each as an unknown
+			# Add each as an unknown, or just the first
 			for s in lKeys:
-				lLevel = level[:]
-				lLevel.append(s)
-				self._validation_failures.append(['.'.join(lLevel), 'unknown'])
+				if failures is not None:
+					failures.append([join(level + [str(s)]), 'unknown'])
+				if fail_fast:
+					break
 
 		# Return whatever the result was
 		return bRet
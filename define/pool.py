@@ -0,0 +1,274 @@
+# coding=utf8
+"""Pool
+
+Validates batches of values across a pool of processes, each holding its \
+own copy of the definition
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['Pool']
+
+# Python imports
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Iterable
+
+# Local imports
+from define.result import Results
+
+# The compiled definition used by the current process
+_compiled = None
+
+def _init(tree: 'Tree') -> None:
+	"""Init
+
+	Compiles the definition, once, when a process starts
+
+	Arguments:
+		tree (Tree): The copy of the Tree sent to the process, pickled \
+			whole, as to_dict doesn't keep everything a Tree holds
+
+	Returns:
+		None
+	"""
+	global _compiled
+	_compiled = tree.compile()
+
+def _valid_many(
+	values: list,
+	ignore_missing: bool,
+	fail_fast: bool
+) -> tuple[list[bool], dict[int, list[list[str]]]]:
+	"""Valid Many
+
+	Validates a chunk of values in the current process and returns the \
+	valid flags and failures to be merged by the pool
+
+	Arguments:
+		values (list): The values to validate
+		ignore_missing (bool): Set to True to ignore missing nodes
+		fail_fast (bool): Set to True to only keep the first failure of each \
+			value
+
+	Returns:
+		tuple[list, dict]
+	"""
+	oResults = _compiled.valid_many(values, ignore_missing, fail_fast)
+	return oResults.valid, oResults.failures
+
+class Pool(object):
+	"""Pool
+
+	Returned by Tree.pool, validates batches of values across a pool of \
+	processes. The definition is sent to each process once, when it starts, \
+	instead of with every batch, and values are sent in chunks as they are \
+	read from the iterable
+	"""
+
+	def __init__(self,
+		tree: 'Tree',
+		workers: int = None,
+		chunk_size: int = 1000
+	):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			tree (Tree): The Tree to validate values against
+			workers (uint): Optional, the number of processes to use, \
+				defaults to the number of cores
+			chunk_size (uint): Optional, the number of values sent to a \
+				process at a time
+
+		Raises:
+			ValueError
+
+		Returns:
+			Pool
+		"""
+
+		# If the workers or chunk size are invalid
+		if workers is not None and (not isinstance(workers, int) or \
+			workers < 1
+		):
+			raise ValueError('workers must be an int of at least 1')
+		if not isinstance(chunk_size, int) or chunk_size < 1:
+			raise ValueError('chunk_size must be an int of at least 1')
+
+		# Store the tree and chunk size
+		self._tree = tree
+		self._chunk_size = chunk_size
+
+		# Store the number of processes
+		self._workers = workers or os.cpu_count() or 1
+
+		# If there's only one process, validate in this one, else start the
+		#	pool, each process compiling the definition once
+		if self._workers == 1:
+			self._compiled = tree.compile()
+			self._executor = None
+		else:
+			self._compiled = None
+			self._executor = ProcessPoolExecutor(
+				max_workers = self._workers,
+				initializer = _init,
+				initargs = (tree,)
+			)
+
+	def __enter__(self):
+		"""Enter (__enter__)
+
+		Allows using the pool in a with statement
+
+		Returns:
+			Pool
+		"""
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		"""Exit (__exit__)
+
+		Shuts down the processes at the end of a with statement
+
+		Returns:
+			None
+		"""
+		self.close()
+
+	def __repr__(self):
+		"""Representation (__repr__)
+
+		Returns a string representation of the instance
+
+		Returns:
+			str
+		"""
+		return '<Pool: %s, %d workers>' % (repr(self._tree), self._workers)
+
+	def _chunks(self, values: Iterable) -> Iterable[list]:
+		"""Chunks
+
+		Splits the values into lists of at most chunk_size values, without \
+		reading the whole iterable
+
+		Arguments:
+			values (iterable): The values to split
+
+		Returns:
+			iterable
+		"""
+
+		# Init the chunk
+		lChunk = []
+
+		# Go through each value
+		for v in values:
+			lChunk.append(v)
+
+			# If the chunk is full, return it and start a new one
+			if len(lChunk) == self._chunk_size:
+				yield lChunk
+				lChunk = []
+
+		# If there's anything left
+		if lChunk:
+			yield lChunk
+
+	@staticmethod
+	def _merge(
+		chunk: tuple[list[bool], dict[int, list[list[str]]]],
+		valid: list[bool],
+		failures: dict[int, list[list[str]]]
+	) -> None:
+		"""Merge
+
+		Adds the results of a chunk to the results of the batch, moving the \
+		position of each failure by the number of values before the chunk
+
+		Arguments:
+			chunk (tuple): The valid flags and failures of the chunk
+			valid (bool[]): The valid flags of the batch
+			failures (dict): The failures of the batch by position
+
+		Returns:
+			None
+		"""
+
+		# Add the flags, and each failure after the ones already added
+		iOffset = len(valid)
+		valid.extend(chunk[0])
+		for i, l in chunk[1].items():
+			failures[iOffset + i] = l
+
+	def close(self) -> None:
+		"""Close
+
+		Shuts down the processes, waiting for any work left to finish
+
+		Returns:
+			None
+		"""
+		if self._executor is not None:
+			self._executor.shutdown()
+			self._executor = None
+
+	def valid_many(self,
+		values: Iterable,
+		ignore_missing = False,
+		fail_fast = False
+	) -> Results:
+		"""Valid Many
+
+		Checks if every value in a batch is valid and returns whether each \
+		one was, along with the failures of the invalid ones by position, \
+		exactly as Tree.valid_many does
+
+		Arguments:
+			values (iterable): The values to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop each value at, and \
+				only return, its first failure
+
+		Raises:
+			RuntimeError
+
+		Returns:
+			Results
+		"""
+
+		# If we are validating in this process
+		if self._compiled is not None:
+			return self._compiled.valid_many(values, ignore_missing, fail_fast)
+
+		# If the pool was closed
+		if self._executor is None:
+			raise RuntimeError('pool is closed')
+
+		# Init the results
+		lValid = []
+		dFailures = {}
+
+		# Keep a few chunks per process queued, and merge the results in
+		#	order as they finish, so the values are never all sent at once
+		iQueue = self._workers * 2
+		qPending = deque()
+		for lChunk in self._chunks(values):
+			qPending.append(self._executor.submit(
+				_valid_many, lChunk, ignore_missing, fail_fast
+			))
+			if len(qPending) >= iQueue:
+				self._merge(qPending.popleft().result(), lValid, dFailures)
+
+		# Merge whatever is left
+		while qPending:
+			self._merge(qPending.popleft().result(), lValid, dFailures)
+
+		# Return the results
+		return Results(lValid, dFailures)
@@ -0,0 +1,341 @@
+# coding=utf8
+"""Result
+
+Holds the outcome of validating a single value, or a batch of values
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['Result', 'Results']
+
+# Python imports
+from decimal import InvalidOperation as DecimalInvalid
+from typing import Callable, Iterable
+
+# Local imports
+from define.level import join
+
+class Result(object):
+	"""Result
+
+	Returned by validate, holds whether the value was valid and the failures \
+	found, so that nothing about the call has to be stored on the shared \
+	Define instance
+	"""
+
+	def __init__(self, valid: bool, failures: list[list[str]]):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			valid (bool): Whether the value was valid
+			failures (list): The list of [field, error] failures found
+
+		Returns:
+			Result
+		"""
+		self._valid = valid
+		self._failures = failures
+
+	def __bool__(self):
+		"""Bool (__bool__)
+
+		Allows using the result directly as the valid flag
+
+		Returns:
+			bool
+		"""
+		return self._valid
+
+	def __eq__(self, other):
+		"""Equals (__eq__)
+
+		Returns whether another result holds the same outcome
+
+		Arguments:
+			other (Result): The result to compare to
+
+		Returns:
+			bool
+		"""
+		if not isinstance(other, Result):
+			return NotImplemented
+		return self._valid == other._valid and \
+			self._failures == other._failures
+
+	def __repr__(self):
+		"""Representation (__repr__)
+
+		Returns a string representation of the instance
+
+		Returns:
+			str
+		"""
+		return '<Result: %s %s>' % (str(self._valid), str(self._failures))
+
+	@property
+	def failures(self) -> list[list[str]]:
+		"""Failures
+
+		Returns the failures found as a read only property
+
+		Returns:
+			[field, error][]
+		"""
+		return self._failures
+
+	@property
+	def valid(self) -> bool:
+		"""Valid
+
+		Returns whether the value was valid as a read only property
+
+		Returns:
+			bool
+		"""
+		return self._valid
+
+class Results(object):
+	"""Results
+
+	Returned by valid_many and clean_many, holds whether each value in the \
+	batch was valid, and the failures of those which weren't, by their \
+	position in the batch
+	"""
+
+	def __init__(self,
+		valid: list[bool],
+		failures: dict[int, list[list[str]]],
+		values: list[any] = None
+	):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			valid (bool[]): Whether each value was valid
+			failures (dict): The list of [field, error] failures of each \
+				invalid value, by position
+			values (list): Optional, the cleaned values, None for any which \
+				failed
+
+		Returns:
+			Results
+		"""
+		self._valid = valid
+		self._failures = failures
+		self._values = values
+
+	def __bool__(self):
+		"""Bool (__bool__)
+
+		Returns True only if every value in the batch was valid
+
+		Returns:
+			bool
+		"""
+		return not self._failures
+
+	def __getitem__(self, index: int) -> Result:
+		"""Get Item (__getitem__)
+
+		Returns the result of a single value in the batch
+
+		Arguments:
+			index (int): The position of the value
+
+		Raises:
+			IndexError
+
+		Returns:
+			Result
+		"""
+		return Result(self._valid[index], self._failures.get(index, []))
+
+	def __iter__(self):
+		"""Iterator (__iter__)
+
+		Returns an iterator to the result of each value in the batch
+
+		Returns:
+			Iterator
+		"""
+		for i in range(len(self._valid)):
+			yield self[i]
+
+	def __len__(self):
+		"""Length (__len__)
+
+		Returns the number of values in the batch
+
+		Returns:
+			uint
+		"""
+		return len(self._valid)
+
+	def __repr__(self):
+		"""Representation (__repr__)
+
+		Returns a string representation of the instance
+
+		Returns:
+			str
+		"""
+		return '<Results: %d valid, %d invalid>' % (
+			len(self._valid) - len(self._failures),
+			len(self._failures)
+		)
+
+	@classmethod
+	def clean(cls,
+		clean: Callable,
+		values: Iterable,
+		level: list[str]
+	) -> 'Results':
+		"""Clean
+
+		Cleans every value in the batch using the clean function of a \
+		definition, keeping the errors of those that fail instead of stopping, \
+		including those of values which can't be converted to their type
+
+		Arguments:
+			clean (callable): The clean(value, level) function to use
+			values (iterable): The values to clean
+			level (list): The level the values are cleaned at
+
+		Returns:
+			Results
+		"""
+
+		# Init the lists and failures
+		lValid = []
+		lValues = []
+		dFailures = {}
+
+		# Go through each value
+		for i, v in enumerate(values):
+
+			# Clean it, or store the errors
+			try:
+				lValues.append(clean(v, level))
+				lValid.append(True)
+			except (DecimalInvalid, TypeError, ValueError) as e:
+				lValues.append(None)
+				lValid.append(False)
+
+				# If it's the list of failures raised by clean, store it,
+				#	else it failed to be converted, store the message at the
+				#	level
+				if isinstance(e, ValueError) and e.args and \
+					isinstance(e.args[0], list):
+					dFailures[i] = e.args[0]
+				else:
+					dFailures[i] = [[join(level), (
+						e.args and isinstance(e.args[0], str) and e.args[0] \
+						or 'can not be converted'
+					)]]
+
+		# Return the results
+		return cls(lValid, dFailures, lValues)
+
+	@property
+	def failures(self) -> dict[int, list[list[str]]]:
+		"""Failures
+
+		Returns the failures of each invalid value by position
+
+		Returns:
+			dict
+		"""
+		return self._failures
+
+	@property
+	def invalid(self) -> list[int]:
+		"""Invalid
+
+		Returns the positions of the invalid values
+
+		Returns:
+			int[]
+		"""
+		return list(self._failures.keys())
+
+	@classmethod
+	def validate(cls,
+		valid: Callable,
+		values: Iterable,
+		ignore_missing: bool,
+		level: list[str],
+		fail_fast: bool
+	) -> 'Results':
+		"""Validate
+
+		Validates every value in the batch using the _valid function of a \
+		definition. The level and the list of failures are shared by every \
+		value, and a new list is only created when a value fails
+
+		Arguments:
+			valid (callable): The _valid(value, ignore_missing, level, \
+				failures, fail_fast) function to use
+			values (iterable): The values to validate
+			ignore_missing (bool): Set to True to ignore missing nodes
+			level (list): The level the values are validated at
+			fail_fast (bool): Set to True to only keep the first failure of \
+				each value
+
+		Returns:
+			Results
+		"""
+
+		# Init the list, failures, and the working list of failures
+		lValid = []
+		dFailures = {}
+		lFailures = []
+
+		# Go through each value
+		for i, v in enumerate(values):
+
+			# If it's valid, drop anything it may have left behind
+			if valid(v, ignore_missing, level, lFailures, fail_fast):
+				lValid.append(True)
+				if lFailures:
+					del lFailures[:]
+
+			# Else, keep its failures and start a new list
+			else:
+				lValid.append(False)
+				if fail_fast:
+					del lFailures[1:]
+				dFailures[i] = lFailures
+				lFailures = []
+
+		# Return the results
+		return cls(lValid, dFailures)
+
+	@property
+	def valid(self) -> list[bool]:
+		"""Valid
+
+		Returns whether each value in the batch was valid
+
+		Returns:
+			bool[]
+		"""
+		return self._valid
+
+	@property
+	def values(self) -> list[any] | None:
+		"""Values
+
+		Returns the cleaned values, with None in place of those that failed, \
+		or None if the batch was only validated
+
+		Returns:
+			list | None
+		"""
+		return self._values
@@ -0,0 +1,183 @@
+# coding=utf8
+"""Snapshot
+
+Stores fully built instances in a compact binary file that can be loaded \
+without parsing JSON or running any of the constructors again
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['dump', 'load', 'VERSION']
+
+# Python imports
+import io
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import zlib
+
+# Local imports
+from define import strategies
+from define.base import Base
+
+VERSION = 7
+"""The version of the format, changed whenever the data stored on instances \
+changes, so older snapshots are refused instead of loaded wrong"""
+
+# The header at the start of every snapshot, the marker and the version
+_HEADER = struct.Struct('<8sH')
+_MARKER = b'DEFINE\x00S'
+
+# The only globals, other than the classes, a snapshot can reference
+_ALLOWED = {
+	('builtins', 'bool'),
+	('builtins', 'dict'),
+	('builtins', 'float'),
+	('builtins', 'frozenset'),
+	('builtins', 'int'),
+	('builtins', 'list'),
+	('builtins', 'str'),
+	('decimal', 'Decimal'),
+	('define.array', '_unique_key'),
+	('re', '_compile')
+}
+_ALLOWED.update(('define.strategies', s) for s in strategies.FUNCTIONS)
+
+class _Unpickler(pickle.Unpickler):
+	"""Unpickler
+
+	Only allows loading the Define classes, and the few other values stored \
+	on instances, so that loading a snapshot can never call anything else
+
+	Extends:
+		pickle.Unpickler
+	"""
+
+	def find_class(self, module: str, name: str) -> any:
+		"""Find Class
+
+		Returns the global requested if it's allowed
+
+		Arguments:
+			module (str): The name of the module
+			name (str): The name of the global in the module
+
+		Raises:
+			pickle.UnpicklingError
+
+		Returns:
+			any
+		"""
+
+		# If it's one of the few values allowed
+		if (module, name) in _ALLOWED:
+			return super().find_class(module, name)
+
+		# If it's a class extending Base, from a module already loaded
+		if module in sys.modules:
+			m = getattr(sys.modules[module], name, None)
+			if isinstance(m, type) and issubclass(m, Base):
+				return m
+
+		# Anything else is refused
+		raise pickle.UnpicklingError(
+			'"%s.%s" is not allowed in a snapshot' % (module, name)
+		)
+
+def dump(instance: Base, filename: str) -> None:
+	"""Dump
+
+	Stores the instance, and all its children, in a snapshot file. The file \
+	is written in full before replacing any existing one
+
+	Arguments:
+		instance (Base): The instance to store
+		filename (str): The path to the file
+
+	Raises:
+		OSError, ValueError
+
+	Returns:
+		None
+	"""
+
+	# If the instance isn't a Define one
+	if not isinstance(instance, Base):
+		raise ValueError('instance must extend Base')
+
+	# Generate the data, compressed as the same names and types repeat for
+	#	every instance
+	bData = _HEADER.pack(_MARKER, VERSION) + zlib.compress(
+		pickle.dumps(instance, pickle.HIGHEST_PROTOCOL)
+	)
+
+	# Write it to a temporary file in the same directory, then replace the
+	#	original with it
+	sPath = os.path.abspath(os.path.expanduser(filename))
+	iFile, sTemp = tempfile.mkstemp(
+		dir = os.path.dirname(sPath), prefix = '.snapshot-'
+	)
+	try:
+		with os.fdopen(iFile, 'wb') as oFile:
+			oFile.write(bData)
+		os.replace(sTemp, sPath)
+	except BaseException:
+		os.unlink(sTemp)
+		raise
+
+def load(filename: str) -> Base:
+	"""Load
+
+	Loads an instance from a snapshot file
+
+	Arguments:
+		filename (str): The path to the file
+
+	Raises:
+		OSError, ValueError
+
+	Returns:
+		Base
+	"""
+
+	# Read the file
+	with open(os.path.expanduser(filename), 'rb') as oFile:
+		bData = oFile.read()
+
+	# If the header is missing, or it's not a snapshot
+	if len(bData) < _HEADER.size:
+		raise ValueError('"%s" is not a snapshot' % filename)
+	sMarker, iVersion = _HEADER.unpack_from(bData)
+	if sMarker != _MARKER:
+		raise ValueError('"%s" is not a snapshot' % filename)
+
+	# If it's from another version
+	if iVersion != VERSION:
+		raise ValueError(
+			'"%s" is version %d, expected %d' % (filename, iVersion, VERSION)
+		)
+
+	# Load the instance
+	try:
+		oRet = _Unpickler(io.BytesIO(
+			zlib.decompress(memoryview(bData)[_HEADER.size:])
+		)).load()
+	except (
+		AttributeError, EOFError, pickle.UnpicklingError, zlib.error
+	) as e:
+		raise ValueError('"%s" is not a valid snapshot: %s' % (
+			filename, str(e)
+		))
+
+	# If it's not a Define instance
+	if not isinstance(oRet, Base):
+		raise ValueError('"%s" is not a valid snapshot' % filename)
+
+	# Return the instance
+	return oRet
@@ -0,0 +1,63 @@
+# coding=utf8
+"""Steps
+
+Counts the checks made by cooperative async validation so it knows when to \
+give control back to the event loop
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['Steps']
+
+class Steps(object):
+	"""Steps
+
+	Shared by every instance checked during a single cooperative validation, \
+	counts down the checks left before the event loop has to be given a turn
+	"""
+
+	def __init__(self, every: int):
+		"""Constructor
+
+		Initialises the instance
+
+		Arguments:
+			every (uint): The number of checks between each turn
+
+		Raises:
+			ValueError
+
+		Returns:
+			Steps
+		"""
+
+		# If every is invalid
+		if not isinstance(every, int) or every < 1:
+			raise ValueError('every must be an int of at least 1')
+
+		# Store the number of checks between turns, and the checks left
+		self._every = every
+		self._left = every
+
+	def step(self) -> bool:
+		"""Step
+
+		Counts a check and returns True if it's time to give the event loop a \
+		turn
+
+		Returns:
+			bool
+		"""
+
+		# Count the check, if there's any left, keep going
+		self._left -= 1
+		if self._left:
+			return False
+
+		# Start counting again, and let the caller know it's time
+		self._left = self._every
+		return True
@@ -0,0 +1,856 @@
+# coding=utf8
+"""Strategies
+
+The functions which validate and clean the values of each type of Node. \
+Nodes look up the functions of their type, and limits, once, when they are \
+created or changed, so checking a value is a single call instead of going \
+through every type
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['CLEAN', 'FUNCTIONS', 'limit', 'VALID']
+
+# Ouroboros imports
+import jsonb
+
+# Python imports
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation as DecimalInvalid
+import hashlib
+
+# Local imports
+from define import constants, validators
+from define.level import join
+
+# There is no way to access the real type of md5 hashes so unfortunately we
+#	have to do this ugly hack
+_MD5_TYPE = type(hashlib.md5(b'hack'))
+
+# The string types which are only checked against their validator
+_TEXT = ['base64', 'tuuid', 'tuuid4', 'uuid', 'uuid4']
+
+# The values of a string which are valid for a bool
+_BOOL_STRINGS = frozenset([
+	'on', 'true', 't', 'yes', 'y', 'x', '1', '', 'false', 'f', 'no', 'n',
+	'off', '0'
+])
+
+# The values of a string which clean to True for a bool
+_BOOL_TRUE = frozenset([
+	'true', 'True', 'TRUE', 't', 'T', 'yes', 'Yes', 'YES', 'y', 'Y', 'x', '1'
+])
+
+def _clean_any(value: any) -> any:
+	"""Clean Any
+
+	There is no reasonable expectation that we know what the value should \
+	be, so it's returned as is
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		any
+	"""
+	return value
+
+def _clean_bool(value: any) -> bool:
+	"""Clean Bool
+
+	Strings need to match a specific pattern to be true, anything else is \
+	true if it flags as positive
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, str):
+		return value in _BOOL_TRUE
+	return value and True or False
+
+def _clean_date(value: any) -> str:
+	"""Clean Date
+
+	Uses strftime on python types, and makes sure anything else is a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if isinstance(value, (date, datetime)):
+		return value.strftime('%Y-%m-%d')
+	if isinstance(value, str):
+		return value
+	return str(value)
+
+def _clean_datetime(value: any) -> str:
+	"""Clean Date/Time
+
+	Uses strftime on python types, and makes sure anything else is a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if isinstance(value, datetime):
+		return value.strftime('%Y-%m-%d %H:%M:%S')
+	if isinstance(value, date):
+		return '%s 00:00:00' % value.strftime('%Y-%m-%d')
+	if isinstance(value, str):
+		return value
+	return str(value)
+
+def _clean_decimal(value: any) -> str:
+	"""Clean Decimal
+
+	Converts the value to a Decimal, and returns it as a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if not isinstance(value, Decimal):
+		value = Decimal(value)
+	return '{0:f}'.format(value)
+
+def _clean_float(value: any) -> float:
+	"""Clean Float
+
+	Converts the value to a float
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		float
+	"""
+	return float(value)
+
+def _clean_int(value: any) -> int:
+	"""Clean Int
+
+	Converts the value to an int, strings can be in any base python \
+	understands
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		int
+	"""
+	if isinstance(value, str):
+		return int(value, 0)
+	if not isinstance(value, int):
+		return int(value)
+	return value
+
+def _clean_json(value: any) -> str:
+	"""Clean JSON
+
+	Encodes anything that isn't already a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if isinstance(value, str):
+		return value
+	return jsonb.encode(value)
+
+def _clean_md5(value: any) -> str:
+	"""Clean MD5
+
+	Gets the hexadecimal digest of python hashes, and makes sure anything \
+	else is a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if isinstance(value, _MD5_TYPE):
+		return value.hexdigest()
+	if isinstance(value, str):
+		return value
+	return str(value)
+
+def _clean_price(value: any) -> str:
+	"""Clean Price
+
+	Converts the value to a Decimal, and returns it as a string with 2 \
+	decimal places
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if not isinstance(value, Decimal):
+		value = Decimal(value)
+	return '{0:f}'.format(value.quantize(Decimal('1.00')))
+
+def _clean_str(value: any) -> str:
+	"""Clean String
+
+	Makes sure the value is a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if not isinstance(value, str):
+		return str(value)
+	return value
+
+def _clean_time(value: any) -> str:
+	"""Clean Time
+
+	Uses strftime on python types, and makes sure anything else is a string
+
+	Arguments:
+		value (any): The value to clean
+
+	Returns:
+		str
+	"""
+	if isinstance(value, (time, datetime)):
+		return value.strftime('%H:%M:%S')
+	if isinstance(value, str):
+		return value
+	return str(value)
+
+def _fail(level: list[str], failures: list | None, message: str) -> bool:
+	"""Fail
+
+	Adds the failure for the current level, if failures are kept, and \
+	returns False
+
+	Arguments:
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add the failure to, or None
+		message (str): The failure message
+
+	Returns:
+		False
+	"""
+	if failures is not None:
+		failures.append([join(level), message])
+	return False
+
+def _limit_options(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Limit Options
+
+	Checks the value is one of the Node's options
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if value not in node._options_set:
+		return _fail(level, failures, 'not in options')
+	return True
+
+def _limit_range(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Limit Range
+
+	Checks the value is not below the Node's minimum, or above its maximum
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if node._minimum and value < node._minimum:
+		return _fail(level, failures, 'did not meet minimum')
+	if node._maximum and value > node._maximum:
+		return _fail(level, failures, 'exceeds maximum')
+	return True
+
+def _valid_any(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Any
+
+	Any value is valid
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_bool(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Bool
+
+	Checks the value is a bool, 0 or 1, or a string representing one
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If it's already a bool, or an int at 0 or 1
+	if isinstance(value, bool):
+		return True
+	if isinstance(value, int) and value in [0, 1]:
+		return True
+
+	# Else if it's a string, it has to be a valid true or false string
+	if isinstance(value, str):
+		if value.lower() in _BOOL_STRINGS:
+			return True
+		return _fail(
+			level, failures, 'not a valid string representation of a bool'
+		)
+
+	# Else it's no valid type
+	return _fail(level, failures, 'not valid bool replacement')
+
+def _valid_date(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Date
+
+	Checks the value is a date, or a string representing one
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, (date, datetime)):
+		value = value.strftime('%Y-%m-%d')
+	elif not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match['date'](value):
+		return _fail(level, failures, 'invalid')
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_datetime(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Date/Time
+
+	Checks the value is a date or datetime, or a string representing a \
+	date and time
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, datetime):
+		value = value.strftime('%Y-%m-%d %H:%M:%S')
+	elif isinstance(value, date):
+		value = '%s 00:00:00' % value.strftime('%Y-%m-%d')
+	elif not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match['datetime'](value):
+		return _fail(level, failures, 'invalid')
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_decimal(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Decimal
+
+	Checks the value is a Decimal, or can be converted to one
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the type is a bool, fail immediately
+	if type(value) == bool:
+		return _fail(level, failures, 'is a bool')
+
+	# If it's not already a Decimal, and we fail to convert the value
+	if not isinstance(value, Decimal):
+		try: value = Decimal(value)
+		except (DecimalInvalid, TypeError, ValueError):
+			return _fail(level, failures, 'can not be converted to decimal')
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_float(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Float
+
+	Checks the value is a float, or can be converted to one
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the type is a bool, fail immediately
+	if type(value) == bool:
+		return _fail(level, failures, 'is a bool')
+
+	# If it's not already a float, and we fail to convert the value
+	if not isinstance(value, float):
+		try: value = float(value)
+		except (ValueError, TypeError):
+			return _fail(level, failures, 'can not be converted to float')
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_int(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Int
+
+	Checks the value is an int, or a string representing one, and that it's \
+	not signed if the Node's type is unsigned
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the type is a bool, fail immediately
+	if type(value) == bool:
+		return _fail(level, failures, 'is a bool')
+
+	# If it's not an int, but it's a valid representation of one, convert it
+	if not isinstance(value, int):
+		if isinstance(value, str) and constants.regex['int'].match(value):
+			value = int(value, 0)
+		else:
+			return _fail(level, failures, 'not an integer')
+
+	# If it's not signed, and the value is below 0
+	if value < 0 and node._type != 'int':
+		return _fail(level, failures, 'signed')
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_ip(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid IP
+
+	Checks the value is a string representing an IP, and that it's between \
+	the Node's minimum and maximum IPs, if it has them
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the value is not a string, or it's not an IP
+	if not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match['ip'](value):
+		return _fail(level, failures, 'invalid')
+
+	# If there's a min or a max, check them instead of any other limits
+	if node._minimum is not None or node._maximum is not None:
+		if node._maximum is not None and \
+			node.compare_ips(value, node._maximum) == 1:
+			return _fail(level, failures, 'exceeds maximum')
+		if node._minimum is not None and \
+			node.compare_ips(value, node._minimum) == -1:
+			return _fail(level, failures, 'did not meet minimum')
+		return True
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_json(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid JSON
+
+	Checks strings can be decoded from JSON, and anything else can be \
+	encoded to it
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, str):
+		try:
+			jsonb.decode(value)
+			return True
+		except ValueError:
+			return _fail(level, failures, 'Can not be decoded from JSON')
+	try:
+		jsonb.encode(value)
+		return True
+	except (ValueError, TypeError):
+		return _fail(level, failures, 'Can not be encoded to JSON')
+
+def _valid_md5(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid MD5
+
+	Checks the value is an md5 hash, or a string representing one
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, _MD5_TYPE):
+		value = value.hexdigest()
+	elif not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match['md5'](value):
+		return _fail(level, failures, 'invalid')
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_price(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Price
+
+	Checks the value is a Decimal with no more than 2 decimal places, or an \
+	int, float, or string representing a price
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the type is a bool, fail immediately
+	if type(value) == bool:
+		return _fail(level, failures, 'is a bool')
+
+	# If it's not a Decimal
+	if not isinstance(value, Decimal):
+
+		# But it is a valid string representing a price, or a float, convert
+		#	it to a decimal
+		if isinstance(value, (str, float)) \
+			and constants.regex['price'].match(str(value)):
+			value = Decimal(value).quantize(Decimal('1.00'))
+
+		# Else if it's an int, convert it to a decimal
+		elif isinstance(value, int):
+			value = Decimal(str(value) + '.00')
+
+		# Else whatever it is is no good
+		else:
+			return _fail(level, failures, 'invalid')
+
+	# Else, if the exponent is longer than 2
+	elif abs(value.as_tuple().exponent) > 2:
+		return _fail(level, failures, 'too many decimal points')
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_string(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid String
+
+	Checks the value is a string, that it matches the Node's regex, and that \
+	its length is within the Node's minimum and maximum, if it has them
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+
+	# If the value is not some form of string
+	if not isinstance(value, str):
+		return _fail(level, failures, 'is not a string')
+
+	# If we have a regex, and it doesn't match
+	if node._regex and not node._regex.match(value):
+		return _fail(level, failures, 'failed regex')
+
+	# If we have a min or max, check the length instead of any other limits
+	if node._minimum or node._maximum:
+		if node._minimum and len(value) < node._minimum:
+			return _fail(level, failures, 'not long enough')
+		if node._maximum and len(value) > node._maximum:
+			return _fail(level, failures, 'too long')
+		return True
+
+	# Check the limits
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_text(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Text
+
+	Checks the value is a string which is valid for the Node's type
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match[node._type](value):
+		return _fail(level, failures, 'invalid')
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+def _valid_time(
+	node: 'Node',
+	value: any,
+	level: list[str],
+	failures: list | None
+) -> bool:
+	"""Valid Time
+
+	Checks the value is a time or datetime, or a string representing a time
+
+	Arguments:
+		node (Node): The Node checking the value
+		value (any): The value to check
+		level (list): The keys to the value from the top of the structure
+		failures (list): The list to add failures to, or None
+
+	Returns:
+		bool
+	"""
+	if isinstance(value, (time, datetime)):
+		value = value.strftime('%H:%M:%S')
+	elif not isinstance(value, str):
+		return _fail(level, failures, 'not a string')
+	if not validators.match['time'](value):
+		return _fail(level, failures, 'invalid')
+	if node._limit is None:
+		return True
+	return node._limit(node, value, level, failures)
+
+CLEAN = {
+	'any': _clean_any,
+	'bool': _clean_bool,
+	'date': _clean_date,
+	'datetime': _clean_datetime,
+	'decimal': _clean_decimal,
+	'float': _clean_float,
+	'int': _clean_int,
+	'ip': _clean_str,
+	'json': _clean_json,
+	'md5': _clean_md5,
+	'price': _clean_price,
+	'string': _clean_str,
+	'time': _clean_time,
+	'timestamp': _clean_int,
+	'uint': _clean_int
+}
+"""The function which cleans values of each type"""
+CLEAN.update({ s: _clean_str for s in _TEXT })
+
+VALID = {
+	'any': _valid_any,
+	'bool': _valid_bool,
+	'date': _valid_date,
+	'datetime': _valid_datetime,
+	'decimal': _valid_decimal,
+	'float': _valid_float,
+	'int': _valid_int,
+	'ip': _valid_ip,
+	'json': _valid_json,
+	'md5': _valid_md5,
+	'price': _valid_price,
+	'string': _valid_string,
+	'time': _valid_time,
+	'timestamp': _valid_int,
+	'uint': _valid_int
+}
+"""The function which validates values of each type, after missing values \
+have been handled"""
+VALID.update({ s: _valid_text for s in _TEXT })
+
+def limit(node: 'Node') -> callable:
+	"""Limit
+
+	Returns the function which checks values against the limits of the Node, \
+	its options, or its minimum and maximum, or None if it has none
+
+	Arguments:
+		node (Node): The Node to get the function for
+
+	Returns:
+		callable | None
+	"""
+	if node._options is not None:
+		return _limit_options
+	if node._minimum or node._maximum:
+		return _limit_range
+	return None
+
+FUNCTIONS = frozenset([
+	f.__name__ for f in list(CLEAN.values()) + list(VALID.values()) + [
+		_limit_options, _limit_range
+	]
+])
+"""The names of every function a Node can store, the only ones allowed in \
+snapshots"""
@@ -17,11 +17,51 @@ __all__ = ['Tree']
 import undefined
 
 # Python imports
-from typing import Literal as TL
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable, Literal as TL
 
 # Local imports
-from define import constants
+from define import constants, snapshot
+from define.base import Base
+from define.compiler import Compiled
 from define.parent import Parent
+from define.pool import Pool
+from define.result import Result, Results
+
+def _is_large(value: any, threshold: int) -> bool:
+	"""Is Large
+
+	Returns True if a value holds at least threshold values, counting every \
+	element of every list and dict in it. Stops counting as soon as the \
+	threshold is reached, so it never costs more than threshold steps
+
+	Arguments:
+		value (any): The value to check
+		threshold (uint): The number of values at which it's large
+
+	Returns:
+		bool
+	"""
+
+	# Init the count and the values left to look in
+	iCount = 0
+	lStack = [ value ]
+
+	# While there's still values to look in
+	while lStack:
+		m = lStack.pop()
+
+		# If it's a list or dict, count its elements and look in them
+		if isinstance(m, (dict, list)):
+			iCount += len(m)
+			if iCount >= threshold:
+				return True
+			lStack.extend(isinstance(m, dict) and m.values() or m)
+
+	# Not large enough
+	return False
 
 class Tree(Parent):
 	"""Tree
@@ -33,9 +73,12 @@ class Tree(Parent):
 		Parent
 	"""
 
+	__slots__ = ()
+
 	def __init__(self,
 		details: dict | str,
-		extend: dict | TL[False] = undefined
+		extend: dict | TL[False] = undefined,
+		lazy: bool = False
 	):
 		"""Constructor
 
@@ -45,6 +88,9 @@ class Tree(Parent):
 			details (dict | str): Definition or filepath to load
 			extend (dict | False): Optional, a dictionary to extend the \
 				definition
+			lazy (bool): Optional, set to True to only create each node, and \
+				check its definition, the first time it's used. Call \
+				materialize to create them all at once
 
 		Raises:
 			KeyError, ValueError
@@ -68,16 +114,243 @@ class Tree(Parent):
 		if not constants.standard.match(dDetails['__name__']):
 			raise ValueError('__name__')
 
-		# Call the parent constructor
-		super(Tree, self).__init__(dDetails, False)
-
-		# Store the name
-		self.__name = dDetails['__name__']
+		# Call the parent constructor, with the name of the Tree
+		super(Tree, self).__init__(
+			dDetails, False, dDetails['__name__'], lazy
+		)
 
 		# If for some reason the array flag is set
 		if '__array__' in dDetails:
 			raise KeyError('__array__')
 
+	def _derived(self, details: dict) -> 'Tree':
+		"""Derived
+
+		Creates the instance returned by derive from the details generated, \
+		keeping the name unless the extend changed it
+
+		Arguments:
+			details (dict): The details, with the nodes already created
+
+		Returns:
+			Tree
+		"""
+		details.setdefault('__name__', self.name)
+		return self.__class__(details, False)
+
+	async def _offload(self,
+		f: callable,
+		value: any,
+		args: tuple,
+		executor: Executor | None,
+		threshold: int
+	) -> any:
+		"""Offload
+
+		Calls a sync method with the value, inline if the value is small, \
+		else in an executor so that the event loop isn't blocked
+
+		Arguments:
+			f (callable): The method to call
+			value (any): The value to pass to the method
+			args (tuple): Any other arguments to pass to the method
+			executor (Executor): The executor to use, None for the default \
+				one of the loop
+			threshold (uint): The number of values at which the value is \
+				considered large
+
+		Returns:
+			any
+		"""
+
+		# If the value is small, call the method right away
+		if not _is_large(value, threshold):
+			return f(value, *args)
+
+		# Else, run it in the executor
+		return await asyncio.get_running_loop().run_in_executor(
+			executor, partial(f, value, *args)
+		)
+
+	async def aclean(self,
+		value: dict,
+		executor: Executor = None,
+		threshold: int = 1000
+	) -> dict:
+		"""Async Clean
+
+		Cleans the value exactly as clean does, but runs it in an executor \
+		if the value holds at least threshold values so that the event loop \
+		isn't blocked by large payloads
+
+		Arguments:
+			value (dict): The value to clean
+			executor (Executor): Optional, the executor to use, defaults to \
+				the loop's default one
+			threshold (uint): Optional, the number of list and dict elements \
+				at which the value is run in the executor
+
+		Raises:
+			ValueError
+
+		Returns:
+			dict
+		"""
+		return await self._offload(self.clean, value, (), executor, threshold)
+
+	async def avalid(self,
+		value: dict,
+		ignore_missing = False,
+		fail_fast = False,
+		executor: Executor = None,
+		threshold: int = 1000
+	) -> bool:
+		"""Async Valid
+
+		Checks if a value is valid exactly as valid does, but runs it in an \
+		executor if the value holds at least threshold values so that the \
+		event loop isn't blocked by large payloads. If any errors occur, they \
+		can be found in [instance].validation_failures as a list
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+			executor (Executor): Optional, the executor to use, defaults to \
+				the loop's default one
+			threshold (uint): Optional, the number of list and dict elements \
+				at which the value is run in the executor
+
+		Returns:
+			bool
+		"""
+
+		# Validate the value, then store the failures for the current thread,
+		#	not the one of the executor
+		oResult = await self.avalidate(
+			value, ignore_missing, fail_fast, executor, threshold
+		)
+		self._store_failures(oResult.failures)
+		return oResult.valid
+
+	async def avalidate(self,
+		value: dict,
+		ignore_missing = False,
+		fail_fast = False,
+		executor: Executor = None,
+		threshold: int = 1000
+	) -> Result:
+		"""Async Validate
+
+		Checks if a value is valid exactly as validate does, but runs it in \
+		an executor if the value holds at least threshold values so that the \
+		event loop isn't blocked by large payloads
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+			executor (Executor): Optional, the executor to use, defaults to \
+				the loop's default one
+			threshold (uint): Optional, the number of list and dict elements \
+				at which the value is run in the executor
+
+		Returns:
+			Result
+		"""
+		return await self._offload(
+			self.validate, value, (ignore_missing, fail_fast), executor,
+			threshold
+		)
+
+	async def avalidate_cooperative(self,
+		value: dict,
+		ignore_missing = False,
+		fail_fast = False,
+		every: int = 1000
+	) -> Result:
+		"""Async Validate Cooperative
+
+		Checks if a value is valid exactly as validate does, in the event \
+		loop, but gives other tasks a turn after every so many checks so that \
+		large values don't block them
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+			every (uint): Optional, the number of checks between each turn
+
+		Raises:
+			ValueError
+
+		Returns:
+			Result
+		"""
+		return await super(Tree, self).avalidate_cooperative(
+			value, ignore_missing, [ self.name ], fail_fast, every
+		)
+
+	def compile(self) -> Compiled:
+		"""Compile
+
+		Generates specialised Python functions for the Tree and returns an \
+		object which validates values the same way the Tree does
+
+		Returns:
+			Compiled
+		"""
+		return Compiled(self, [ self.name ])
+
+	def dump_snapshot(self, filename: str) -> None:
+		"""Dump Snapshot
+
+		Stores the fully built Tree in a binary file which load_snapshot can \
+		turn back into a Tree much faster than creating it from JSON
+
+		Arguments:
+			filename (str): The path to the file
+
+		Raises:
+			OSError
+
+		Returns:
+			None
+		"""
+		snapshot.dump(self, filename)
+
+	@classmethod
+	def load_snapshot(cls, filename: str) -> 'Tree':
+		"""Load Snapshot
+
+		Loads a Tree stored by dump_snapshot. Snapshots are tied to the \
+		version of the format, and one from another version is refused
+
+		Arguments:
+			filename (str): The path to the file
+
+		Raises:
+			OSError, ValueError
+
+		Returns:
+			Tree
+		"""
+
+		# Load the instance
+		oRet = snapshot.load(filename)
+
+		# If it's not a Tree, or the class requested
+		if not isinstance(oRet, cls):
+			raise ValueError('"%s" is not a snapshot of a %s' % (
+				filename, cls.__name__
+			))
+
+		# Return the Tree
+		return oRet
+
 	@property
 	def name(self) -> str:
 		"""Name
@@ -87,7 +360,29 @@ class Tree(Parent):
 		Returns:
 			str
 		"""
-		return self.__name
+		return Base.name(self)
+
+	def pool(self, workers: int = None, chunk_size: int = 1000) -> Pool:
+		"""Pool
+
+		Returns a pool of processes to validate batches of values with. The \
+		Tree is pickled whole and sent to each process once, where it's \
+		compiled a single time, so only the values are pickled per batch. Use \
+		it in a with statement, or call close, to shut down the processes
+
+		Arguments:
+			workers (uint): Optional, the number of processes to use, \
+				defaults to the number of cores
+			chunk_size (uint): Optional, the number of values sent to a \
+				process at a time
+
+		Raises:
+			ValueError
+
+		Returns:
+			Pool
+		"""
+		return Pool(self, workers, chunk_size)
 
 	def to_dict(self):
 		"""To Dict
@@ -100,7 +395,7 @@ class Tree(Parent):
 		"""
 
 		# Init the dictionary we will return
-		dRet = {'__name__': self.__name}
+		dRet = {'__name__': self.name}
 
 		# Get the parents dict and add it to the return
 		dRet.update(super(Tree, self).to_dict())
@@ -108,7 +403,7 @@ class Tree(Parent):
 		# Return
 		return dRet
 
-	def valid(self, value: dict, ignore_missing = False):
+	def valid(self, value: dict, ignore_missing = False, fail_fast = False):
 		"""Valid
 
 		Checks if a value is valid based on the instance's values. If any \
@@ -118,8 +413,80 @@ class Tree(Parent):
 		Arguments:
 			value (any): The value to validate
 			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
 
 		Returns:
 			bool
 		"""
-		return super(Tree, self).valid(value, ignore_missing, [ self.__name ])
\ No newline at end of file
+		return super(Tree, self).valid(
+			value, ignore_missing, [ self.name ], fail_fast
+		)
+
+	def valid_columns(self, columns: dict, ignore_missing = False) -> Results:
+		"""Valid Columns
+
+		Checks a batch of values stored as columns, one list (or array) of \
+		values per field, and returns whether each row was valid, along with \
+		the failures of the invalid ones by row
+
+		Arguments:
+			columns (dict): The list of values of each field, by field name
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+
+		Raises:
+			ValueError
+
+		Returns:
+			Results
+		"""
+		return super(Tree, self).valid_columns(
+			columns, ignore_missing, [ self.name ]
+		)
+
+	def valid_many(self,
+		values: Iterable,
+		ignore_missing = False,
+		fail_fast = False
+	) -> Results:
+		"""Valid Many
+
+		Checks if every value in a batch is valid and returns whether each \
+		one was, along with the failures of the invalid ones by position
+
+		Arguments:
+			values (iterable): The values to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop each value at, and \
+				only return, its first failure
+
+		Returns:
+			Results
+		"""
+		return super(Tree, self).valid_many(
+			values, ignore_missing, [ self.name ], fail_fast
+		)
+
+	def validate(self,
+		value: dict,
+		ignore_missing = False,
+		fail_fast = False
+	) -> Result:
+		"""Validate
+
+		Checks if a value is valid based on the instance's values and returns \
+		the result along with any failures, without storing anything on the \
+		Tree
+
+		Arguments:
+			value (any): The value to validate
+			ignore_missing (bool): Optional, set to True to ignore missing nodes
+			fail_fast (bool): Optional, set to True to stop at, and only \
+				return, the first failure
+
+		Returns:
+			Result
+		"""
+		return super(Tree, self).validate(
+			value, ignore_missing, [ self.name ], fail_fast
+		)
\ No newline at end of file
@@ -0,0 +1,301 @@
+# coding=utf8
+"""Validators
+
+Functions which check strings exactly like the regular expressions in \
+constants.regex do, without running a regular expression, by using lengths, \
+str methods, and lookup tables instead, and the function used for each type
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-18"
+
+# Limit exports
+__all__ = ['match', 'regex_free']
+
+# Python imports
+from binascii import unhexlify as _unhexlify
+
+# Local imports
+from define import constants
+
+# The valid parts of dates and times using only ASCII digits, the two digit
+#	month, the dash and two digit month and day, the two digit hour and
+#	minutes, and the colon and two digit seconds, and the valid octets of an
+#	IP address
+_MONTH = frozenset(['%02d' % i for i in range(1, 13)])
+_MONTH_DAY = frozenset([
+	'-%02d-%02d' % (m, d) for m in range(1, 13) for d in range(1, 32)
+])
+_HOUR_MINUTE = frozenset([
+	'%02d:%02d' % (h, m) for h in range(24) for m in range(60)
+])
+_SECOND = frozenset([':%02d' % i for i in range(60)])
+_OCTETS = frozenset([str(i) for i in range(256)])
+
+def _date(value: str) -> bool:
+	"""Date
+
+	Checks a string is a date, YYYY-MM-DD
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's a valid ASCII date
+	if len(value) == 10 and value[:4].isdecimal() and \
+		value[4:] in _MONTH_DAY:
+		return True
+
+	# If it's ASCII without a trailing newline, nothing else is valid
+	if value.isascii() and value[-1:] != '\n':
+		return False
+
+	# Check it the long way
+	return _date_slow(value)
+
+def _date_slow(value: str) -> bool:
+	"""Date Slow
+
+	Checks a string is a date, YYYY-MM-DD, allowing any decimal digits where \
+	the regular expression does, and a single trailing newline
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# Like the regular expression, allow a single trailing newline
+	if value[-1:] == '\n':
+		value = value[:-1]
+
+	# If the length or the separators are wrong
+	if len(value) != 10 or value[4] != '-' or value[7] != '-':
+		return False
+
+	# If the year isn't digits, or the month isn't valid
+	if not value[:4].isdecimal() or value[5:7] not in _MONTH:
+		return False
+
+	# If the day is valid, any decimal digit can follow a 1 or a 2
+	s = value[8:]
+	return (s[0] == '0' and '1' <= s[1] <= '9') or \
+		((s[0] == '1' or s[0] == '2') and s[1].isdecimal()) or \
+		s == '30' or s == '31'
+
+def _datetime(value: str) -> bool:
+	"""Date/Time
+
+	Checks a string is a date and time, YYYY-MM-DD HH:MM:SS
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's a valid ASCII date and time
+	if len(value) == 19 and value[:4].isdecimal() and \
+		value[4:10] in _MONTH_DAY and value[10] == ' ' and \
+		value[11:16] in _HOUR_MINUTE and value[16:] in _SECOND:
+		return True
+
+	# If it's ASCII without a trailing newline, nothing else is valid
+	if value.isascii() and value[-1:] != '\n':
+		return False
+
+	# Like the regular expression, allow a single trailing newline
+	if value[-1:] == '\n':
+		value = value[:-1]
+
+	# Check the date, and the time, the long way
+	return len(value) == 19 and value[10] == ' ' and \
+		_date_slow(value[:10]) and _time_slow(value[11:])
+
+def _ip(value: str) -> bool:
+	"""IP
+
+	Checks a string is an IPv4 address, with no leading zeros, and a first \
+	octet which isn't 0
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# Check there's 4 valid octets
+	l = value.split('.')
+	if len(l) == 4 and l[0] in _OCTETS and l[0] != '0' and \
+		l[1] in _OCTETS and l[2] in _OCTETS and l[3] in _OCTETS:
+		return True
+
+	# Like the regular expression, allow a single trailing newline
+	if value[-1:] == '\n':
+		l = value[:-1].split('.')
+		return len(l) == 4 and l[0] in _OCTETS and l[0] != '0' and \
+			l[1] in _OCTETS and l[2] in _OCTETS and l[3] in _OCTETS
+
+	# Invalid
+	return False
+
+def _md5(value: str) -> bool:
+	"""MD5
+
+	Checks a string is 32 hex characters, upper or lower case
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's the right length, it's valid if it can be converted
+	if len(value) == 32:
+		try:
+			_unhexlify(value)
+		except ValueError:
+			return False
+		return True
+
+	# Like the regular expression, allow a single trailing newline
+	return len(value) == 33 and value[32] == '\n' and _md5(value[:32])
+
+def _time(value: str) -> bool:
+	"""Time
+
+	Checks a string is a time, HH:MM:SS
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's a valid ASCII time
+	if len(value) == 8 and value[:5] in _HOUR_MINUTE and \
+		value[5:] in _SECOND:
+		return True
+
+	# If it's ASCII without a trailing newline, nothing else is valid
+	if value.isascii() and value[-1:] != '\n':
+		return False
+
+	# Check it the long way
+	return _time_slow(value)
+
+def _time_slow(value: str) -> bool:
+	"""Time Slow
+
+	Checks a string is a time, HH:MM:SS, allowing any decimal digits where \
+	the regular expression does, and a single trailing newline
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# Like the regular expression, allow a single trailing newline
+	if value[-1:] == '\n':
+		value = value[:-1]
+
+	# If the length or the separators are wrong
+	if len(value) != 8 or value[2] != ':' or value[5] != ':':
+		return False
+
+	# If the hour is valid, any decimal digit can follow a 0 or a 1
+	if not ((value[0] == '0' or value[0] == '1') and value[1].isdecimal()) \
+		and not (value[0] == '2' and '0' <= value[1] <= '3'):
+		return False
+
+	# If the minutes and seconds are valid, any decimal digit can follow 0
+	#	to 5
+	return '0' <= value[3] <= '5' and value[4].isdecimal() and \
+		'0' <= value[6] <= '5' and value[7].isdecimal()
+
+def _tuuid(value: str) -> bool:
+	"""Tight UUID
+
+	Checks a string is a UUID without the dashes, lower case
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's the right length, it's valid if it can be converted, and it
+	#	has no upper case letters
+	if len(value) == 32:
+		try:
+			_unhexlify(value)
+		except ValueError:
+			return False
+		return value.islower() or value.isdigit()
+
+	# Like the regular expression, allow a single trailing newline
+	return len(value) == 33 and value[32] == '\n' and _tuuid(value[:32])
+
+def _uuid(value: str) -> bool:
+	"""UUID
+
+	Checks a string is a UUID, lower case
+
+	Arguments:
+		value (str): The value to check
+
+	Returns:
+		bool
+	"""
+
+	# If it's the right length, with dashes every 5 characters from the 8th
+	if len(value) == 36 and value[8:24:5] == '----':
+
+		# If there's no other dashes, it's valid if the rest can be
+		#	converted, and it has no upper case letters
+		s = value.replace('-', '')
+		if len(s) != 32:
+			return False
+		try:
+			_unhexlify(s)
+		except ValueError:
+			return False
+		return s.islower() or s.isdigit()
+
+	# Like the regular expression, allow a single trailing newline
+	return len(value) == 37 and value[36] == '\n' and _uuid(value[:36])
+
+regex_free = {
+	'date': _date,
+	'datetime': _datetime,
+	'ip': _ip,
+	'md5': _md5,
+	'time': _time,
+	'tuuid': _tuuid,
+	'uuid': _uuid
+}
+"""The regex-free function of each type which has one, each accepts and \
+refuses exactly the same strings as the type's regular expression"""
+
+match = { k: v.match for k,v in constants.regex.items() }
+"""The function used to check strings of each type in constants.regex, \
+called with the string, and returning a truthy value if it's valid"""
+
+# Use the regex-free functions which are faster than the regular expressions
+#	on valid values, a single C call does the work of the whole expression.
+#	For the rest the compiled expression is as fast, or faster, in CPython
+match['md5'] = _md5
+match['tuuid'] = _tuuid
@@ -9,13 +9,24 @@ __email__		= "chris@ouroboroscoding.com"
 __created__		= "2023-03-18"
 
 # Import python core modules
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 from decimal import Decimal
 import hashlib
+import io
 import json
+import operator
+import os
+import random
+import tempfile
+import threading
 
 # Import define
 import define
+from define import strategies, validators
+from define.__main__ import validate as main_validate
 
 # Import unittest
 import unittest
@@ -54,6 +65,37 @@ class define_Test(unittest.TestCase):
 		self.assertTrue(a.validation_failures[0][0] == '[0]', 'fail name is not correct: ' + str(a.validation_failures[0][0]))
 		self.assertTrue(a.validation_failures[0][1] == 'can not be converted to decimal', 'fail value is not correct: ' + str(a.validation_failures[0][1]))
 
+	def test_Array_Valid_Unique(self):
+
+		# Create an array of unique objects
+		a	= define.Array({
+			'__array__':	'unique',
+			'__type__':		{'id': {'__type__': 'uint'}, 'tags': {'__array__': 'duplicates', '__type__': 'any'}}
+		})
+
+		# Check for true
+		self.assertTrue(a.valid([{'id': 1, 'tags': [1]}, {'id': 1, 'tags': [2]}, {'id': 2, 'tags': [1]}]), 'unique objects are not valid')
+
+		# Check for false, including values which are only equal
+		self.assertFalse(a.valid([{'id': 1, 'tags': [1]}, {'id': 2, 'tags': []}, {'id': 2, 'tags': []}, {'id': 1, 'tags': [1.0]}]), 'duplicate objects are valid')
+		self.assertTrue(a.validation_failures == [['[2]', 'duplicate of [1]'], ['[3]', 'duplicate of [0]']], 'failures are not correct: ' + str(a.validation_failures))
+
+		# The compiled version returns the same
+		c = a.compile()
+		self.assertFalse(c.valid([{'id': 1, 'tags': [1]}, {'id': 2, 'tags': []}, {'id': 2, 'tags': []}, {'id': 1, 'tags': [1.0]}]), 'duplicate objects are valid')
+		self.assertTrue(c.validation_failures == a.validation_failures, 'compiled failures are not correct: ' + str(c.validation_failures))
+
+		# Create an array of unique values of any type
+		a	= define.Array({
+			'__array__':	'unique',
+			'__type__':		'any'
+		})
+
+		# Lists are not equal to tuples, but 1 is equal to True
+		self.assertTrue(a.valid([[1, 2], (1, 2), {'a': 1}]), 'list, tuple, and dict are not valid')
+		self.assertFalse(a.valid([1, 'a', True]), '1 and True are valid')
+		self.assertTrue(a.validation_failures == [['[2]', 'duplicate of [0]']], 'failures are not correct: ' + str(a.validation_failures))
+
 	def test_Complex(self):
 
 		# Create a complex structure with all types of data just to make sure
@@ -1392,3 +1434,763 @@ class define_Test(unittest.TestCase):
 			"52cd4b20-ca32-4433-9516-0c8684ec57c2" : 99.99,
 			"3b44c5ed-0fea-4478-9f1b-939ae6ec0721" : 66.66
 		}), 'Hash is not valid')
+
+	def test_Tree_Compile(self):
+
+		# Build a Tree and compile it
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"field2_1":{"__type__":"string","__regex__":"^\\S+$"},"field2_2":{"__type__":"uint","__options__":[0,1,2,34]}},"field3":{"__array__":"unique","__type__":"decimal"},"field4":{"__array__":"duplicates","field4_1":{"__type__":"md5"},"field4_2":{"field4_2_1":{"__type__":"date"}}},"field5":{"__hash__":"uuid","__type__":[{"__type__":"price"},{"__type__":"ip"}]}})
+		c	= o.compile()
+
+		# Check for True
+		d = {"field1":2,"field2":{"field2_1":"ThisString","field2_2":34},"field3":[0.3,10.3,20.3],"field4":[{"field4_1":"49c0d2aef0ab2634b0051544cdbf2415","field4_2":{"field4_2_1":"2016-03-05"}}],"field5":{"52cd4b20-ca32-4433-9516-0c8684ec57c2":"10.0.0.1"}}
+		self.assertTrue(c.valid(d), 'compiled tree failed valid data: %s' % str(c.validation_failures))
+		self.assertTrue(c.validation_failures == [], 'compiled tree has failures: %s' % str(c.validation_failures))
+
+		# Check for False, and that the failures match the Tree's
+		for d in [
+			{"field1":"NotAnINTEGER","field2":{"field2_1":"This String","field2_2":3},"field3":[0.3,0.3,True],"field4":[{"field4_1":"nope","field4_2":{}}],"field5":{"nope":"1.00"},"extra":1},
+			{"field1":-1,"field2":None,"field3":"0.3","field4":[],"field5":{"52cd4b20-ca32-4433-9516-0c8684ec57c2":"nope"}},
+			{},
+			None
+		]:
+			self.assertFalse(o.valid(d), '%s is a valid value for hello' % str(d))
+			self.assertFalse(c.valid(d), '%s is a valid compiled value for hello' % str(d))
+			self.assertTrue(c.validation_failures == o.validation_failures, 'compiled failures do not match: %s != %s' % (str(c.validation_failures), str(o.validation_failures)))
+
+		# Check a single Node compiles on its own
+		c = define.Node({"__type__":"string","__minimum__":2,"__maximum__":4}).compile()
+		self.assertTrue(c.valid('abc'), '"abc" is not between 2 and 4 characters')
+		self.assertFalse(c.valid('abcde'), '"abcde" is between 2 and 4 characters')
+		self.assertTrue(c.validation_failures == [['', 'too long']], 'compiled failures are not correct: %s' % str(c.validation_failures))
+
+	def test_Tree_Compile_Clean(self):
+
+		# Build a Tree and compile it
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"field2_1":{"__type__":"bool"},"field2_2":{"__type__":"price","__optional__":True}},"field3":{"__array__":"unique","__type__":"decimal"},"field4":{"__hash__":"string","__type__":[{"__type__":"uint"},{"__type__":"date"}]}})
+		c	= o.compile()
+
+		# Check the cleaned values match
+		d = {"field1":"2","field2":{"field2_1":"true","field2_2":None},"field3":["0.3",10],"field4":{"a":"12","b":"2016-03-05"}}
+		self.assertTrue(c.clean(d) == o.clean(d), 'compiled clean does not match: %s' % str(c.clean(d)))
+		self.assertTrue(c.clean(d) == {"field1":2,"field2":{"field2_1":True,"field2_2":None},"field3":["0.3","10"],"field4":{"a":12,"b":"2016-03-05"}}, 'compiled clean is not correct: %s' % str(c.clean(d)))
+
+		# Check the errors match
+		d = {"field2":None,"field3":"0.3","field4":{"a":"nope"},"field5":1}
+		with self.assertRaises(ValueError) as oCompiled:
+			c.clean(d)
+		with self.assertRaises(ValueError) as oInterpreted:
+			o.clean(d)
+		self.assertTrue(oCompiled.exception.args[0] == oInterpreted.exception.args[0], 'compiled errors do not match: %s' % str(oCompiled.exception.args[0]))
+		self.assertTrue(oCompiled.exception.args[0] == [['field2', 'missing'], ['field3', 'not an array'], ['field4.a', 'matches no option'], ['field5', 'not a valid node']], 'compiled errors are not correct: %s' % str(oCompiled.exception.args[0]))
+
+		# Check values which can't be converted inside of containers keep their
+		#	message
+		o	= define.Tree({"__name__":"hello","field1":{"__array__":"unique","__type__":"int"},"field2":{"__hash__":"string","__type__":"uint"},"field3":{"field3_1":{"__type__":"float"}}})
+		d = {"field1":["b"],"field2":{"k":"z"},"field3":{"field3_1":"q"}}
+		for m in [o, o.compile()]:
+			with self.assertRaises(ValueError) as oCtx:
+				m.clean(d)
+			self.assertTrue([l[0] for l in oCtx.exception.args[0]] == ['field1.[0]', 'field2.k', 'field3.field3_1'], 'nested conversion levels are not correct: %s' % str(oCtx.exception.args[0]))
+			self.assertTrue(all(isinstance(l[1], str) and len(l[1]) > 1 for l in oCtx.exception.args[0]), 'nested conversion messages are not correct: %s' % str(oCtx.exception.args[0]))
+
+	def test_Tree_Validate(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"unique","__type__":"decimal"}})
+
+		# Check the result of a valid value
+		oRes = o.validate({"field1":1,"field2":[0.3,10.3]})
+		self.assertTrue(oRes.valid, 'result is not valid: %s' % str(oRes.failures))
+		self.assertTrue(bool(oRes), 'result is not True')
+		self.assertTrue(oRes.failures == [], 'result has failures: %s' % str(oRes.failures))
+
+		# Check the result of an invalid value, and that nothing was stored
+		oRes = o.validate({"field1":-1,"field2":[0.3,0.3]})
+		self.assertFalse(oRes, 'result is True')
+		self.assertTrue(oRes.failures == [['hello.field1', 'signed'], ['hello.field2.[1]', 'duplicate of hello.field2[0]']], 'result failures are not correct: %s' % str(oRes.failures))
+		self.assertTrue(o.validation_failures is None, 'validate stored failures on the instance')
+
+		# Validate from several threads at once and make sure every thread
+		#	gets its own failures, both from validate and validation_failures
+		lErrors = []
+		def validate(i):
+			for _ in range(200):
+				d = i % 2 and {"field1":i,"field2":[i]} or {"field1":-i,"field2":[i,i]}
+				oRes = o.validate(d)
+				bValid = o.valid(d)
+				lExpected = not (i % 2) and [['hello.field1', 'signed'], ['hello.field2.[1]', 'duplicate of hello.field2[0]']] or []
+				if oRes.failures != lExpected or o.validation_failures != lExpected or bValid != (i % 2 == 1):
+					lErrors.append((i, oRes.failures, o.validation_failures))
+		lThreads = [threading.Thread(target=validate, args=(i,)) for i in range(1, 9)]
+		for t in lThreads: t.start()
+		for t in lThreads: t.join()
+		self.assertTrue(lErrors == [], 'threads got the wrong failures: %s' % str(lErrors[:3]))
+
+	def test_Tree_Valid_Many(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__type__":"string","__optional__":True}})
+
+		# Validate a batch
+		l = [{"field1":1}, {"field1":-1}, {"field1":"2","field2":"a"}, {"field2":3}, None]
+		oRes = o.valid_many(iter(l))
+		self.assertFalse(oRes, 'batch is valid')
+		self.assertTrue(len(oRes) == 5, 'batch length is not 5')
+		self.assertTrue(oRes.valid == [True, False, True, False, False], 'batch valid flags are not correct: %s' % str(oRes.valid))
+		self.assertTrue(oRes.invalid == [1, 3, 4], 'batch invalid positions are not correct: %s' % str(oRes.invalid))
+		self.assertTrue(oRes.failures[1] == [['hello.field1', 'signed']], 'batch failures are not correct: %s' % str(oRes.failures[1]))
+		self.assertTrue(oRes.failures[3] == [['hello.field1', 'missing'], ['hello.field2', 'is not a string']], 'batch failures are not correct: %s' % str(oRes.failures[3]))
+
+		# Each position matches validating on its own
+		for i in range(len(l)):
+			self.assertTrue(oRes[i] == o.validate(l[i]), 'batch result %d does not match: %s' % (i, str(oRes[i])))
+
+		# The compiled version returns the same
+		oCompiled = o.compile().valid_many(l)
+		self.assertTrue(oCompiled.valid == oRes.valid and oCompiled.failures == oRes.failures, 'compiled batch does not match: %s' % str(oCompiled.failures))
+
+		# Clean a batch
+		oRes = o.clean_many([{"field1":"1"}, {"field3":1}, {"field1":"0x10","field2":2}])
+		self.assertTrue(oRes.valid == [True, False, True], 'batch valid flags are not correct: %s' % str(oRes.valid))
+		self.assertTrue(oRes.values == [{"field1":1}, None, {"field1":16,"field2":"2"}], 'batch values are not correct: %s' % str(oRes.values))
+		self.assertTrue(oRes.failures == {1: [['field3', 'not a valid node']]}, 'batch failures are not correct: %s' % str(oRes.failures))
+
+		# Values which can't be converted only fail on their own
+		for oNode in [define.Node('decimal'), define.Node('float')]:
+			for o in [oNode, oNode.compile()]:
+				oRes = o.clean_many(['1.5', 'x', '2'])
+				self.assertTrue(oRes.valid == [True, False, True], '%s batch valid flags are not correct: %s' % (oNode.type(), str(oRes.valid)))
+				self.assertTrue(len(oRes.failures[1]) == 1 and oRes.failures[1][0][0] == '' and isinstance(oRes.failures[1][0][1], str), '%s batch failures are not correct: %s' % (oNode.type(), str(oRes.failures)))
+
+		# Nested values which can't be converted keep their level and message
+		oTree = define.Tree({"__name__":"hello","field1":{"__array__":"unique","__type__":"int"}})
+		for o in [oTree, oTree.compile()]:
+			oRes = o.clean_many([{"field1":["1"]}, {"field1":["b"]}])
+			self.assertTrue(oRes.valid == [True, False], 'nested batch valid flags are not correct: %s' % str(oRes.valid))
+			self.assertTrue(oRes.failures == {1: [['field1.[0]', "invalid literal for int() with base 0: 'b'"]]}, 'nested batch failures are not correct: %s' % str(oRes.failures))
+
+	def test_Tree_Valid_Columns(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint","__maximum__":100},"field2":{"__type__":"string","__options__":["a","b"]},"field3":{"__type__":"float","__optional__":True}})
+
+		# Validate columns of values
+		d = {"field1":[1, -1, "2", 101, True], "field2":["a", "c", "b", None, "a"], "field3":[0.5, None, "x", 1, 2.0]}
+		oRes = o.valid_columns(d)
+		self.assertTrue(oRes.valid == [True, False, False, False, False], 'columns valid flags are not correct: %s' % str(oRes.valid))
+		self.assertTrue(oRes.failures[1] == [['hello.field1', 'signed'], ['hello.field2', 'not in options']], 'columns failures are not correct: %s' % str(oRes.failures[1]))
+		self.assertTrue(oRes.failures[4] == [['hello.field1', 'is a bool']], 'columns failures are not correct: %s' % str(oRes.failures[4]))
+
+		# Each row matches validating the rows as a batch
+		l = [{k:d[k][i] for k in d} for i in range(5)]
+		oMany = o.valid_many(l)
+		self.assertTrue(oMany.valid == oRes.valid and oMany.failures == oRes.failures, 'columns do not match rows: %s' % str(oRes.failures))
+
+		# Missing and unknown columns fail every row
+		oRes = o.valid_columns({"field2":["a", "b"], "field4":[1, 2]})
+		self.assertTrue(oRes.failures == {0: [['hello.field1', 'missing'], ['hello.field4', 'unknown']], 1: [['hello.field1', 'missing'], ['hello.field4', 'unknown']]}, 'columns failures are not correct: %s' % str(oRes.failures))
+
+		# Columns of different lengths
+		self.assertRaises(ValueError, o.valid_columns, {"field1":[1], "field2":["a", "b"]})
+
+	def test_Tree_Valid_Level(self):
+
+		# Build a Tree with arrays and hashes of objects
+		o	= define.Tree({"__name__":"hello","field1":{"__array__":"unique","__type__":{"field1_1":{"__type__":"uint"},"field1_2":{"__hash__":"string","__type__":{"__array__":"duplicates","__type__":"int"}}}}})
+
+		# Make sure the failures are generated with the full path
+		v = {"field1":[{"field1_1":1,"field1_2":{}},{"field1_1":-1,"field1_2":{"a":[1,"b"]}},{"field1_1":1,"field1_2":{}}]}
+		lExpected = [['hello.field1.[1].field1_1', 'signed'], ['hello.field1.[1].field1_2.a.[1]', 'not an integer'], ['hello.field1.[2]', 'duplicate of hello.field1[0]']]
+		self.assertFalse(o.valid(v), 'value is valid')
+		self.assertTrue(o.validation_failures == lExpected, 'failures are not correct: %s' % str(o.validation_failures))
+		self.assertFalse(o.compile().valid(v), 'value is valid')
+		self.assertTrue(o.compile().validate(v).failures == lExpected, 'compiled failures are not correct')
+
+		# Make sure a level passed in is left as is
+		l = ['root']
+		self.assertFalse(o['field1'].valid(v['field1'], level = l), 'value is valid')
+		self.assertTrue(l == ['root'], 'level was modified: %s' % str(l))
+		self.assertTrue(o['field1'].validation_failures[0] == ['root.[1].field1_1', 'signed'], 'failures are not correct: %s' % str(o['field1'].validation_failures))
+
+	def test_Tree_Valid_Fail_Fast(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"duplicates","__type__":{"field2_1":{"__type__":"string"},"field2_2":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"date"}]}}}})
+
+		# Check a value with many failures
+		v = {"field1":-1,"field2":[{"field2_1":1,"field2_2":{"a":"b"}} for i in range(100)],"field3":1}
+		self.assertFalse(o.valid(v), 'value is valid')
+		self.assertTrue(len(o.validation_failures) == 202, 'failures are not correct: %d' % len(o.validation_failures))
+
+		# Only the first failure is returned
+		self.assertFalse(o.valid(v, fail_fast=True), 'value is valid')
+		self.assertTrue(o.validation_failures == [['hello.field1', 'signed']], 'failures are not correct: %s' % str(o.validation_failures))
+		v["field1"] = 1
+		oRes = o.validate(v, fail_fast=True)
+		self.assertTrue(oRes.failures == [['hello.field2.[0].field2_1', 'is not a string']], 'failures are not correct: %s' % str(oRes.failures))
+		v["field2"] = [{"field2_1":"a","field2_2":{"a":"b","c":1}}]
+		oRes = o.validate(v, fail_fast=True)
+		self.assertTrue(oRes.failures == [['hello.field2.[0].field2_2.a', 'no valid option']], 'failures are not correct: %s' % str(oRes.failures))
+
+		# A missing value only returns missing
+		oRes = o.validate({"field1":None,"field2":[]}, fail_fast=True)
+		self.assertTrue(oRes.failures == [['hello.field1', 'missing']], 'failures are not correct: %s' % str(oRes.failures))
+
+		# The compiled version and batches return the same
+		self.assertTrue(o.compile().validate(v, fail_fast=True) == oRes.__class__(False, [['hello.field2.[0].field2_2.a', 'no valid option']]), 'compiled result is not correct')
+		oMany = o.valid_many([v, {"field1":1,"field2":[]}], fail_fast=True)
+		self.assertTrue(oMany.failures == {0: [['hello.field2.[0].field2_2.a', 'no valid option']]}, 'batch failures are not correct: %s' % str(oMany.failures))
+
+	def test_Tree_Is_Valid(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"unique","__type__":{"field2_1":{"__type__":"string"},"field2_2":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"date"}]}}},"field3":{"__type__":"any","__optional__":True}})
+		c	= o.compile()
+
+		# Check values against valid, interpreted and compiled
+		for v, b in [
+			({"field1":1,"field2":[{"field2_1":"a","field2_2":{"a":1,"b":"2023-01-01"}}]}, True),
+			({"field1":"2","field2":[],"field3":None}, True),
+			({"field1":1,"field2":[]}, True),
+			({"field1":-1,"field2":[]}, False),
+			({"field1":1}, False),
+			({"field1":1,"field2":[{"field2_1":"a","field2_2":{}},{"field2_1":"a","field2_2":{}}]}, False),
+			({"field1":1,"field2":[{"field2_1":"a","field2_2":{"a":"b"}}]}, False),
+			({"field1":1,"field2":[],"field4":1}, False),
+			(None, False),
+			([], False)
+		]:
+			self.assertTrue(o.is_valid(v) is b, '"%s" is_valid is not %s' % (str(v), str(b)))
+			self.assertTrue(o.valid(v) is b, '"%s" valid is not %s' % (str(v), str(b)))
+			self.assertTrue(c.is_valid(v) is b, '"%s" compiled is_valid is not %s' % (str(v), str(b)))
+
+		# Ignoring missing nodes
+		self.assertTrue(o.is_valid({"field1":1}, True), 'missing is not ignored')
+		self.assertTrue(c.is_valid({"field1":1}, True), 'compiled missing is not ignored')
+
+	def test_Main_Validate(self):
+
+		# Store a definition in a file
+		oFile = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+		json.dump({"__name__":"rec","id":"uint","tags":{"__array__":"unique","__type__":"string"}}, oFile)
+		oFile.close()
+
+		# Build the data, with blank and bad lines
+		sData = '{"id":1,"tags":["a"]}\n\n{bad\n' + \
+			''.join(['{"id":%d,"tags":["a","a"]}\n' % i for i in range(100)])
+
+		# Check the results with one process, and a pool
+		try:
+			for iWorkers in [1, 2]:
+				oOutput = io.StringIO()
+				t = main_validate(oFile.name, io.StringIO(sData), oOutput, iWorkers, 7)
+				self.assertTrue(t == (1, 101), 'counts are not correct: %s' % str(t))
+				lLines = [json.loads(s) for s in oOutput.getvalue().splitlines()]
+				self.assertTrue(len(lLines) == 102, 'output is not correct: %d' % len(lLines))
+				self.assertTrue(lLines[0] == {"line":1,"valid":True,"failures":[]}, 'first line is not correct: %s' % str(lLines[0]))
+				self.assertTrue(lLines[1] == {"line":3,"valid":False,"failures":[["rec","Can not be decoded from JSON"]]}, 'bad line is not correct: %s' % str(lLines[1]))
+				self.assertTrue(lLines[101] == {"line":103,"valid":False,"failures":[["rec.tags.[1]","duplicate of rec.tags[0]"]]}, 'last line is not correct: %s' % str(lLines[101]))
+		finally:
+			os.unlink(oFile.name)
+
+		# Store a definition which to_dict can't rebuild exactly
+		oFile = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+		json.dump({"__name__":"rec","code":{"__type__":"string","__regex__":"^a+$","__maximum__":3},"cost":{"__type__":"price","__minimum__":"1.00"}}, oFile)
+		oFile.close()
+
+		# Check the results are the same as the Tree's with one process, and a
+		#	pool
+		sData = '{"code":"aa","cost":"1.50"}\n{"code":"aaaaaa","cost":"1.50"}\n{"code":"a","cost":"0.50"}\n'
+		try:
+			for iWorkers in [1, 2]:
+				oOutput = io.StringIO()
+				t = main_validate(oFile.name, io.StringIO(sData), oOutput, iWorkers, 1)
+				self.assertTrue(t == (1, 2), 'counts are not correct: %s' % str(t))
+				lLines = [json.loads(s) for s in oOutput.getvalue().splitlines()]
+				self.assertTrue([d['failures'] for d in lLines] == [[], [["rec.code","too long"]], [["rec.cost","did not meet minimum"]]], 'output is not correct: %s' % str(lLines))
+		finally:
+			os.unlink(oFile.name)
+
+		# Store a definition which raises on some records
+		oFile = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+		json.dump({"__name__":"rec","n":"uint"}, oFile)
+		oFile.close()
+
+		# Check a record which raises only fails itself, with one process, and
+		#	a pool
+		sData = '{"n":1}\n{"n":""}\n{"n":2}\n'
+		try:
+			for iWorkers in [1, 2]:
+				oOutput = io.StringIO()
+				t = main_validate(oFile.name, io.StringIO(sData), oOutput, iWorkers, 1)
+				self.assertTrue(t == (2, 1), 'counts are not correct: %s' % str(t))
+				lLines = [json.loads(s) for s in oOutput.getvalue().splitlines()]
+				self.assertTrue([d['valid'] for d in lLines] == [True, False, True], 'output is not correct: %s' % str(lLines))
+				self.assertTrue(lLines[1] == {"line":2,"valid":False,"failures":[["","invalid literal for int() with base 0: ''"]]}, 'raising line is not correct: %s' % str(lLines[1]))
+		finally:
+			os.unlink(oFile.name)
+
+	def test_Tree_Pool(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"unique","__type__":"string"},"field3":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"date"}]},"field5":{"__type__":"string","__regex__":"^a+$","__maximum__":3,"__optional__":True},"field6":{"__type__":"price","__minimum__":"1.00","__optional__":True}})
+
+		# Build values, every third one invalid, and some too long or too low
+		#	for the definitions to_dict can't rebuild exactly
+		l = [{"field1":i % 3 and i or -i,"field2":["a","b"],"field3":{"a":1,"b":"2023-01-01"},"field5":"a" * (i % 5 + 1),"field6":"%d.50" % (i % 4)} for i in range(1, 50)]
+		l.append({"field1":1,"field2":["a","a"],"field3":{"a":"b"},"field4":1})
+		oExpected = o.valid_many(l)
+		self.assertTrue(oExpected.failures[12] == [['hello.field5', 'too long']] and oExpected.failures[15] == [['hello.field6', 'did not meet minimum']], 'local results are not correct: %s' % str(oExpected.failures))
+
+		# Check the results using processes, and this one
+		for iWorkers in [2, 1]:
+			with o.pool(workers=iWorkers, chunk_size=7) as oPool:
+				oRes = oPool.valid_many(iter(l))
+				self.assertTrue(oRes.valid == oExpected.valid, 'valid is not correct')
+				self.assertTrue(oRes.failures == oExpected.failures, 'failures are not correct: %s' % str(oRes.failures))
+				oRes = oPool.valid_many(l, fail_fast=True)
+				self.assertTrue(oRes.failures[49] == [['hello.field2.[1]', 'duplicate of hello.field2[0]']], 'fail fast is not correct: %s' % str(oRes.failures[49]))
+
+		# Invalid arguments
+		self.assertRaises(ValueError, o.pool, 0)
+		self.assertRaises(ValueError, o.pool, 2, 0)
+
+	def test_Tree_Async(self):
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"unique","__type__":"int"}})
+
+		# An executor that counts what it runs
+		class Counted(ThreadPoolExecutor):
+			count = 0
+			def submit(self, *args, **kwargs):
+				Counted.count += 1
+				return super().submit(*args, **kwargs)
+		oExec = Counted(1)
+
+		# Small values are run inline, large ones in the executor
+		async def run():
+			for v, iCount in [
+				({"field1":"1","field2":["1",2]}, 0),
+				({"field1":-1,"field2":[1,1,"a"]}, 0),
+				({"field1":"1","field2":list(range(20))}, 1),
+				({"field1":-1,"field2":[1,1] + list(range(20))}, 1)
+			]:
+				Counted.count = 0
+				bValid = o.valid(v)
+				lFailures = o.validation_failures
+				self.assertTrue(await o.avalid(v, executor=oExec, threshold=10) == bValid, 'avalid is not correct')
+				self.assertTrue(o.validation_failures == lFailures, 'avalid failures are not correct: %s' % str(o.validation_failures))
+				self.assertTrue(await o.avalidate(v, fail_fast=True, executor=oExec, threshold=10) == o.validate(v, fail_fast=True), 'avalidate is not correct')
+				try: mClean = o.clean(v)
+				except ValueError as e: mClean = e.args
+				try: mAClean = await o.aclean(v, oExec, 10)
+				except ValueError as e: mAClean = e.args
+				self.assertTrue(mAClean == mClean, 'aclean is not correct: %s' % str(mAClean))
+				self.assertTrue(Counted.count == 3 * iCount, 'executor count is not correct: %d' % Counted.count)
+		try:
+			asyncio.run(run())
+		finally:
+			oExec.shutdown()
+
+	def test_Tree_Async_Cooperative(self):
+
+		# Every class holding others walks values the same way for valid and
+		#	avalid
+		for oClass in [define.Array, define.Hash, define.Options, define.Parent, define.Tree]:
+			self.assertTrue(oClass._walk is not None and oClass._avalid is define.Base._avalid, '%s does not walk' % oClass.__name__)
+
+		# Build a Tree
+		o	= define.Tree({"__name__":"hello","field1":{"__type__":"uint"},"field2":{"__array__":"unique","__type__":{"field2_1":{"__type__":"string"},"field2_2":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"date"}]}}}})
+
+		# Values to check, the last one large
+		lValues = [
+			{"field1":1,"field2":[{"field2_1":"a","field2_2":{"a":1,"b":"2023-01-01"}}]},
+			{"field1":-1,"field2":[{"field2_1":1,"field2_2":{"a":"b"}},{"field2_1":1,"field2_2":{"a":"b"}}],"field3":1},
+			None,
+			{"field1":1,"field2":[{"field2_1":"a%d" % i,"field2_2":{"a":i}} for i in range(1000)]}
+		]
+
+		# Count the turns another task gets while validating
+		async def run(v, fail_fast):
+			lTurns = [0]
+			async def other():
+				while True:
+					lTurns[0] += 1
+					await asyncio.sleep(0)
+			oTask = asyncio.create_task(other())
+			await asyncio.sleep(0)
+			oRes = await o.avalidate_cooperative(v, False, fail_fast, 100)
+			oTask.cancel()
+			return oRes, lTurns[0]
+
+		# Check the results match, and the large value gave up the loop
+		for v in lValues:
+			for bFailFast in [False, True]:
+				oRes, iTurns = asyncio.run(run(v, bFailFast))
+				self.assertTrue(oRes == o.validate(v, fail_fast=bFailFast), 'result is not correct: %s' % str(oRes))
+			self.assertTrue(v is lValues[-1] and iTurns >= 40 or v is not lValues[-1], 'turns are not correct: %d' % iTurns)
+
+		# Invalid every
+		with self.assertRaises(ValueError):
+			asyncio.run(o.avalidate_cooperative({}, every=0))
+
+	def test_Cache(self):
+
+		# Store a definition in a file
+		oFile = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+		json.dump({"__name__":"hello","field1":{"__type__":"uint","__sql__":{"type":"int"}},"field2":{"__array__":"unique","__type__":"string"}}, oFile)
+		oFile.close()
+
+		try:
+
+			# Start with nothing
+			define.cache.invalidate()
+			define.cache.stats(True)
+
+			# The same instance is returned until the file changes
+			o1 = define.Tree.from_file(oFile.name)
+			o2 = define.Tree.from_file(oFile.name)
+			self.assertTrue(o1 is o2, 'instances are not shared')
+			self.assertTrue(define.cache.stats() == {'hits':1,'misses':1,'size':1,'maxsize':256}, 'stats are not correct: %s' % str(define.cache.stats()))
+
+			# A different extend, or class, is a different instance
+			o3 = define.Tree.from_file(oFile.name, {"field1":{"__optional__":True}})
+			self.assertTrue(o3 is not o1 and o3['field1'].optional(), 'extend is not correct')
+			self.assertTrue(define.Tree.from_file(oFile.name, {"field1":{"__optional__":True}}) is o3, 'extend instance is not shared')
+			self.assertTrue(define.Parent.from_file(oFile.name) is not o1, 'class is not part of the key')
+
+			# Shared instances are frozen, all the way down
+			self.assertTrue(o1.frozen() and o1['field2'].child().frozen(), 'instance is not frozen')
+			self.assertRaises(RuntimeError, o1['field1'].minmax, 1)
+			self.assertRaises(RuntimeError, o1['field2'].child().regex, 'a')
+			self.assertRaises(RuntimeError, o1['field1'].optional, True)
+			self.assertRaises(RuntimeError, o1.special_set, 'sql', 1)
+			self.assertTrue(o1.valid({"field1":1,"field2":["a"]}), 'frozen instance is not valid')
+
+			# Uncached instances are not frozen, and not shared
+			o4 = define.Tree.from_file(oFile.name, cached=False)
+			self.assertTrue(o4 is not o1 and not o4.frozen(), 'uncached instance is not correct')
+			o4['field1'].minmax(1, None)
+
+			# Trees created from the path share the loaded file, but not the
+			#	instance
+			o5 = define.Tree(oFile.name)
+			o5['field1'].optional(True)
+			self.assertTrue(not define.Tree(oFile.name)['field1'].optional(), 'loaded file was changed')
+
+			# Changing the file creates a new instance
+			with open(oFile.name, 'w') as oF:
+				json.dump({"__name__":"hello","field1":{"__type__":"string"}}, oF)
+			os.utime(oFile.name, ns=(0, 1000000000))
+			o6 = define.Tree.from_file(oFile.name)
+			self.assertTrue(o6 is not o1 and o6['field1'].type() == 'string', 'changed file is not reloaded')
+
+			# Invalidating removes every entry of the file
+			iCount = define.cache.invalidate(oFile.name)
+			self.assertTrue(iCount == 5, 'invalidate is not correct: %d' % iCount)
+			self.assertTrue(define.cache.stats()['size'] == 0, 'entries were not invalidated')
+			self.assertTrue(define.Tree.from_file(oFile.name) is not o6, 'invalidated instance was returned')
+
+			# Shrinking the cache drops the least recently used
+			define.cache.maxsize(0)
+			self.assertTrue(define.cache.stats()['size'] == 0, 'maxsize is not correct')
+
+		finally:
+			define.cache.maxsize(256)
+			define.cache.invalidate()
+			os.unlink(oFile.name)
+
+	def test_Tree_Snapshot(self):
+
+		# Build a Tree, and use it so it has failures stored
+		o	= define.Tree({"__name__":"hello","__sql__":{"table":"hello"},"field1":{"__type__":"price","__minimum__":"0.01","__maximum__":"10.50"},"field2":{"__type__":"string","__regex__":"^[a-z]+$"},"field4":{"__type__":"string","__options__":["abc","def"]},"field3":{"__array__":"unique","__type__":{"field3_1":{"__type__":"uuid"},"field3_2":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"date"}]}}}})
+		o.valid({})
+
+		# Store it, and load it back
+		sDir = tempfile.mkdtemp()
+		sPath = os.path.join(sDir, 'hello.snapshot')
+		try:
+			o.dump_snapshot(sPath)
+			o2 = define.Tree.load_snapshot(sPath)
+
+			# It's a new Tree with the same definition, special values, types
+			#	and patterns
+			self.assertTrue(o2 is not o and o2.to_dict() == o.to_dict(), 'definition is not correct')
+			self.assertTrue(isinstance(o2['field1'].minmax()['minimum'], Decimal), 'Decimal was not preserved')
+			self.assertTrue(o2['field2'].regex().pattern == '^[a-z]+$', 'regex was not preserved')
+			self.assertTrue(o2.special('sql') == {"table":"hello"}, 'special was not preserved')
+			self.assertTrue(o2.validation_failures is None, 'failures were stored')
+
+			# It validates exactly the same
+			for v in [{"field1":"1.00","field2":"abc","field3":[],"field4":"def"}, {"field1":"11.00","field2":"XYZ","field3":[{"field3_1":"x","field3_2":{"a":"b"}}],"field4":"ghi"}]:
+				self.assertTrue(o2.validate(v) == o.validate(v), 'validation is not correct')
+
+			# Snapshots of other classes, other versions, or other files are
+			#	refused
+			define.snapshot.dump(o['field3'], sPath)
+			self.assertRaises(ValueError, define.Tree.load_snapshot, sPath)
+			with open(sPath, 'r+b') as oF:
+				oF.seek(8)
+				oF.write(b'\xff\xff')
+			self.assertRaises(ValueError, define.snapshot.load, sPath)
+			with open(sPath, 'wb') as oF:
+				oF.write(b'{"__name__":"hello"}')
+			self.assertRaises(ValueError, define.snapshot.load, sPath)
+
+			# Snapshots can't reference anything else
+			import pickle, struct, zlib
+			with open(sPath, 'wb') as oF:
+				oF.write(struct.pack('<8sH', b'DEFINE\x00S', define.snapshot.VERSION) + zlib.compress(pickle.dumps(os.getcwd)))
+			self.assertRaises(ValueError, define.snapshot.load, sPath)
+
+		finally:
+			if os.path.exists(sPath):
+				os.unlink(sPath)
+			os.rmdir(sDir)
+
+	def test_Tree_Lazy(self):
+
+		# The definition, with a child Parent and an invalid node
+		dTree = {"__name__":"hello","field1":{"__type__":"uint"},"field2":{"field2_1":{"__type__":"string"},"field2_2":{"__type__":"uuid","__optional__":True}},"field3":{"__array__":"unique","__type__":"int"}}
+		oEager = define.Tree(dTree)
+
+		# Nothing is created, or checked, until it's used
+		o = define.Tree(dict(dTree, field4 = {"__type__":"nope"}), lazy = True)
+		self.assertTrue(o.keys() == ('field1', 'field2', 'field3', 'field4'), 'keys are not correct')
+		self.assertTrue(o['field1'].type() == 'uint', 'node is not correct')
+		self.assertRaises(KeyError, o.child, 'field4')
+		self.assertRaises(KeyError, o.materialize)
+
+		# A lazy Tree is the same as one created right away
+		o = define.Tree(dTree, lazy = True)
+		self.assertTrue(isinstance(o['field2'], define.Parent), 'child Parent is not correct')
+		for v in [{"field1":1,"field2":{"field2_1":"a"},"field3":[1,2]}, {"field1":-1,"field2":{"field2_2":"x"},"field3":[1,1],"field5":0}, {}]:
+			self.assertTrue(define.Tree(dTree, lazy = True).validate(v) == oEager.validate(v), 'validation is not correct')
+		self.assertTrue(o.to_dict() == oEager.to_dict(), 'to_dict is not correct')
+		self.assertTrue(define.Tree(dTree, lazy = True).materialize().to_dict() == oEager.to_dict(), 'materialize is not correct')
+
+		# Nodes created after freezing are frozen as well
+		o = define.Tree(dTree, lazy = True).freeze()
+		self.assertTrue(o['field2'].frozen() and o['field2']['field2_1'].frozen(), 'nodes are not frozen')
+
+	def test_Intern(self):
+
+		# Two Trees with some of the same nodes
+		dTree = {"__name__":"hello","_id":{"__type__":"uuid"},"name":{"__type__":"string","__maximum__":255},"list":{"__array__":"unique","__type__":{"a":"uint"}}}
+		o1 = define.Tree(dTree).freeze()
+		o2 = define.Tree(dict(dTree, __name__ = "world", name = {"__type__":"string","__maximum__":32}))
+
+		# Only frozen instances can be shared
+		self.assertRaises(ValueError, define.intern.instance, o2)
+		o2.freeze()
+
+		# Identical nodes and subtrees are shared, anything else isn't
+		define.intern.clear()
+		define.intern.stats(True)
+		o1 = define.intern.instance(o1)
+		o2 = define.intern.instance(o2)
+		self.assertTrue(o1['_id'] is o2['_id'], 'node was not shared')
+		self.assertTrue(o1['list'] is o2['list'], 'subtree was not shared')
+		self.assertTrue(o1['name'] is not o2['name'], 'different nodes were shared')
+		self.assertTrue(o1 is not o2, 'different Trees were shared')
+		self.assertTrue(define.intern.instance(define.Tree(dTree).freeze()) is o1, 'Tree was not shared')
+
+		# The memory saved is reported
+		dStats = define.intern.stats()
+		self.assertTrue(dStats['shared'] == 10 and dStats['saved'] > 0, 'stats are not correct')
+
+		# Shared Trees work the same
+		self.assertTrue(o2.to_dict() == define.Tree(o2.to_dict()).to_dict(), 'definition is not correct')
+		self.assertTrue(o2.valid({"_id":"x","name":"a","list":[{"a":1}]}) == False, 'validation is not correct')
+		self.assertTrue(define.intern.clear() > 0, 'clear is not correct')
+
+	def test_Slots(self):
+
+		# No instance has a dict of its own
+		o = define.Tree({"__name__":"hello","__sql__":{"table":"hello"},"field1":"uuid","field2":{"__array__":"unique","__type__":{"a":"int"}},"field3":{"__hash__":"string","__type__":[{"__type__":"int"},{"__type__":"md5"}]}})
+		for o2 in [o, o['field1'], o['field2'], o['field2'].child(), o['field3'], o['field3'].child()]:
+			self.assertFalse(hasattr(o2, '__dict__'), '%s has a dict' % o2.class_name())
+
+		# Copies are the same, without the failures of the original
+		o.valid({})
+		o2 = copy.deepcopy(o)
+		self.assertTrue(o2.to_dict() == o.to_dict() and o2.name == 'hello', 'copy is not correct')
+		self.assertTrue(o2.validation_failures is None, 'failures were copied')
+		self.assertTrue(o2.special('sql') == {"table":"hello"} and o2['field1'].special('sql') is None, 'special is not correct')
+
+	def test_Tree_Derive(self):
+
+		# The base definition, and the extend of a tenant
+		dTree = {"__name__":"hello","__sql__":{"table":"hello"},"field1":{"__type__":"string","__regex__":"^[a-z]+$"},"field2":{"field2_1":{"__type__":"int"},"field2_2":{"field2_2_1":{"__type__":"uint","__maximum__":5}}},"field3":"uuid","field5":{"__type__":"int","__options__":["1","2"]},"field6":{"__type__":"price","__options__":["1.00","2.50"]}}
+		dExtend = {"__sql__":{"db":"tenant"},"field2":{"field2_2":{"field2_2_1":{"__maximum__":10}}},"field4":{"__type__":"md5"}}
+		dCopy = copy.deepcopy(dTree)
+
+		# Creating Trees never changes the definition or extend passed
+		define.Tree(dTree)
+		define.Tree(dTree, dExtend)
+		self.assertTrue(dTree == dCopy, 'definition was changed')
+		self.assertTrue(dTree['field5']['__options__'] == ["1","2"] and dTree['field6']['__options__'] == ["1.00","2.50"], 'options were changed')
+
+		# Only frozen Trees can be derived from
+		o = define.Tree(dTree)
+		self.assertRaises(ValueError, o.derive, dExtend)
+		o.freeze()
+
+		# The derived Tree is the same as one created with the extend, sharing
+		#	every node not changed
+		o2 = o.derive(dExtend)
+		self.assertTrue(o2.to_dict() == define.Tree(dTree, dExtend).to_dict(), 'derived Tree is not correct')
+		self.assertTrue(o2.name == 'hello' and o2.special('sql') == {"table":"hello","db":"tenant"}, 'derived Tree is not correct')
+		self.assertTrue(o2['field1'] is o['field1'] and o2['field2']['field2_1'] is o['field2']['field2_1'], 'nodes were not shared')
+		self.assertTrue(o2['field2']['field2_2'] is not o['field2']['field2_2'], 'changed node was shared')
+		self.assertTrue(o.derive({"__name__":"world"}).name == 'world', 'name was not changed')
+
+	def test_Special_Readonly(self):
+
+		# A node with specials
+		o = define.Node({"__type__":"string","__ui__":{"title":"Name","options":["a","b"]},"__sql__":"text"})
+
+		# Read-only views can't be changed, and are the same every time
+		d = o.special('ui', readonly = True)
+		self.assertTrue(d == {"title":"Name","options":("a","b")}, 'view is not correct')
+		self.assertRaises(TypeError, operator.setitem, d, 'title', 'x')
+		self.assertTrue(o.special('ui', readonly = True) is d, 'view was not reused')
+		self.assertTrue(o.special('sql', readonly = True) == 'text', 'view is not correct')
+		self.assertTrue(o.special('nope', 1, readonly = True) == 1, 'default is not correct')
+		self.assertRaises(ValueError, o.special, '@', readonly = True)
+
+		# Copies can still be changed without changing the node
+		d2 = o.special('ui')
+		d2['title'] = 'x'
+		self.assertTrue(o.special('ui')['title'] == 'Name', 'copy is not correct')
+
+		# Setting the value replaces the view
+		o.special_set('ui', {"title":"Other"})
+		self.assertTrue(o.special('ui', readonly = True) == {"title":"Other"}, 'view was not replaced')
+
+	def test_Option_Index(self):
+
+		# Options of several kinds
+		o = define.Options([{"a":{"__type__":"int"}},{"__array__":"unique","__type__":"int"},{"__type__":"uuid"},{"__type__":"bool"},{"__type__":"uint"},{"__type__":"json"}])
+
+		# Only the options a type could be valid for are checked, in order
+		self.assertTrue([oN.class_name() for oN in o._index[dict]] == ['Parent', 'Node'], 'dict options are not correct')
+		self.assertTrue([oN.type() for oN in o._index[int]] == ['bool', 'uint', 'json'], 'int options are not correct')
+		self.assertTrue(len(o._index[str]) == 4, 'str options are not correct')
+
+		# Results are the same as checking every option
+		oC = o.compile()
+		for v, b, m in [(2, True, 2), ({"a":"1"}, True, {"a":1}), ([1,2], True, [1,2]), (1.5, True, '1.5'), ('52cd4b20-ca32-4433-9516-0c8684ec57c2', True, '52cd4b20-ca32-4433-9516-0c8684ec57c2')]:
+			self.assertTrue(o.valid(v) == b and oC.valid(v) == b, 'valid is not correct for %s' % repr(v))
+			if b:
+				self.assertTrue(o.clean(v) == m and oC.clean(v) == m, 'clean is not correct for %s' % repr(v))
+
+		# Clean is generated, not a call back to the Options
+		self.assertTrue('.clean(value, level)' not in oC.source and 'matches no option' in oC.source, 'clean was not generated')
+		o = define.Options([{"__type__":"uint"},{"__type__":"md5"}])
+		self.assertRaises(ValueError, o.compile().clean, 1.5)
+
+	def test_Option_Discriminator(self):
+
+		# Options of Parents discriminated by the kind
+		o = define.Parent({"event":{"__type__":[{"kind":{"__type__":"string","__options__":["click","tap"]},"x":"uint"},{"kind":{"__type__":"string","__options__":["key"]},"code":"string"}],"__discriminator__":"kind"}})
+		oC = o.compile()
+
+		# Values are validated and cleaned with the option of their kind only
+		for v, b, l in [({"event":{"kind":"tap","x":"2"}}, True, []), ({"event":{"kind":"key","x":2}}, False, [['event.code', 'missing'], ['event.x', 'unknown']]), ({"event":{"kind":"drag","x":2}}, False, [['event.kind', 'not in options']]), ({"event":{"x":2}}, False, [['event.kind', 'missing']])]:
+			self.assertTrue(o.valid(v) == b and oC.valid(v) == b, 'valid is not correct for %s' % repr(v))
+			self.assertTrue(o.validation_failures == l and oC.validation_failures == l, 'failures are not correct for %s' % repr(v))
+		self.assertTrue(o.clean({"event":{"kind":"tap","x":"2"}}) == {"event":{"kind":"tap","x":2}}, 'clean is not correct')
+		self.assertTrue(oC.clean({"event":{"kind":"tap","x":"2"}}) == {"event":{"kind":"tap","x":2}}, 'compiled clean is not correct')
+		self.assertTrue('.clean(value, level)' not in oC.source and 'fClean = ' in oC.source, 'compiled clean is not generated')
+		for v, l in [({"event":{"kind":"drag","x":2}}, [['event.kind', 'not in options']]), ({"event":{"x":2}}, [['event.kind', 'missing']])]:
+			for f in [o.clean, oC.clean]:
+				with self.assertRaises(ValueError) as oCtx:
+					f(v)
+				self.assertTrue(oCtx.exception.args[0] == l, 'clean failures are not correct for %s' % repr(v))
+
+		# The definition is the same after being converted back
+		self.assertTrue(define.Parent(o.to_dict()).to_dict() == o.to_dict(), 'to_dict is not correct')
+
+		# The discriminator must be a required string with options in every
+		#	option, with no value in more than one
+		for l in [[{"kind":{"__type__":"string","__options__":["a"]}},{"__type__":"int"}], [{"kind":{"__type__":"string","__options__":["a"]}},{"kind":"string"}], [{"kind":{"__type__":"string","__options__":["a"]}},{"kind":{"__type__":"string","__options__":["a"]}}], [{"kind":{"__type__":"string","__options__":["a"],"__optional__":True}}]]:
+			self.assertRaises(ValueError, define.Options, {"__type__":l,"__discriminator__":"kind"})
+
+	def test_Node_Options_Large(self):
+
+		# A Node with many options, not in any sorted order
+		l = ['code%d' % ((i * 7919) % 5000) for i in range(5000)]
+		oNode = define.Node({'__type__': 'string', '__options__': l})
+		oC = oNode.compile()
+
+		# The options keep their order
+		self.assertTrue(oNode.options() == l, 'options are not in order')
+		self.assertTrue(oNode.to_dict()['__options__'] == l, 'to_dict options are not in order')
+
+		# Every option is valid, and nothing else
+		self.assertTrue(all([oNode.valid(s) and oC.valid(s) for s in l]), 'options are not valid')
+		for v in ['code5000', 'CODE1', 1, None]:
+			self.assertFalse(oNode.valid(v) or oC.valid(v), '%s is valid' % repr(v))
+
+		# Duplicates are still found
+		self.assertRaises(ValueError, define.Node, {'__type__': 'string', '__options__': l + ['code4999']})
+		self.assertRaises(ValueError, define.Node, {'__type__': 'uint', '__options__': [1, '0x1']})
+
+	def test_Validators(self):
+
+		# Valid values of each type, and the characters to change them with
+		dValid = {
+			'date': ['2016-03-05', '2019-12-31', '0000-10-29'],
+			'datetime': ['2016-03-05 23:59:59', '2019-12-31 00:00:00', '2020-10-19 09:30:05'],
+			'ip': ['192.168.0.1', '10.0.0.255', '1.200.249.9', '255.255.255.0'],
+			'md5': ['7b967af699a0a18b1f2bdc9704537a3e', '7B967AF699A0A18B1F2BDC9704537A3E'],
+			'time': ['00:00:00', '23:59:59', '19:09:50'],
+			'tuuid': ['52cd4b20ca32443395160c8684ec57c2', '0ad7b2a43ac111ef9f8a0242ac120002'],
+			'uuid': ['52cd4b20-ca32-4433-9516-0c8684ec57c2', '0ad7b2a4-3ac1-11ef-9f8a-0242ac120002']
+		}
+		lChars = list('0123456789abcdefABCDEFxz-:. \n') + ['\u0663', '\u00b2', '\uff15']
+
+		# Every type with a regex-free function is tested
+		self.assertTrue(sorted(dValid) == sorted(validators.regex_free), 'types are not correct')
+
+		# Generate changed values, and make sure every one of them is accepted
+		#	or refused exactly like the regex does
+		oRandom = random.Random(0)
+		for i in range(20000):
+			for t, l in dValid.items():
+				lValue = list(oRandom.choice(l))
+				for j in range(oRandom.randint(0, 2)):
+					lValue[oRandom.randrange(len(lValue))] = oRandom.choice(lChars)
+				if oRandom.random() < 0.1:
+					lValue.insert(oRandom.randrange(len(lValue) + 1), oRandom.choice(lChars))
+				s = ''.join(lValue)
+				self.assertTrue(bool(validators.regex_free[t](s)) == bool(define.constants.regex[t].match(s)), '%s "%s" does not match the regex' % (t, s))
+
+	def test_Node_Strategies(self):
+
+		# Every type has a function to check, and to clean, its values
+		for t in define.Node._VALID_TYPES:
+			self.assertTrue(t in strategies.VALID and t in strategies.CLEAN, '%s has no functions' % t)
+
+		# Changing the min/max, or the options, changes what's valid
+		oNode = define.Node('uint')
+		self.assertTrue(oNode.valid(50), '50 is not valid')
+		oNode.minmax(1, 10)
+		self.assertFalse(oNode.valid(50), '50 is valid after minmax')
+		oNode.options([50, 60])
+		self.assertTrue(oNode.valid(50) and not oNode.valid(5), 'options are not correct')
+
+		# Copies and snapshots work the same
+		oNode = define.Node({'__type__': 'string', '__options__': ['abc', 'def']})
+		sDir = tempfile.mkdtemp()
+		sPath = os.path.join(sDir, 'node.snapshot')
+		try:
+			define.snapshot.dump(oNode, sPath)
+			for o in [copy.deepcopy(oNode), define.snapshot.load(sPath)]:
+				self.assertTrue(o.valid('abc') and not o.valid('ghi') and o.clean(1) == '1', 'copy is not correct')
+		finally:
+			if os.path.exists(sPath):
+				os.unlink(sPath)
+			os.rmdir(sDir)